@@ -1,132 +1,252 @@
-import requests
+import httpx
 import json
 import time
-import csv
 import os
 import xmltodict # <--- 이 줄을 추가합니다.
+from concurrent.futures import ThreadPoolExecutor
+
+from urllib.parse import urlsplit
+
+import crawl_metrics
+import http_client
+import rate_limiter
+from record_sinks import CsvSink, open_sink
 
 # --- 변수 설정 ---
 BASE_URL = 'https://jumpit-api.saramin.co.kr/api/positions'
-TOTAL_ITEMS = 1404 # <-- 총 아이템 수를 1404로 수정했습니다.
 ITEMS_PER_PAGE = 16
 
-# 총 페이지 수 계산
-total_pages = (TOTAL_ITEMS + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE
+# 💡 총 아이템 수는 첫 페이지 응답의 totalCount에서 읽어옵니다. (없으면 마지막 페이지를 탐색)
+LIST_WORKERS = 8        # 페이지를 동시에 요청할 스레드 수
+LIST_RATE = 10.0        # 처음 초당 페이지 요청 수 (성공하면 올리고 429/503이면 줄임, rate_limiter 참고)
+LIST_BURST = 8          # 한꺼번에 보낼 수 있는 최대 요청 수
+rate_limiter.configure_host(urlsplit(BASE_URL).hostname, rate=LIST_RATE, burst=LIST_BURST)
 
-job_list = []
+# 💡 저장 형식: 'csv' 또는 'parquet' (parquet은 techStacks/locations를 리스트 타입으로 저장)
+OUTPUT_FORMAT = 'csv'
+file_path = f'jumpit_basic_data.{OUTPUT_FORMAT}'
+LIST_COLUMNS = ('techStacks', 'locations')
+DICTIONARY_COLUMNS = ('companyName', 'jobCategory')
+METRICS_PREFIX = 'jumpit_basic_metrics'   # 실행이 끝나면 단계별 지표를 .json/.prom 파일로 저장
 
-print(f"총 {total_pages} 페이지의 기본 데이터를 수집합니다.")
-print("====================================")
 
-# --- 데이터 수집 루프 ---
-for page_num in range(1, total_pages + 1):
+# --- 페이지 요청 및 파싱 ---
+def fetch_page(client, page_num):
+    """
+    목록 API의 한 페이지를 요청하고 JSON 응답을 반환합니다.
+    """
     params = {
         'sort': 'reg_dt',
         'highlight': 'false',
         'page': page_num
     }
-    
-    try:
-        response = requests.get(BASE_URL, params=params)
+
+    with crawl_metrics.timer('jumpit', 'list_page'):
+        response = client.get(BASE_URL, params=params)
         response.raise_for_status()
-        
-        # JSON 구조에 맞게 items 변수 정의
-        data = response.json()
-        
-        # data -> result -> positions 경로로 접근
-        items = data.get('result', {}).get('positions', [])
-
-        if not items:
-            print(f"페이지 {page_num}에 데이터가 없습니다. 중단합니다.")
-            break
-        
-        # API 응답이 단일 객체일 경우 리스트로 변환
-        if isinstance(items, dict):
-            items = [items]
-
-        # 각 공고에서 필요한 모든 기본 정보 추출
+        return response.json()
+
+
+def extract_items(data):
+    # data -> result -> positions 경로로 접근
+    items = data.get('result', {}).get('positions', [])
+
+    # API 응답이 단일 객체일 경우 리스트로 변환
+    if isinstance(items, dict):
+        items = [items]
+    return items or []
+
+
+# parse_position이 만드는 레코드의 필드 순서
+COLUMNS = ['id', 'companyName', 'title', 'jobCategory', 'techStacks', 'minCareer', 'maxCareer', 'locations', 'closedAt']
+
+
+def parse_position(item):
+    """
+    공고 하나에서 필요한 모든 기본 정보를 추출합니다.
+    """
+    # techStacks와 locations 데이터 추출 및 정제
+    tech_stacks_data = item.get('techStacks', {})
+    locations_data = item.get('locations', {})
+
+    # 'techStacks'와 'locations'의 실제 리스트 추출
+    # 만약 단일 문자열이라면 리스트로 변환
+    tech_stacks = tech_stacks_data.get('techStacks', []) if isinstance(tech_stacks_data, dict) else [tech_stacks_data]
+    locations = locations_data.get('locations', []) if isinstance(locations_data, dict) else [locations_data]
+
+    # 리스트가 아닐 경우 빈 리스트로 초기화 (추가 안정성)
+    if not isinstance(tech_stacks, list):
+        tech_stacks = []
+    if not isinstance(locations, list):
+        locations = []
+
+    return {
+        'id': item.get('id'),
+        'companyName': item.get('companyName'),
+        'title': item.get('title'),
+        'jobCategory': item.get('jobCategory'),
+        'techStacks': tech_stacks,
+        'minCareer': item.get('minCareer'),
+        'maxCareer': item.get('maxCareer'),
+        'locations': locations,
+        'closedAt': item.get('closedAt')
+    }
+
+
+# --- 총 페이지 수 확인 ---
+def probe_last_page(client):
+    """
+    빈 페이지가 나올 때까지 페이지 번호를 두 배씩 늘린 뒤, 이진 탐색으로 마지막 페이지를 찾습니다.
+    """
+    def has_items(page_num):
+        return bool(extract_items(fetch_page(client, page_num)))
+
+    if not has_items(1):
+        return 0
+
+    low, high = 1, 2
+    while has_items(high):
+        low, high = high, high * 2
+
+    # low 페이지에는 데이터가 있고 high 페이지는 비어 있음
+    while high - low > 1:
+        mid = (low + high) // 2
+        if has_items(mid):
+            low = mid
+        else:
+            high = mid
+    return low
+
+
+def discover_total_pages(client, first_page_data):
+    result = first_page_data.get('result', {})
+    total_items = result.get('totalCount') if isinstance(result, dict) else None
+
+    if isinstance(total_items, int):
+        print(f"첫 페이지 응답에서 총 아이템 수 {total_items}개를 확인했습니다.")
+        return (total_items + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE
+
+    print("응답에 총 아이템 수가 없어 마지막 페이지를 탐색합니다.")
+    return probe_last_page(client)
+
+
+# --- 데이터 수집 ---
+def iter_positions(client):
+    """
+    첫 페이지로 총 페이지 수를 확인한 뒤 나머지 페이지를 동시에 요청하고, 공고를 페이지 순서대로 하나씩 내보냅니다.
+    수집 도중 새 공고가 등록되어 페이지 경계가 밀리면 같은 공고가 두 번 나올 수 있으므로 ID로 중복을 제거합니다.
+    """
+    seen_ids = set()
+
+    def new_items(page_num, items):
+        jobs = []
         for item in items:
-            
-            # techStacks와 locations 데이터 추출 및 정제
-            tech_stacks_data = item.get('techStacks', {})
-            locations_data = item.get('locations', {})
-            
-            # 'techStacks'와 'locations'의 실제 리스트 추출
-            # 만약 단일 문자열이라면 리스트로 변환
-            tech_stacks = tech_stacks_data.get('techStacks', []) if isinstance(tech_stacks_data, dict) else [tech_stacks_data]
-            locations = locations_data.get('locations', []) if isinstance(locations_data, dict) else [locations_data]
-            
-            # 리스트가 아닐 경우 빈 리스트로 초기화 (추가 안정성)
-            if not isinstance(tech_stacks, list):
-                tech_stacks = []
-            if not isinstance(locations, list):
-                locations = []
-
-            job_list.append({
-                'id': item.get('id'),
-                'companyName': item.get('companyName'),
-                'title': item.get('title'),
-                'jobCategory': item.get('jobCategory'),
-                'techStacks': tech_stacks,
-                'minCareer': item.get('minCareer'),
-                'maxCareer': item.get('maxCareer'),
-                'locations': locations,
-                'closedAt': item.get('closedAt')
-            })
-            
-            # 진행 상황 출력
-            print(f"페이지 {page_num}/{total_pages} - ID: {item.get('id')}, techStacks: {item.get('techStacks')} 데이터 추가 완료.")
-            
-        time.sleep(0.5)
-        
-    except requests.exceptions.RequestException as e:
-        print(f"API 요청 중 오류가 발생했습니다: {e}")
-        break
-    except json.JSONDecodeError as e:
-        print(f"JSON 파싱 오류: {e}")
-        print("API 응답 내용:")
-        print(response.text)
-        break
-        
-print("====================================")
-print(f"총 {len(job_list)}개의 공고 기본 데이터를 성공적으로 수집했습니다.")
-
-# --- 수집한 데이터를 CSV 파일로 저장 ---
-file_path = 'jumpit_basic_data.csv'
-
-if not job_list:
-    print("수집된 데이터가 없어 파일을 저장할 수 없습니다.")
-else:
-    # CSV 헤더(필드명) 정의
-    csv_header = list(job_list[0].keys())
-
-    # 'techStacks'와 'locations'를 문자열로 변환
-    for item in job_list:
-        # techStacks 처리
-        tech_stacks_list = item.get('techStacks', [])
-        # 리스트에 문자열이 아닌 항목이 있을 수 있으므로 모두 문자열로 변환
-        cleaned_tech_stacks = [str(ts) for ts in tech_stacks_list if ts is not None]
-        item['techStacks'] = ', '.join(cleaned_tech_stacks)
-        
-        # locations 처리
-        locations_list = item.get('locations', [])
-        # 리스트에 문자열이 아닌 항목이 있을 수 있으므로 모두 문자열로 변환
-        cleaned_locations = [str(loc) for loc in locations_list if loc is not None]
-        item['locations'] = ', '.join(cleaned_locations)
+            job = parse_position(item)
+            if job['id'] in seen_ids:
+                continue
+            seen_ids.add(job['id'])
+            jobs.append(job)
+        print(f"페이지 {page_num} - {len(jobs)}개 데이터 추가 완료. (중복 {len(items) - len(jobs)}개 제외)")
+        return jobs
+
+    def fetch_page_items(page_num):
+        try:
+            return extract_items(fetch_page(client, page_num))
+        except httpx.HTTPError as e:
+            print(f"페이지 {page_num} API 요청 중 오류가 발생했습니다: {e}")
+        except json.JSONDecodeError as e:
+            print(f"페이지 {page_num} JSON 파싱 오류: {e}")
+        return []
+
+    try:
+        first_page_data = fetch_page(client, 1)
+    except (httpx.HTTPError, json.JSONDecodeError) as e:
+        print(f"첫 페이지 요청 중 오류가 발생했습니다: {e}")
+        return
+
+    total_pages = discover_total_pages(client, first_page_data)
+    print(f"총 {total_pages} 페이지의 기본 데이터를 수집합니다.")
+    print("====================================")
+
+    yield from new_items(1, extract_items(first_page_data))
+
+    # 수집 중 밀려난 공고까지 받기 위해 마지막 페이지 다음 페이지도 한 번 요청합니다.
+    remaining_pages = range(2, total_pages + 2)
+    with ThreadPoolExecutor(max_workers=LIST_WORKERS) as executor:
+        # executor.map은 페이지 순서대로 결과를 돌려주므로 목록 순서가 유지됩니다.
+        for page_num, items in zip(remaining_pages, executor.map(fetch_page_items, remaining_pages)):
+            if items:
+                yield from new_items(page_num, items)
+
+
+def crawl_positions(client):
+    """
+    모든 페이지의 공고를 리스트로 수집합니다.
+    """
+    return list(iter_positions(client))
+
+
+# --- 수집한 데이터를 파일로 저장 ---
+def save_records(records, file_path, sink=None):
+    """
+    공고를 받는 대로 파일에 기록합니다. 전체 목록을 메모리에 모으지 않고, 싱크의 버퍼만큼만 들고 있다가 씁니다.
+    techStacks/locations 리스트는 싱크가 쉼표 문자열로 합치며 원래 레코드는 바꾸지 않습니다.
+
+    Args:
+        records (iterable): 공고 레코드. iter_positions()처럼 수집 중인 제너레이터를 그대로 넘겨도 됩니다.
+        file_path (str): 저장할 파일 경로 (.csv 또는 .parquet).
+        sink: 이미 열린 싱크. 지정하지 않으면 file_path로 새로 엽니다.
+
+    Returns:
+        int: 저장한 공고 수.
+    """
+    count = 0
+    with sink or open_sink(file_path, COLUMNS, LIST_COLUMNS, DICTIONARY_COLUMNS) as sink:
+        for record in records:
+            with crawl_metrics.timer('jumpit', 'write'):
+                sink.write(record)
+            count += 1
+    return count
+
+
+def save_to_csv(job_list, file_path):
+    if not job_list:
+        print("수집된 데이터가 없어 파일을 저장할 수 없습니다.")
+        return
 
     try:
-        with open(file_path, 'w', encoding='utf-8-sig', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=csv_header)
-            
-            # 헤더(필드명)를 CSV 파일에 작성
-            writer.writeheader()
-            
-            # 모든 데이터를 CSV 파일에 작성
-            writer.writerows(job_list)
-        
+        save_records(job_list, file_path, CsvSink(file_path, COLUMNS, LIST_COLUMNS))
         print(f"데이터를 '{file_path}' 파일에 성공적으로 저장했습니다.")
         file_size = os.path.getsize(file_path)
         print(f"파일 크기: {file_size / 1024:.2f} KB")
 
     except IOError as e:
-        print(f"CSV 파일 저장 중 오류가 발생했습니다: {e}")
\ No newline at end of file
+        print(f"CSV 파일 저장 중 오류가 발생했습니다: {e}")
+
+
+if __name__ == '__main__':
+    # 모든 페이지 요청이 하나의 커넥션 풀을 공유합니다.
+    client = http_client.get_client()
+    stop_metrics_dump = crawl_metrics.registry.start_periodic_dump(METRICS_PREFIX, crawl_metrics.DUMP_INTERVAL)
+
+    # 💡 수집한 공고는 바로 파일에 기록하므로 공고 수와 관계없이 메모리 사용량이 일정하고,
+    # 중간에 멈춰도 그때까지 수집한 공고는 파일에 남습니다.
+    start_time = time.perf_counter()
+    try:
+        total = save_records(iter_positions(client), file_path)
+    except IOError as e:
+        print(f"파일 저장 중 오류가 발생했습니다: {e}")
+        total = 0
+    elapsed = time.perf_counter() - start_time
+
+    print("====================================")
+    if total:
+        print(f"총 {total}개의 공고 기본 데이터를 '{file_path}' 파일에 저장했습니다. (소요 시간: {elapsed:.1f}초)")
+        print(f"파일 크기: {os.path.getsize(file_path) / 1024:.2f} KB")
+    else:
+        print("수집된 데이터가 없습니다.")
+    print(http_client.stats.summary())
+
+    stop_metrics_dump.set()
+    print(crawl_metrics.registry.summary())
+    print(f"단계별 지표를 저장했습니다: {', '.join(crawl_metrics.registry.dump(METRICS_PREFIX))}")
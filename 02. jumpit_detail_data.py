@@ -1,155 +1,497 @@
-import requests
+import asyncio
+import httpx
 import pandas as pd
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 import time
 import os
-import csv
+import threading
+import re
+from urllib.parse import urlsplit
 
-# --- 1단계: API로 수집한 기본 데이터 불러오기 ---
+import crawl_metrics
+import http_cache
+import http_client
+import rate_limiter
+from html_parser import parse_html
+from crawl_state import CrawlStateStore
+from record_sinks import CsvSink, open_sink
+from script_loader import load_script
+
+# --- 변수 설정 ---
 input_file = 'jumpit_basic_data.csv'
-output_file = 'jumpit_full_data.csv'
+# 💡 저장 형식: 'csv' 또는 'parquet' (parquet은 리스트 필드를 리스트 타입으로 저장)
+OUTPUT_FORMAT = 'csv'
+output_file = f'jumpit_full_data.{OUTPUT_FORMAT}'
+LIST_COLUMNS = ('techStacks', 'locations')
+DICTIONARY_COLUMNS = ('companyName', 'jobCategory', '경력', '학력', '근무지역')
+METRICS_PREFIX = 'jumpit_detail_metrics'   # 실행이 끝나면 단계별 지표를 .json/.prom 파일로 저장
+
+# 웹 스크래핑할 기본 URL
+BASE_URL = "https://jumpit.saramin.co.kr/position/"
+
+# 💡 수집 방식: 'async'는 여러 상세 페이지를 동시에 요청하고, 'sync'는 기존처럼 하나씩 요청합니다.
+FETCH_MODE = 'async'
+MAX_CONCURRENCY = 16          # 전체 동시 요청 수 상한
+PER_HOST_CONCURRENCY = 4      # 같은 호스트에 대한 동시 요청 수 상한
+DETAIL_RATE = 10.0            # 처음 초당 상세 요청 수 (성공하면 올리고 429/503이면 줄임, rate_limiter 참고)
+rate_limiter.configure_host(urlsplit(BASE_URL).hostname, rate=DETAIL_RATE, burst=PER_HOST_CONCURRENCY)
+
+# 💡 파싱 방식: 'partial'은 필요한 세 영역(div.position_info, 경력/학력 dl 블록, 기업 소개)만 트리로 만들고
+# 나머지 문서는 버립니다. 'full'은 기존처럼 문서 전체를 파싱합니다.
+PARSE_MODE = 'partial'
+
+# 상세 페이지에서 실제로 사용하는 영역만 남기는 필터
+# (파싱 도중에는 class 속성이 나뉘기 전의 문자열과 비교하므로 단어 경계를 정규식으로 처리)
+DETAIL_SECTIONS = SoupStrainer('div', class_=re.compile(r'(?:^|\s)(?:position_info|ehVsnD|dlAoCI)(?:\s|$)'))
+
+# 💡 증분 수집: 신규 공고와 목록 레코드가 바뀐 공고만 상세 페이지를 요청합니다.
+INCREMENTAL = True
+
+# 💡 파이프라인 모드: 01의 목록 수집과 상세 수집을 동시에 진행합니다. (jumpit_basic_data.csv를 기다리지 않음)
+# 목록에서 나온 공고는 크기가 제한된 큐를 거쳐 상세 수집 작업자에게 전달되고, 결과는 바로 출력 파일에 기록됩니다.
+PIPELINE_MODE = False
+PIPELINE_QUEUE_SIZE = 64      # 목록 → 상세 큐 크기 (가득 차면 목록 수집이 잠시 멈춤)
+PIPELINE_PUT_TIMEOUT = 1.0    # 큐가 가득 차 기다리는 동안 중단 여부를 확인하는 간격(초)
+BASIC_SIDE_OUTPUT = True      # 파이프라인 모드에서도 기본 데이터 CSV(input_file)를 함께 저장
+
+# 💡 기본 데이터는 BATCH_SIZE개씩 읽어 상세 수집 후 바로 출력 파일에 기록합니다. (전체 목록을 메모리에 두지 않음)
+BATCH_SIZE = 500
+
+# parse_detail_page가 항상 만드는 필드
+DETAIL_FIELDS = ['주요업무', '자격요건', '우대사항', '복지 및 혜택', '채용절차 및 기타 지원 유의사항',
+                 '경력_상세', '학력', '마감일_상세', '근무지역_상세', '기업/서비스 소개']
+# 상세 페이지에서 추가되는 필드 전체 (스트리밍 출력 파일의 헤더로 사용)
+# 경력/마감일/근무지역은 페이지에 해당 항목이 있을 때만 채워지며, 기존 CSV와 같이 맨 뒤에 둠
+DETAIL_COLUMNS = DETAIL_FIELDS + ['경력', '마감일', '근무지역']
+
+
+# --- 1단계: API로 수집한 기본 데이터 불러오기 ---
+def iter_basic_data(input_file, batch_size=BATCH_SIZE):
+    """
+    기본 데이터 파일을 batch_size개씩 나눠 읽습니다. 파일 전체를 한 번에 메모리에 올리지 않습니다.
+
+    Yields:
+        list: 기본 데이터 딕셔너리 목록 (최대 batch_size개).
+    """
+    if not os.path.exists(input_file):
+        print(f"오류: {input_file} 파일이 존재하지 않습니다. API 수집을 먼저 진행해 주세요.")
+        return
 
-if not os.path.exists(input_file):
-    print(f"오류: {input_file} 파일이 존재하지 않습니다. API 수집을 먼저 진행해 주세요.")
-else:
     try:
-        df = pd.read_csv(input_file)
-        job_list = df.to_dict('records')
-        print(f"'{input_file}' 파일에서 총 {len(job_list)}개의 기본 데이터를 불러왔습니다.")
+        if input_file.endswith('.parquet'):
+            import pyarrow.parquet as pq
+
+            # 리스트 컬럼은 to_pylist()에서 파이썬 리스트로 바뀜
+            batches = (batch.to_pylist() for batch in pq.ParquetFile(input_file).iter_batches(batch_size=batch_size))
+        else:
+            batches = (chunk.to_dict('records') for chunk in pd.read_csv(input_file, chunksize=batch_size))
+        yield from batches
     except Exception as e:
         print(f"파일을 읽는 중 오류가 발생했습니다: {e}")
-        job_list = []
 
-# --- 2단계: 상세 페이지 크롤링 루프 ---
-print("\n상세 페이지 크롤링을 시작합니다.")
-print("====================================")
 
-# 필요한 데이터가 담길 새로운 리스트
-final_job_data = []
+# --- 상세 페이지 HTML에서 원하는 데이터 추출 ---
+def parse_detail_page(html, backend=None, parse_mode=None):
+    """
+    상세 페이지 HTML에서 포지션 정보, 경력/학력 정보, 기업 소개를 추출합니다.
 
-# 웹 스크래핑할 기본 URL
-BASE_URL = "https://jumpit.saramin.co.kr/position/"
+    Args:
+        html (str): 상세 페이지 HTML.
+        backend (str): HTML 파서 백엔드 (없으면 html_parser.DEFAULT_BACKEND).
+        parse_mode (str): 'partial' 또는 'full' (없으면 PARSE_MODE).
 
-for job in job_list:
-    position_id = job.get('id')
-    if not position_id:
-        continue # ID가 없으면 건너뛰기
-    
-    detail_url = f"{BASE_URL}{position_id}"
-    
-    # 상세 페이지에서 추출한 데이터를 임시로 담을 딕셔너리
+    Returns:
+        dict: 추출된 상세 정보.
+    """
     # URL 하나를 처리할 때마다 detailed_info 딕셔너리를 새로 생성 (초기화)
-    detailed_info = {
-        "주요업무": None,
-        "자격요건": None,
-        "우대사항": None,
-        "복지 및 혜택": None,
-        "채용절차 및 기타 지원 유의사항": None,
-        "경력_상세": None,
-        "학력": None,
-        "마감일_상세": None,
-        "근무지역_상세": None,
-        "기업/서비스 소개": None,
-    }
+    detailed_info = dict.fromkeys(DETAIL_FIELDS)
+
+    parse_only = DETAIL_SECTIONS if (parse_mode or PARSE_MODE) == 'partial' else None
+    soup = parse_html(html, backend, parse_only=parse_only)
+
+    # 1. 포지션 상세 정보 섹션 (class='position_info')
+    position_info_section = soup.find('div', class_='position_info')
+
+    if position_info_section:
+        for dl_tag in position_info_section.find_all('dl'):
+            dt_tag = dl_tag.find('dt')
+            dd_tag = dl_tag.find('dd')
+
+            if dt_tag and dd_tag:
+                pre_tag = dd_tag.find('pre')
+                section_title = dt_tag.get_text(strip=True)
+                section_content = pre_tag.get_text(strip=True) if pre_tag else dd_tag.get_text(strip=True)
+
+                # 제목을 딕셔너리의 키로 사용하여 데이터 저장
+                if "주요업무" in section_title:
+                    detailed_info["주요업무"] = section_content
+                elif "자격요건" in section_title:
+                    detailed_info["자격요건"] = section_content
+                elif "우대사항" in section_title:
+                    detailed_info["우대사항"] = section_content
+                elif "복지 및 혜택" in section_title:
+                    detailed_info["복지 및 혜택"] = section_content
+                elif "채용절차 및 기타 지원 유의사항" in section_title:
+                    detailed_info["채용절차 및 기타 지원 유의사항"] = section_content
+
+    # 2. 포지션 경력/학력/마감일/근무지역 정보 섹션 (class='sc-b12ae455-0 ehVsnD')
+    job_details_section = soup.find('div', class_='sc-b12ae455-0 ehVsnD')
+
+    if job_details_section:
+        for dl in job_details_section.find_all('dl'):
+            dt_tag = dl.find('dt')
+            dd_tag = dl.find('dd')
+
+            if dt_tag and dd_tag:
+                title = dt_tag.get_text(strip=True)
+                value = dd_tag.get_text(strip=True)
+
+                # 제목을 딕셔너리의 키로 사용하여 데이터 저장
+                if "경력" in title:
+                    detailed_info["경력"] = value
+                elif "학력" in title:
+                    detailed_info["학력"] = value
+                elif "마감일" in title:
+                    detailed_info["마감일"] = value
+                elif "근무지역" in title:
+                    detailed_info["근무지역"] = value
+
+    # 3. 기업/서비스 소개 섹션 (class='sc-3ef60426-3 dlAoCI')
+    # CSS 선택자 사용: .sc-3ef60426-3.dlAoCI 클래스를 가진 div 안에 있는 pre 태그를 찾음
+    company_intro = None
+    company_intro_pre = soup.select_one('div.sc-3ef60426-3.dlAoCI pre')
+
+    if company_intro_pre:
+        company_intro = company_intro_pre.get_text(strip=True)
+
+    detailed_info["기업/서비스 소개"] = company_intro
+
+    return detailed_info
+
+
+# --- 2단계 (sync): 상세 페이지를 하나씩 크롤링 ---
+def fetch_detail_sync(client, position_id):
+    """
+    상세 페이지 하나를 요청해 상세 정보를 반환합니다. 실패하면 None을 반환합니다.
+    """
+    detail_url = f"{BASE_URL}{position_id}"
 
     try:
         print(f"ID {position_id}의 상세 페이지 스크래핑 중...")
 
         # 웹 페이지에 요청 보내기
-        response = requests.get(detail_url)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-
-
-        # --- HTML에서 원하는 데이터 추출 ---
-        # 1. 포지션 상세 정보 섹션 (class='position_info')
-        position_info_section = soup.find('div', class_='position_info')
-        
-        if position_info_section:
-            for dl_tag in position_info_section.find_all('dl'):
-                dt_tag = dl_tag.find('dt')
-                dd_tag = dl_tag.find('dd')
-                
-                if dt_tag and dd_tag:
-                    pre_tag = dd_tag.find('pre')
-                    section_title = dt_tag.get_text(strip=True)
-                    section_content = pre_tag.get_text(strip=True) if pre_tag else dd_tag.get_text(strip=True)
-
-                    # 제목을 딕셔너리의 키로 사용하여 데이터 저장
-                    if "주요업무" in section_title:
-                        detailed_info["주요업무"] = section_content
-                    elif "자격요건" in section_title:
-                        detailed_info["자격요건"] = section_content
-                    elif "우대사항" in section_title:
-                        detailed_info["우대사항"] = section_content
-                    elif "복지 및 혜택" in section_title:
-                        detailed_info["복지 및 혜택"] = section_content
-                    elif "채용절차 및 기타 지원 유의사항" in section_title:
-                        detailed_info["채용절차 및 기타 지원 유의사항"] = section_content
-
-        # 2. 포지션 경력/학력/마감일/근무지역 정보 섹션 (class='sc-b12ae455-0 ehVsnD')
-        job_details_section = soup.find('div', class_='sc-b12ae455-0 ehVsnD')
-
-        if job_details_section:
-            for dl in job_details_section.find_all('dl'):
-                dt_tag = dl.find('dt')
-                dd_tag = dl.find('dd')
-                
-                if dt_tag and dd_tag:
-                    title = dt_tag.get_text(strip=True)
-                    value = dd_tag.get_text(strip=True)
-                    
-                    # 제목을 딕셔너리의 키로 사용하여 데이터 저장
-                    if "경력" in title:
-                        detailed_info["경력"] = value
-                    elif "학력" in title:
-                        detailed_info["학력"] = value
-                    elif "마감일" in title:
-                        detailed_info["마감일"] = value
-                    elif "근무지역" in title:
-                        detailed_info["근무지역"] = value
-
-        # 3. 기업/서비스 소개 섹션 (class='sc-3ef60426-3 dlAoCI')
-
-        # CSS 선택자 사용: .sc-3ef60426-3.dlAoCI 클래스를 가진 div 안에 있는 pre 태그를 찾음
-        company_intro_pre = soup.select_one('div.sc-3ef60426-3.dlAoCI pre')
-
-        if company_intro_pre:
-            company_intro = company_intro_pre.get_text(strip=True)
-        
-        detailed_info["기업/서비스 소개"] = company_intro
-
-        # API 데이터와 웹 스크래핑 데이터를 결합
-        # job 딕셔너리에 상세 정보를 추가
-        job.update(detailed_info)
-        final_job_data.append(job)
-        
+        with crawl_metrics.timer('jumpit', 'detail_fetch'):
+            response = http_cache.cached_get(client, detail_url)
+            response.raise_for_status()
+
+        with crawl_metrics.timer('jumpit', 'parse'):
+            detailed_info = parse_detail_page(response.text)
         print(f"ID {position_id} 상세 내용 추출 완료.")
-        time.sleep(0.5)
+        return detailed_info
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"ID {position_id} 상세 페이지 요청 중 오류가 발생했습니다: {e}")
-        continue
     except Exception as e:
         print(f"ID {position_id} 데이터 파싱 중 오류가 발생했습니다: {e}")
-        continue
+    return None
+
+
+def fetch_details_sync(job_list):
+    """
+    상세 페이지를 하나씩 요청합니다. job_list와 같은 순서로 상세 정보 목록을 반환합니다.
+    """
+    client = http_client.get_client()
+    details = []
+
+    for job in job_list:
+        position_id = job.get('id')
+        if not position_id:
+            details.append(None) # ID가 없으면 건너뛰기
+            continue
+
+        details.append(fetch_detail_sync(client, position_id))
+
+    return details
 
-print("====================================")
-print(f"총 {len(final_job_data)}개의 공고에 대한 상세 정보 수집을 완료했습니다.")
 
-# --- 3단계: 최종 데이터를 CSV 파일로 저장 ---
-if final_job_data:
+# --- 2단계 (async): 상세 페이지를 동시에 크롤링 ---
+async def fetch_detail_async(client, position_id, global_limit, host_budgets):
+    """
+    상세 페이지 하나를 요청해 상세 정보를 반환합니다. 실패하면 None을 반환합니다.
+    """
+    detail_url = f"{BASE_URL}{position_id}"
+
+    host = urlsplit(detail_url).netloc
+    if host not in host_budgets:
+        # 요청 간격은 http_client의 호스트별 속도 제한기가 맡고, 여기서는 동시 요청 수만 제한
+        host_budgets[host] = asyncio.Semaphore(PER_HOST_CONCURRENCY)
+
     try:
-        # 데이터프레임으로 변환하여 CSV 저장
-        final_df = pd.DataFrame(final_job_data)
-        
-        # techStacks와 locations 리스트를 문자열로 변환 (다시 한 번)
-        # final_df['techStacks'] = final_df['techStacks'].apply(lambda x: ', '.join(x) if isinstance(x, list) else x)
-        # final_df['locations'] = final_df['locations'].apply(lambda x: ', '.join(x) if isinstance(x, list) else x)
-        
-        final_df.to_csv(output_file, index=False, encoding='utf-8-sig')
-        print(f"최종 데이터를 '{output_file}' 파일에 성공적으로 저장했습니다.")
+        async with global_limit, host_budgets[host]:
+            with crawl_metrics.timer('jumpit', 'detail_fetch'):
+                response = await http_cache.cached_aget(client, detail_url)
+                response.raise_for_status()
+
+        with crawl_metrics.timer('jumpit', 'parse'):
+            detailed_info = parse_detail_page(response.text)
+
+    except httpx.HTTPError as e:
+        print(f"ID {position_id} 상세 페이지 요청 중 오류가 발생했습니다: {e}")
+        return None
     except Exception as e:
-        print(f"최종 데이터 저장 중 오류가 발생했습니다: {e}")
\ No newline at end of file
+        print(f"ID {position_id} 데이터 파싱 중 오류가 발생했습니다: {e}")
+        return None
+
+    print(f"ID {position_id} 상세 내용 추출 완료.")
+    return detailed_info
+
+
+async def fetch_details_async(job_list):
+    """
+    상세 페이지를 동시에 요청합니다. job_list와 같은 순서로 상세 정보 목록을 반환합니다.
+    """
+    global_limit = asyncio.Semaphore(MAX_CONCURRENCY)
+    host_budgets = {}
+    limits = httpx.Limits(max_connections=MAX_CONCURRENCY, max_keepalive_connections=MAX_CONCURRENCY)
+
+    async def skip():
+        return None # ID가 없으면 건너뛰기
+
+    async with http_client.create_async_client(limits=limits) as client:
+        tasks = [
+            fetch_detail_async(client, job['id'], global_limit, host_budgets) if job.get('id') else skip()
+            for job in job_list
+        ]
+        return await asyncio.gather(*tasks)
+
+
+# --- 파이프라인 모드: 목록 수집과 상세 수집을 동시에 진행 ---
+def output_columns(basic):
+    """
+    출력 파일의 헤더. 01의 기본 데이터 필드 뒤에 상세 필드를 붙입니다. (파이프라인/일괄 처리 공통)
+    """
+    return basic.COLUMNS + DETAIL_COLUMNS
+
+
+def merge_detail(job, detailed_info):
+    """
+    상세 정보를 기본 데이터에 합칩니다. 헤더에 없는 필드는 출력 파일에서 조용히 빠지므로 먼저 확인합니다.
+
+    Raises:
+        ValueError: parse_detail_page가 DETAIL_COLUMNS에 없는 필드를 만든 경우.
+    """
+    unknown = set(detailed_info) - set(DETAIL_COLUMNS)
+    if unknown:
+        raise ValueError(f"출력 헤더(DETAIL_COLUMNS)에 없는 상세 필드입니다: {sorted(unknown)}")
+    job.update(detailed_info)
+
+
+def open_output_sink(output_file, fieldnames):
+    return open_sink(output_file, fieldnames, LIST_COLUMNS, DICTIONARY_COLUMNS)
+
+
+async def run_pipeline(output_file, basic_file=None):
+    """
+    01의 목록 수집(스레드)이 공고를 큐에 넣는 동안, 상세 작업자(코루틴)가 큐에서 꺼내 상세 페이지를 수집합니다.
+    합쳐진 레코드는 목록 순서대로 바로 출력 파일에 기록됩니다.
+
+    Args:
+        output_file (str): 최종 데이터를 저장할 파일.
+        basic_file (str): 지정하면 기본 데이터도 함께 CSV로 저장합니다.
+
+    Returns:
+        dict: 목록/상세/저장 건수.
+    """
+    basic = load_script('01. jumpit_basic_data.py')
+    loop = asyncio.get_running_loop()
+    jobs = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    counts = {'listed': 0, 'fetched': 0, 'carried': 0, 'saved': 0}
+    stop = threading.Event()   # 상세 작업자가 실패하면 설정되어 목록 스레드를 멈춤
+
+    def put(entry):
+        # 큐가 가득 차 있으면 기다리되, 주기적으로 stop을 확인해 아무도 큐를 읽지 않는 상태로 멈춰 있지 않도록 함
+        while not stop.is_set():
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    asyncio.wait_for(jobs.put(entry), PIPELINE_PUT_TIMEOUT), loop).result()
+                return True
+            except asyncio.TimeoutError:
+                continue
+        return False
+
+    def produce():
+        # 목록 수집은 동기 코드이므로 별도 스레드에서 실행하고, 큐가 가득 차면 여기서 기다림
+        side_output = CsvSink(basic_file, basic.COLUMNS, LIST_COLUMNS) if basic_file else None
+        try:
+            for seq, job in enumerate(basic.iter_positions(http_client.get_client())):
+                if side_output:
+                    side_output.write(job)
+                if not put((seq, job)):
+                    break
+                counts['listed'] += 1
+        finally:
+            if side_output:
+                side_output.close()
+            put(None)
+
+    # 상세 작업자는 완료 순서가 제각각이므로, 목록 순서대로 내보내기 위해 잠시 모아 둠
+    ready = {}
+    next_seq = 0
+
+    def emit(seq, record):
+        nonlocal next_seq
+        ready[seq] = record
+        while next_seq in ready:
+            record = ready.pop(next_seq)
+            if record is not None:
+                with crawl_metrics.timer('jumpit', 'write'):
+                    sink.write(record)
+                counts['saved'] += 1
+            next_seq += 1
+
+    async def work(client):
+        while True:
+            entry = await jobs.get()
+            if entry is None:
+                await jobs.put(None)   # 다른 작업자도 종료하도록 다시 넣음
+                return
+            seq, job = entry
+
+            if store:
+                _, carried = store.plan('jumpit', [job], closed_key='closedAt')
+                if carried:
+                    counts['carried'] += 1
+                    emit(seq, job)
+                    continue
+
+            detailed_info = None
+            if job.get('id'):
+                detailed_info = await fetch_detail_async(client, job['id'], global_limit, host_budgets)
+            if detailed_info is not None:
+                merge_detail(job, detailed_info)
+                counts['fetched'] += 1
+                if store:
+                    store.save_detail('jumpit', job['id'], detailed_info)
+            emit(seq, job if detailed_info is not None else None)
+
+    global_limit = asyncio.Semaphore(MAX_CONCURRENCY)
+    host_budgets = {}
+    limits = httpx.Limits(max_connections=MAX_CONCURRENCY, max_keepalive_connections=MAX_CONCURRENCY)
+    store = CrawlStateStore() if INCREMENTAL else None
+    sink = open_output_sink(output_file, output_columns(basic))
+
+    try:
+        async with http_client.create_async_client(limits=limits) as client:
+            producer = loop.run_in_executor(None, produce)
+            workers = [asyncio.create_task(work(client)) for _ in range(MAX_CONCURRENCY)]
+            try:
+                await asyncio.gather(producer, *workers)
+            except BaseException:
+                # 하나라도 실패하면 나머지 작업자를 취소하고 목록 스레드가 끝날 때까지 기다린 뒤 예외를 그대로 올림
+                stop.set()
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(producer, *workers, return_exceptions=True)
+                raise
+    finally:
+        sink.close()
+        if store:
+            store.close()
+
+    return counts
+
+
+def report_metrics():
+    print(crawl_metrics.registry.summary())
+    print(f"단계별 지표를 저장했습니다: {', '.join(crawl_metrics.registry.dump(METRICS_PREFIX))}")
+
+
+def main_pipeline():
+    print("\n목록 수집과 상세 페이지 크롤링을 동시에 시작합니다.")
+    print("====================================")
+
+    stop_metrics_dump = crawl_metrics.registry.start_periodic_dump(METRICS_PREFIX, crawl_metrics.DUMP_INTERVAL)
+    start_time = time.perf_counter()
+    counts = asyncio.run(run_pipeline(output_file, input_file if BASIC_SIDE_OUTPUT else None))
+    elapsed = time.perf_counter() - start_time
+
+    print("====================================")
+    print(f"목록 {counts['listed']}개 중 {counts['saved']}개를 '{output_file}' 파일에 저장했습니다. "
+          f"(새로 요청 {counts['fetched']}개, 저장된 상세 정보 사용 {counts['carried']}개)")
+    if elapsed > 0:
+        print(f"전체 소요 시간: {elapsed:.1f}초, 처리량: {counts['saved'] / elapsed:.2f} postings/sec")
+    print(http_client.stats.summary())
+    if http_cache.CACHE_ENABLED:
+        print(http_cache.get_cache().summary())
+
+    stop_metrics_dump.set()
+    report_metrics()
+
+
+if __name__ == '__main__' and PIPELINE_MODE:
+    main_pipeline()
+
+elif __name__ == '__main__':
+    stop_metrics_dump = crawl_metrics.registry.start_periodic_dump(METRICS_PREFIX, crawl_metrics.DUMP_INTERVAL)
+    basic = load_script('01. jumpit_basic_data.py')
+
+    # 💡 증분 수집: 목록 레코드가 바뀌지 않은 공고는 저장된 상세 정보를 그대로 사용
+    store = CrawlStateStore() if INCREMENTAL else None
+    counts = {'listed': 0, 'fetched': 0, 'carried': 0, 'saved': 0}
+
+    print("\n상세 페이지 크롤링을 시작합니다.")
+    print("====================================")
+
+    # 💡 기본 데이터를 BATCH_SIZE개씩 처리하고 완료된 공고는 바로 파일에 기록하므로,
+    # 공고 수와 관계없이 메모리 사용량이 일정하고 중간에 멈춰도 그때까지의 결과가 남습니다.
+    start_time = time.perf_counter()
+    try:
+        with open_output_sink(output_file, output_columns(basic)) as sink:
+            for batch in iter_basic_data(input_file):
+                counts['listed'] += len(batch)
+                if store:
+                    pending_jobs, carried_jobs = store.plan('jumpit', batch, closed_key='closedAt')
+                    counts['carried'] += len(carried_jobs)
+                else:
+                    pending_jobs = batch
+
+                if FETCH_MODE == 'async':
+                    details = asyncio.run(fetch_details_async(pending_jobs))
+                else:
+                    details = fetch_details_sync(pending_jobs)
+
+                # API 데이터와 웹 스크래핑 데이터를 결합
+                # job 딕셔너리에 상세 정보를 추가
+                failed = set()
+                for job, detailed_info in zip(pending_jobs, details):
+                    if detailed_info is None:
+                        failed.add(id(job))
+                        continue
+                    merge_detail(job, detailed_info)
+                    counts['fetched'] += 1
+                    if store:
+                        store.save_detail('jumpit', job['id'], detailed_info)
+
+                # 최종 결과는 기본 데이터의 순서를 그대로 따름
+                for job in batch:
+                    if id(job) not in failed:
+                        with crawl_metrics.timer('jumpit', 'write'):
+                            sink.write(job)
+                        counts['saved'] += 1
+                print(f"✔️ 기본 데이터 {counts['listed']}개 처리, {counts['saved']}개 저장 완료.")
+    finally:
+        if store:
+            store.close()
+    elapsed = time.perf_counter() - start_time
+
+    print("====================================")
+    print(f"총 {counts['saved']}개의 공고에 대한 상세 정보를 '{output_file}' 파일에 저장했습니다. "
+          f"(새로 요청 {counts['fetched']}개, 저장된 상세 정보 사용 {counts['carried']}개)")
+    if elapsed > 0:
+        print(f"소요 시간: {elapsed:.1f}초, 처리량: {counts['fetched'] / elapsed:.2f} postings/sec")
+    print(http_client.stats.summary())
+    if http_cache.CACHE_ENABLED:
+        print(http_cache.get_cache().summary())
+
+    stop_metrics_dump.set()
+    report_metrics()
@@ -1,149 +1,282 @@
-import requests
+import httpx
 import json
 import time
-import csv
 import os
-import random
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from urllib.parse import urlsplit
+
+import crawl_metrics
+import http_cache
+import http_client
+import rate_limiter
+from crawl_state import CrawlStateStore
+from record_sinks import CsvSink, open_sink
 
 # --- 변수 설정 ---
 BASE_URL_LIST = 'https://www.wanted.co.kr/api/chaos/navigation/v1/results'
 BASE_URL_DETAIL = 'https://www.wanted.co.kr/api/chaos/jobs/v4'
 ITEMS_PER_PAGE = 20
 
-# 일반적인 웹 브라우저의 User-Agent 헤더
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36'
-}
+# 💡 요청 속도: 무작위 sleep 대신 http_client의 호스트별 속도 제한기가 응답에 따라 속도를 조절합니다.
+# (성공하면 올리고 429/503/타임아웃이면 줄이며, 실패한 요청은 백오프 후 다시 시도)
+DETAIL_WORKERS = 8      # 상세 요청을 처리할 스레드 수
+DETAIL_RATE = 4.0       # 처음 초당 요청 수
+DETAIL_BURST = 8        # 한꺼번에 보낼 수 있는 최대 요청 수
+rate_limiter.configure_host(urlsplit(BASE_URL_LIST).hostname, rate=DETAIL_RATE, burst=DETAIL_BURST)
+
+MAX_FAILED_PAGES = 3    # 재시도 후에도 연속으로 실패한 목록 페이지가 이만큼이면 목록 수집을 멈춤
+
+# 💡 증분 수집: 신규 공고와 목록 레코드가 바뀐 공고만 상세 데이터를 요청합니다.
+INCREMENTAL = True
 
+# 💡 저장 형식: 'csv' 또는 'parquet' (parquet은 태그 리스트를 리스트 타입으로 저장)
+OUTPUT_FORMAT = 'csv'
+file_path = f'wanted_full_job_data.{OUTPUT_FORMAT}'
+LIST_COLUMNS = ('skill_tags', 'user_oriented_tags', 'attraction_tags')
+DICTIONARY_COLUMNS = ('company_name', 'location', 'district', 'employment_type')
+METRICS_PREFIX = 'wanted_metrics'   # 실행이 끝나면 단계별 지표를 .json/.prom 파일로 저장
 
-all_jobs_data = []
-offset = 0
+# 💡 목록에서 나온 공고를 BATCH_SIZE개씩 상세 수집한 뒤 바로 파일에 기록합니다. (전체 목록을 메모리에 두지 않음)
+BATCH_SIZE = 200
+
+# 저장 파일의 컬럼 순서 (기본 목록 필드 + 상세 필드)
+BASIC_COLUMNS = ['id', 'company_id', 'company_name', 'position', 'location', 'district', 'reward_total',
+                 'employment_type', 'is_newbie', 'annual_from', 'annual_to', 'skill_tags', 'category_tag_id',
+                 'user_oriented_tags']
+DETAIL_COLUMNS = ['intro', 'main_tasks', 'requirements', 'preferred_points', 'benefits', 'hire_rounds',
+                  'full_location', 'category_tag_parent_id', 'category_tag_child_text', 'attraction_tags']
 
-print("🚀 Wanted API에서 전체 채용 공고 데이터 수집을 시작합니다.")
-print("====================================")
 
 # --- 1단계: 기본 목록 데이터 수집 ---
-while True:
-    params = {
-        int(time.time() * 1000): "",
-        "job_group_id": 518,
-        "country": "kr",
-        "job_sort": "job.popularity_order",
-        "years": -1,
-        "locations": "all",
-        "limit": ITEMS_PER_PAGE,
-        "offset": offset,
-    }
-    
-    try:
-        response = requests.get(BASE_URL_LIST, params=params, headers=HEADERS)
-        response.raise_for_status()
-        data = response.json()
-        items = data.get('data', [])
-
-        if not items:
-            print(f"✅ offset {offset}에서 더 이상 데이터가 없습니다. 기본 데이터 수집을 종료합니다.")
-            break
-        
-        for item in items:
-            job_info = {
-                'id': item.get('id', ''),
-                'company_id': item.get('company', {}).get('id', ''),
-                'company_name': item.get('company', {}).get('name', ''),
-                'position': item.get('position', ''),
-                'location': item.get('address', {}).get('location', ''),
-                'district': item.get('address', {}).get('district', ''),
-                'reward_total': item.get('reward_total', ''),
-                'employment_type': item.get('employment_type', ''),
-                'is_newbie': item.get('is_newbie', False),
-                'annual_from': item.get('annual_from', None),
-                'annual_to': item.get('annual_to', None),
-                'skill_tags': item.get('skill_tags', []),
-                'category_tag_id': item.get('category_tag', {}).get('id', ''),
-                'user_oriented_tags': item.get('user_oriented_tags', [])
-            }
-            all_jobs_data.append(job_info)
-            
-        print(f"✔️ 현재까지 {len(all_jobs_data)}개의 기본 공고 데이터 수집 완료.")
+def iter_job_list(client):
+    """
+    목록 API를 offset 순서대로 요청하면서 기본 공고 데이터를 하나씩 내보냅니다.
+    """
+    collected = 0
+    offset = 0
+    failed_pages = 0
+
+    while True:
+        params = {
+            str(int(time.time() * 1000)): "",
+            "job_group_id": 518,
+            "country": "kr",
+            "job_sort": "job.popularity_order",
+            "years": -1,
+            "locations": "all",
+            "limit": ITEMS_PER_PAGE,
+            "offset": offset,
+        }
+
+        try:
+            with crawl_metrics.timer('wanted', 'list_page'):
+                # 목록은 새 공고가 바로 보여야 하므로 캐시를 거치지 않고 매번 새로 요청 (캐시는 상세 데이터에만 사용)
+                response = client.get(BASE_URL_LIST, params=params)
+                response.raise_for_status()
+                data = response.json()
+            items = data.get('data', [])
+
+            if not items:
+                print(f"✅ offset {offset}에서 더 이상 데이터가 없습니다. 기본 데이터 수집을 종료합니다.")
+                break
+
+            for item in items:
+                job_info = {
+                    'id': item.get('id', ''),
+                    'company_id': item.get('company', {}).get('id', ''),
+                    'company_name': item.get('company', {}).get('name', ''),
+                    'position': item.get('position', ''),
+                    'location': item.get('address', {}).get('location', ''),
+                    'district': item.get('address', {}).get('district', ''),
+                    'reward_total': item.get('reward_total', ''),
+                    'employment_type': item.get('employment_type', ''),
+                    'is_newbie': item.get('is_newbie', False),
+                    'annual_from': item.get('annual_from', None),
+                    'annual_to': item.get('annual_to', None),
+                    'skill_tags': item.get('skill_tags', []),
+                    'category_tag_id': item.get('category_tag', {}).get('id', ''),
+                    'user_oriented_tags': item.get('user_oriented_tags', [])
+                }
+                yield job_info
+                collected += 1
+
+            print(f"✔️ 현재까지 {collected}개의 기본 공고 데이터 수집 완료.")
+            failed_pages = 0
+
+        except (httpx.HTTPError, json.JSONDecodeError) as e:
+            # 일시적인 오류는 http_client에서 이미 재시도했으므로, 이 페이지는 건너뛰고 다음 페이지로 진행
+            failed_pages += 1
+            print(f"❌ offset {offset} 기본 데이터 수집 중 오류가 발생했습니다: {e}")
+            if failed_pages >= MAX_FAILED_PAGES:
+                print(f"❌ {failed_pages}페이지 연속으로 실패해 기본 데이터 수집을 종료합니다.")
+                break
+
         offset += ITEMS_PER_PAGE
-        time.sleep(random.uniform(0.5, 1.5))
 
-    except requests.exceptions.RequestException as e:
-        print(f"❌ 기본 데이터 수집 중 오류가 발생했습니다: {e}")
-        break
-    except json.JSONDecodeError as e:
-        print(f"❌ JSON 파싱 오류: {e}")
-        break
 
-print("\n--- 2단계: 상세 데이터 수집 시작 ---")
-# --- 상세 데이터 수집 루프 ---
-for job in all_jobs_data:
-    job_id = job['id']
+def fetch_job_list(client):
+    """
+    모든 기본 공고 데이터를 리스트로 수집합니다.
+    """
+    return list(iter_job_list(client))
+
+
+def iter_batches(records, batch_size=BATCH_SIZE):
+    records = iter(records)
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+# --- 2단계: 상세 데이터 수집 ---
+def parse_job_detail(detail_data):
+    """
+    상세 API 응답의 job 객체에서 필요한 필드를 추출합니다.
+
+    Args:
+        detail_data (dict): 상세 API 응답의 data.job 객체.
+
+    Returns:
+        dict: 기본 공고 데이터에 합칠 상세 필드.
+    """
+    detail = {}
+    detail_info = detail_data.get('detail', {})
+    detail['intro'] = detail_info.get('intro', '')
+    detail['main_tasks'] = detail_info.get('main_tasks', '')
+    detail['requirements'] = detail_info.get('requirements', '')
+    detail['preferred_points'] = detail_info.get('preferred_points', '')
+    detail['benefits'] = detail_info.get('benefits', '')
+    detail['hire_rounds'] = detail_info.get('hire_rounds', '')
+
+    # 기타 추가 정보
+    detail['full_location'] = detail_data.get('address', {}).get('full_location', '')
+    detail['category_tag_parent_id'] = detail_data.get('category_tag', {}).get('parent_tag', {}).get('id', '')
+    detail['category_tag_child_text'] = detail_data.get('category_tag', {}).get('child_tags', [{}])[0].get('text', '')
+
+    # attraction_tags의 title을 추출하여 리스트로 저장
+    detail['attraction_tags'] = [tag.get('title', '') for tag in detail_data.get('attraction_tags', [])]
+    return detail
+
+
+def fetch_job_detail(client, job_id):
+    """
+    공고 하나의 상세 데이터를 요청합니다. 실패하면 None을 반환합니다.
+    """
     detail_url = f"{BASE_URL_DETAIL}/{job_id}/details"
-    
+
     try:
-        response = requests.get(detail_url, headers=HEADERS)
-        response.raise_for_status()
-        detail_data = response.json().get('data', {}).get('job', {})
-        
+        with crawl_metrics.timer('wanted', 'detail_fetch'):
+            response = http_cache.cached_get(client, detail_url)
+            response.raise_for_status()
+            detail_data = response.json().get('data', {}).get('job', {})
+
         if detail_data:
-            detail_info = detail_data.get('detail', {})
-            job['intro'] = detail_info.get('intro', '')
-            job['main_tasks'] = detail_info.get('main_tasks', '')
-            job['requirements'] = detail_info.get('requirements', '')
-            job['preferred_points'] = detail_info.get('preferred_points', '')
-            job['benefits'] = detail_info.get('benefits', '')
-            job['hire_rounds'] = detail_info.get('hire_rounds', '')
-            
-            # 기타 추가 정보
-            job['full_location'] = detail_data.get('address', {}).get('full_location', '')
-            job['category_tag_parent_id'] = detail_data.get('category_tag', {}).get('parent_tag', {}).get('id', '')
-            job['category_tag_child_text'] = detail_data.get('category_tag', {}).get('child_tags', [{}])[0].get('text', '')
-
-            # attraction_tags의 title을 추출하여 리스트로 저장
-            attraction_tags = [tag.get('title', '') for tag in detail_data.get('attraction_tags', [])]
-            job['attraction_tags'] = attraction_tags
-            
+            with crawl_metrics.timer('wanted', 'parse'):
+                detail = parse_job_detail(detail_data)
             print(f"✔️ ID {job_id} 상세 데이터 추가 완료.")
-        else:
-            print(f"⚠️ ID {job_id}의 상세 데이터를 찾을 수 없습니다.")
+            return detail
 
-        time.sleep(random.uniform(0.5, 1.5))
-        
-    except requests.exceptions.RequestException as e:
+        print(f"⚠️ ID {job_id}의 상세 데이터를 찾을 수 없습니다.")
+
+    except httpx.HTTPError as e:
         print(f"❌ ID {job_id} 상세 데이터 요청 중 오류: {e}")
     except json.JSONDecodeError as e:
         print(f"❌ ID {job_id} JSON 파싱 오류: {e}")
 
-print("====================================")
-print(f"총 {len(all_jobs_data)}개의 공고 데이터를 성공적으로 수집했습니다.")
+    return None
+
+
+def fetch_all_details(client, all_jobs_data):
+    """
+    상세 데이터를 스레드 풀에서 병렬로 요청하고, 원래 순서대로 각 공고 딕셔너리에 합칩니다.
+
+    Returns:
+        list: all_jobs_data와 같은 순서의 상세 데이터 목록 (실패한 공고는 None).
+    """
+    with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
+        # executor.map은 입력 순서대로 결과를 돌려주므로 all_jobs_data의 순서가 유지됩니다.
+        details = list(executor.map(lambda job: fetch_job_detail(client, job['id']), all_jobs_data))
+        for job, detail in zip(all_jobs_data, details):
+            if detail:
+                job.update(detail)
+
+    return details
+
 
 # --- 수집한 데이터를 CSV 파일로 저장 ---
-file_path = 'wanted_full_job_data.csv'
-
-if not all_jobs_data:
-    print("수집된 데이터가 없어 파일을 저장할 수 없습니다.")
-else:
-    # CSV 헤더(필드명) 정의
-    csv_header = list(all_jobs_data[0].keys())
-
-    # 리스트 형태의 데이터를 문자열로 변환하여 CSV에 저장
-    for item in all_jobs_data:
-        for key in ['skill_tags', 'user_oriented_tags', 'attraction_tags']:
-            if isinstance(item.get(key), list):
-                item[key] = ', '.join([str(tag) for tag in item[key] if tag is not None])
-            else:
-                item[key] = ''
+def save_to_csv(all_jobs_data, file_path):
+    if not all_jobs_data:
+        print("수집된 데이터가 없어 파일을 저장할 수 없습니다.")
+        return
 
+    # 리스트 형태의 데이터는 싱크에서 쉼표 문자열로 합침 (원래 레코드는 바꾸지 않음)
     try:
-        with open(file_path, 'w', encoding='utf-8-sig', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=csv_header)
-            writer.writeheader()
-            writer.writerows(all_jobs_data)
-        
+        with CsvSink(file_path, BASIC_COLUMNS + DETAIL_COLUMNS, LIST_COLUMNS) as sink:
+            sink.write_many(all_jobs_data)
+
         print(f"데이터를 '{file_path}' 파일에 성공적으로 저장했습니다.")
         file_size = os.path.getsize(file_path)
         print(f"파일 크기: {file_size / 1024:.2f} KB")
 
     except IOError as e:
-        print(f"CSV 파일 저장 중 오류가 발생했습니다: {e}")
\ No newline at end of file
+        print(f"CSV 파일 저장 중 오류가 발생했습니다: {e}")
+
+
+if __name__ == '__main__':
+    # 목록/상세 요청이 하나의 커넥션 풀을 공유합니다. (User-Agent 헤더는 http_client에서 설정)
+    client = http_client.get_client()
+    stop_metrics_dump = crawl_metrics.registry.start_periodic_dump(METRICS_PREFIX, crawl_metrics.DUMP_INTERVAL)
+
+    print("🚀 Wanted API에서 전체 채용 공고 데이터 수집을 시작합니다.")
+    print("====================================")
+
+    # 💡 목록 레코드가 바뀌지 않은 공고는 저장된 상세 데이터를 그대로 사용
+    store = CrawlStateStore() if INCREMENTAL else None
+    counts = {'listed': 0, 'fetched': 0, 'carried': 0}
+    detail_time = 0.0
+
+    # 💡 목록을 BATCH_SIZE개씩 받아 상세 데이터를 합친 뒤 바로 파일에 기록하므로,
+    # 공고 수와 관계없이 메모리 사용량이 일정하고 중간에 멈춰도 그때까지의 결과가 남습니다.
+    try:
+        with open_sink(file_path, BASIC_COLUMNS + DETAIL_COLUMNS, LIST_COLUMNS, DICTIONARY_COLUMNS) as sink:
+            for batch in iter_batches(iter_job_list(client)):
+                counts['listed'] += len(batch)
+                if store:
+                    pending_jobs, carried_jobs = store.plan('wanted', batch)
+                    counts['carried'] += len(carried_jobs)
+                else:
+                    pending_jobs = batch
+
+                start_time = time.perf_counter()
+                details = fetch_all_details(client, pending_jobs)
+                detail_time += time.perf_counter() - start_time
+                # 실패한 공고(None)는 제외하고 실제로 받아 온 상세 데이터만 셈
+                counts['fetched'] += sum(1 for detail in details if detail)
+
+                if store:
+                    for job, detail in zip(pending_jobs, details):
+                        if detail:
+                            store.save_detail('wanted', job['id'], detail)
+
+                for job in batch:
+                    with crawl_metrics.timer('wanted', 'write'):
+                        sink.write(job)
+    finally:
+        if store:
+            store.close()
+
+    print("====================================")
+    print(f"총 {counts['listed']}개의 공고 데이터를 '{file_path}' 파일에 저장했습니다. "
+          f"(상세 데이터 새로 요청 {counts['fetched']}개, 저장된 상세 데이터 사용 {counts['carried']}개)")
+    if detail_time > 0:
+        print(f"상세 데이터 소요 시간: {detail_time:.1f}초, 처리량: {counts['fetched'] / detail_time:.2f} postings/sec")
+    print(http_client.stats.summary())
+    if http_cache.CACHE_ENABLED:
+        print(http_cache.get_cache().summary())
+
+    stop_metrics_dump.set()
+    print(crawl_metrics.registry.summary())
+    print(f"단계별 지표를 저장했습니다: {', '.join(crawl_metrics.registry.dump(METRICS_PREFIX))}")
@@ -1,50 +1,258 @@
-import time
 import pandas as pd
-from selenium import webdriver
+import httpx
+from concurrent.futures import ThreadPoolExecutor
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
 
 from bs4 import BeautifulSoup
 import re
 import logging
+from urllib.parse import urlsplit
+import browser_profile
+import crawl_metrics
+import http_client
+import rate_limiter
+from record_sinks import open_sink
+import wait_engine
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def scrape_all_job_listings_with_validation(url):
+# --- 변수 설정 ---
+PAGE_RATE = 0.5     # 초당 이동할 최대 목록 페이지 수 (예의상 요청 간격)
+page_bucket = rate_limiter.TokenBucket(PAGE_RATE)
+OUTPUT_FORMAT = 'csv'   # 'csv' 또는 'parquet'
+DICTIONARY_COLUMNS = ('회사명', '경력', '학력', '지역', '고용형태')
+METRICS_PREFIX = 'jobkorea_list_metrics'   # 실행이 끝나면 단계별 지표를 .json/.prom 파일로 저장
+# parse_job_rows가 만드는 레코드의 필드 순서 (수집한 공고는 바로 파일에 기록)
+COLUMNS = ['회사명', '제목', '상세페이지_URL', '경력', '학력', '지역', '고용형태', '등록일', '마감일']
+
+# 💡 목록 수집 방식: 'browser'는 기존처럼 필터 라벨과 페이지 버튼을 클릭하고,
+# 'http'는 필터 조건(직무 코드, 페이지 번호)으로 목록 요청을 직접 만들어 여러 페이지를 동시에 받습니다.
+# 'http'의 목록 요청(LIST_ENDPOINT)과 필터 파라미터는 실제 사이트에서 확인되지 않았으므로 기본값은 'browser'입니다.
+# 'http'는 첫 페이지를 브라우저 결과와 비교해 같을 때만 계속하고, 다르거나 아무것도 받지 못하면 'browser'로 다시 수집합니다.
+LIST_MODE = 'browser'
+LIST_ENDPOINT = 'https://www.jobkorea.co.kr/Recruit/Home/_GI_List/'   # 결과 목록을 그리는 페이지 내부 요청
+LIST_PAGE_SIZE = 40
+LIST_WORKERS = 4        # 동시에 요청할 페이지 수
+LIST_RATE = 2.0         # 처음 초당 목록 페이지 요청 수 (성공하면 올리고 429/503이면 줄임, rate_limiter 참고)
+LIST_BURST = 4
+MAX_FAILED_PAGES = 3    # 재시도 후에도 연속으로 실패한 목록 페이지가 이만큼이면 목록 수집을 멈춤
+DUTY_GROUP = '10031'    # 'AI·개발·데이터'
+DUTY_LIMIT = 12         # 선택할 하위 직무 수 (브라우저 모드와 동일)
+DUTY_CODES = None       # 하위 직무 코드 목록. None이면 필터 화면에서 앞의 DUTY_LIMIT개를 읽어옴
+
+
+def parse_job_rows(soup):
     """
-    페이지네이션을 통해 모든 채용 공고를 크롤링하고 페이지 이동을 검증합니다.
+    목록 테이블의 tr.devloopArea 행에서 공고 정보를 추출합니다.
+
+    Args:
+        soup: 목록 테이블(div.tplList.tplJobList) 또는 그 테이블을 포함한 문서.
+
+    Returns:
+        list: 공고 딕셔너리 목록.
     """
     job_listings = []
+    for tr in soup.find_all('tr', class_='devloopArea'):
+        try:
+            company_name = tr.find('td', class_='tplCo').a.text.strip()
+            job_title_element = tr.find('td', class_='tplTit').find('strong').find('a')
+            job_title = job_title_element.text.strip()
+            job_detail_url = f'https://www.jobkorea.co.kr{job_title_element["href"]}'
+
+            etc_info = tr.find('td', class_='tplTit').find('p', class_='etc').find_all('span', class_='cell')
+            experience = etc_info[0].text.strip() if len(etc_info) > 0 else None
+            education = etc_info[1].text.strip() if len(etc_info) > 1 else None
+            location = etc_info[2].text.strip() if len(etc_info) > 2 else None
+            job_type = etc_info[3].text.strip() if len(etc_info) > 3 else None
+            # 급여와 직급/직책 데이터 추출 (추가된 부분)
+            salary = etc_info[4].text.strip() if len(etc_info) > 4 else None
+            rank = etc_info[5].text.strip() if len(etc_info) > 5 else None
+
+            odd_td = tr.find('td', class_='odd')
+            registration_date = odd_td.find('span', class_='time').text.strip() if odd_td and odd_td.find('span', class_='time') else None
+            closing_date = odd_td.find('span', class_='date').text.strip() if odd_td and odd_td.find('span', class_='date') else None
+
+            job_listings.append({
+                '회사명': company_name,
+                '제목': job_title,
+                '상세페이지_URL': job_detail_url,
+                '경력': experience,
+                '학력': education,
+                '지역': location,
+                '고용형태': job_type,
+                '등록일': registration_date,
+                '마감일': closing_date
+            })
+
+        except Exception as e:
+            logger.warning(f"⚠️ 데이터 중 오류 발생: {e}")
+            continue
+    return job_listings
+
+
+# --- HTTP 목록 수집 ---
+def discover_duty_codes(client, url):
+    """
+    필터 화면에서 DUTY_GROUP의 하위 직무 코드를 앞에서부터 DUTY_LIMIT개 읽어옵니다.
+    """
+    response = client.get(url)
+    response.raise_for_status()
+    soup = BeautifulSoup(response.text, 'html.parser')
+
+    duty_codes = []
+    for item in soup.select(f'#duty_step2_{DUTY_GROUP}_ly .item')[:DUTY_LIMIT]:
+        checkbox = item.find('input')
+        if checkbox and checkbox.get('value'):
+            duty_codes.append(checkbox['value'])
+            logger.info(f"✅ '{checkbox.get('data-name')}' 직무 선택 완료. ({checkbox['value']})")
+    return duty_codes
+
+
+def fetch_list_page(client, referer, duty_codes, page_num):
+    """
+    필터 조건으로 목록 한 페이지를 요청하고 공고 목록을 반환합니다. 빈 페이지면 빈 리스트를 반환합니다.
+    """
+    data = {
+        'condition[menucode]': 'duty',
+        'condition[duty]': ','.join(duty_codes),
+        'page': page_num,
+        'pagesize': LIST_PAGE_SIZE,
+    }
+    headers = {'Referer': referer, 'X-Requested-With': 'XMLHttpRequest'}
+
+    with crawl_metrics.timer('jobkorea', 'list_page'):
+        response = client.post(LIST_ENDPOINT, data=data, headers=headers)
+        response.raise_for_status()
+
+    with crawl_metrics.timer('jobkorea', 'parse'):
+        return parse_job_rows(BeautifulSoup(response.text, 'html.parser'))
+
+
+def first_page_matches_browser(client, url, duty_codes):
+    """
+    HTTP로 받은 첫 페이지가 브라우저에서 필터를 클릭해 얻은 첫 페이지와 같은지 확인합니다.
+    LIST_ENDPOINT가 필터를 무시하거나 다른 목록을 돌려주면 엉뚱한 공고를 조용히 수집하게 되므로, 다르면 False.
+    """
+    try:
+        http_rows = fetch_list_page(client, url, duty_codes, 1)
+    except httpx.HTTPError as e:
+        logger.error(f"❌ 1페이지 요청 중 오류 발생: {e}")
+        return False
+    browser_rows = scrape_all_job_listings_with_validation(url, max_pages=1)
+
+    if not browser_rows or http_rows != browser_rows:
+        http_urls = {row['상세페이지_URL'] for row in http_rows}
+        browser_urls = {row['상세페이지_URL'] for row in browser_rows}
+        logger.warning(f"⚠️ HTTP 목록 첫 페이지가 브라우저 결과와 다릅니다. "
+                       f"(HTTP {len(http_rows)}건, 브라우저 {len(browser_rows)}건, 겹치는 공고 {len(http_urls & browser_urls)}건)")
+        return False
+    logger.info(f"✅ HTTP 목록 첫 페이지가 브라우저 결과와 같습니다. ({len(http_rows)}건)")
+    return True
+
+
+def iter_job_listings_http(url):
+    """
+    브라우저 없이 목록 요청을 직접 만들어 LIST_WORKERS개 페이지씩 동시에 받고, 공고를 페이지 순서대로 하나씩 내보냅니다.
+    첫 번째 빈 페이지에서 멈추고, 그 뒤 페이지의 결과는 버립니다.
+    요청에 실패한 페이지는 건너뛰고, MAX_FAILED_PAGES페이지 연속으로 실패하면 멈춥니다. (이때 결과는 일부만 수집된 상태)
+    첫 페이지가 브라우저 결과와 다르면 아무것도 내보내지 않습니다. (first_page_matches_browser 참고)
+    """
+    client = http_client.get_client()
+    seen_urls = set()
+    failed_pages = []       # 건너뛴 페이지 번호
+    consecutive_failures = 0
+
+    try:
+        duty_codes = DUTY_CODES or discover_duty_codes(client, url)
+    except httpx.HTTPError as e:
+        logger.error(f"❌ 필터 화면 요청 중 오류 발생: {e}")
+        return
+
+    if not duty_codes:
+        logger.warning("❌ 하위 직무 코드를 찾을 수 없습니다.")
+        return
+
+    if not first_page_matches_browser(client, url, duty_codes):
+        return
+
+    rate_limiter.configure_host(urlsplit(LIST_ENDPOINT).hostname, rate=LIST_RATE, burst=LIST_BURST)
+    page_num = 1
+    with ThreadPoolExecutor(max_workers=LIST_WORKERS) as executor:
+        while True:
+            page_nums = range(page_num, page_num + LIST_WORKERS)
+            futures = [executor.submit(fetch_list_page, client, url, duty_codes, num) for num in page_nums]
+
+            finished = False
+            for num, future in zip(page_nums, futures):
+                try:
+                    rows = future.result()
+                except httpx.HTTPError as e:
+                    failed_pages.append(num)
+                    consecutive_failures += 1
+                    logger.warning(f"⚠️ {num}페이지 요청 중 오류 발생, 이 페이지를 건너뜁니다: {e}")
+                    if consecutive_failures >= MAX_FAILED_PAGES:
+                        logger.error(f"❌ {consecutive_failures}페이지 연속으로 실패해 목록 수집을 중단합니다.")
+                        finished = True
+                        break
+                    continue
+                consecutive_failures = 0
+                if not rows:
+                    logger.info(f"🏁 {num}페이지가 비어 있습니다. 크롤링을 종료합니다.")
+                    finished = True
+                    break
+
+                # 수집 도중 새 공고가 올라와 페이지가 밀리면 같은 공고가 두 번 나올 수 있음
+                for row in rows:
+                    if row['상세페이지_URL'] not in seen_urls:
+                        seen_urls.add(row['상세페이지_URL'])
+                        yield row
+                logger.info(f"✅ {num}페이지 {len(rows)}건 수집 완료.")
+
+            if finished:
+                for future in futures:
+                    future.cancel()
+                break
+            page_num += LIST_WORKERS
+
+    if failed_pages:
+        logger.warning(f"⚠️ 목록 일부만 수집했습니다. 받지 못한 페이지 {len(failed_pages)}개: {failed_pages} "
+                       f"(수집한 공고 {len(seen_urls)}건)")
+
+
+def scrape_all_job_listings_http(url):
+    return list(iter_job_listings_http(url))
+
+
+def iter_job_listings_with_validation(url, max_pages=None):
+    """
+    페이지네이션을 통해 모든 채용 공고를 크롤링하고 페이지 이동을 검증합니다. 공고는 페이지를 읽을 때마다 내보냅니다.
+
+    Args:
+        max_pages (int): 지정하면 이 페이지 수까지만 읽습니다. (None이면 끝까지)
+    """
     driver = None
     
     try:
-        chrome_options = Options()
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        
-        user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.7339.81 Safari/537.36'
-        chrome_options.add_argument(f'user-agent={user_agent}')
-
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.get(url)
+        # 필터 라벨과 페이지 버튼을 클릭해야 하므로 스타일시트는 차단하지 않음 (browser_profile.BLOCK_STYLESHEETS)
+        driver = browser_profile.create_driver()
+        with crawl_metrics.timer('jobkorea', 'page_load'):
+            driver.get(url)
         logger.info(f"✅ 초기 페이지 접속 완료: {url}")
         
         # 필터링 로직 (기존과 동일)
         # ... (AI·개발·데이터 버튼 클릭, 직무 선택, 검색 버튼 클릭 로직)
-        ai_dev_label = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//label[@for='duty_step1_10031']"))
-        )
+        ai_dev_label = wait_engine.wait_for_selector(driver, "//label[@for='duty_step1_10031']", by=By.XPATH, clickable=True)
         ai_dev_label.click()
         logger.info("✅ 'AI·개발·데이터' 버튼 클릭 완료.")
-        time.sleep(2)
 
+        # 하위 직무 목록이 나타날 때까지 대기
+        try:
+            wait_engine.wait_for_selector(driver, '#duty_step2_10031_ly .item')
+        except TimeoutException:
+            pass
         sub_job_list_items = driver.find_elements(By.CSS_SELECTOR, '#duty_step2_10031_ly .item')
 
         if len(sub_job_list_items) == 0:
@@ -56,15 +264,15 @@ def scrape_all_job_listings_with_validation(url):
             label.click()
             job_name = sub_job_list_items[i].find_element(By.CSS_SELECTOR, 'input').get_attribute('data-name')
             logger.info(f"✅ '{job_name}' 직무 선택 완료.")
-        time.sleep(2)
+        wait_engine.wait_for_dom_stable(driver, timeout=2)
         
         search_button = driver.find_element(By.ID, 'dev-btn-search')
         search_button.click()
         logger.info("✅ 검색 버튼 클릭 완료. 결과 페이지로 이동합니다.")
 
         # 셀레늄 드라이버 10초정도 id가 dvGIPaging인 요소가 페이지에 나타날때까지 기다려야함.
-        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, 'dvGIPaging')))
-        time.sleep(2)
+        wait_engine.wait_for_selector(driver, 'dvGIPaging', by=By.ID)
+        wait_engine.wait_for_dom_stable(driver, timeout=2)
     
         
         page_num = 1
@@ -72,75 +280,44 @@ def scrape_all_job_listings_with_validation(url):
             logger.info(f"\n--- {page_num}페이지 스크랩 중 ---")
             
             # 페이지네이션이 로드될 때까지 대기
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, 'dvGIPaging'))
-            )
+            wait_engine.wait_for_selector(driver, 'dvGIPaging', by=By.ID)
             
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            table_body = soup.find('div', class_='tplList tplJobList')
+            with crawl_metrics.timer('jobkorea', 'parse'):
+                soup = BeautifulSoup(driver.page_source, 'html.parser')
+                table_body = soup.find('div', class_='tplList tplJobList')
             
-            if not table_body:
-                logger.warning("⚠️ 채용 공고 목록 테이블을 찾을 수 없습니다. 크롤링을 종료합니다.")
-                break
+                if not table_body:
+                    logger.warning("⚠️ 채용 공고 목록 테이블을 찾을 수 없습니다. 크롤링을 종료합니다.")
+                    break
             
-            # 데이터 추출
-            for tr in table_body.find_all('tr', class_='devloopArea'):
-                try:
-                    company_name = tr.find('td', class_='tplCo').a.text.strip()
-                    job_title_element = tr.find('td', class_='tplTit').find('strong').find('a')
-                    job_title = job_title_element.text.strip()
-                    job_detail_url = f'https://www.jobkorea.co.kr{job_title_element["href"]}'
-
-                    etc_info = tr.find('td', class_='tplTit').find('p', class_='etc').find_all('span', class_='cell')
-                    experience = etc_info[0].text.strip() if len(etc_info) > 0 else None
-                    education = etc_info[1].text.strip() if len(etc_info) > 1 else None
-                    location = etc_info[2].text.strip() if len(etc_info) > 2 else None
-                    job_type = etc_info[3].text.strip() if len(etc_info) > 3 else None
-                    # 급여와 직급/직책 데이터 추출 (추가된 부분)
-                    salary = etc_info[4].text.strip() if len(etc_info) > 4 else None
-                    rank = etc_info[5].text.strip() if len(etc_info) > 5 else None
-
-                    odd_td = tr.find('td', class_='odd')
-                    registration_date = odd_td.find('span', class_='time').text.strip() if odd_td and odd_td.find('span', class_='time') else None
-                    closing_date = odd_td.find('span', class_='date').text.strip() if odd_td and odd_td.find('span', class_='date') else None
-
-                    job_listings.append({
-                        '회사명': company_name,
-                        '제목': job_title,
-                        '상세페이지_URL': job_detail_url,
-                        '경력': experience,
-                        '학력': education,
-                        '지역': location,
-                        '고용형태': job_type,
-                        '등록일': registration_date,
-                        '마감일': closing_date
-                    })
-
-                except Exception as e:
-                    logger.warning(f"⚠️ 데이터 중 오류 발생: {e}")
-                    continue
+                # 데이터 추출
+                rows = parse_job_rows(table_body)
+            yield from rows
+
+            if max_pages and page_num >= max_pages:
+                break
             
             # 다음 페이지로 이동하는 로직
             next_page_num = page_num + 1
             try:
                 # 다음 페이지 버튼(a 태그)을 찾습니다.
                 next_page_link_selector = f'div.tplPagination a[data-page="{next_page_num}"]'
-                next_page_button = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, next_page_link_selector))
-                )
-                
-                next_page_button.click()
-                logger.info(f"✅ {next_page_num}페이지 버튼을 클릭했습니다.")
+                next_page_button = wait_engine.wait_for_selector(driver, next_page_link_selector, timeout=5, clickable=True)
+
+                # 💡 요청 간격은 속도 제한기로 조절
+                page_bucket.acquire()
+                with crawl_metrics.timer('jobkorea', 'page_load'):
+                    next_page_button.click()
+                    logger.info(f"✅ {next_page_num}페이지 버튼을 클릭했습니다.")
                 
-                # 다음 페이지로 이동했는지 검증
-                now_page_selector = f'div.tplPagination span.now[data-page="{next_page_num}"]'
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, now_page_selector))
-                )
+                    # 다음 페이지로 이동했는지 검증
+                    now_page_selector = f'div.tplPagination span.now[data-page="{next_page_num}"]'
+                    wait_engine.wait_for_selector(driver, now_page_selector)
+                    # 목록이 다 바뀔 때까지만 대기 (최대 2초)
+                    wait_engine.wait_for_dom_stable(driver, timeout=2)
                 logger.info(f"✅ {next_page_num}페이지로 성공적으로 이동했습니다.")
 
                 page_num += 1
-                time.sleep(2)
                 
             except TimeoutException:
                 logger.info("🏁 다음 페이지 버튼을 찾을 수 없습니다. 크롤링을 종료합니다.")
@@ -155,19 +332,47 @@ def scrape_all_job_listings_with_validation(url):
         if driver:
             driver.quit()
 
-    return job_listings
+
+def scrape_all_job_listings_with_validation(url, max_pages=None):
+    return list(iter_job_listings_with_validation(url, max_pages))
+
+
+def save_listings(listings, sink):
+    """
+    공고를 받는 대로 싱크에 기록하고 기록한 건수를 반환합니다.
+    """
+    count = 0
+    for row in listings:
+        with crawl_metrics.timer('jobkorea', 'write'):
+            sink.write(row)
+        count += 1
+    return count
+
 
 if __name__ == '__main__':
     url_to_scrape = 'https://www.jobkorea.co.kr/recruit/joblist?menucode=duty'
-    scraped_data = scrape_all_job_listings_with_validation(url_to_scrape)
-    
-    if scraped_data:
-        df = pd.DataFrame(scraped_data)
-        file_name = "jobkorea_all_listings.csv"
-        df.to_csv(file_name, index=False, encoding='utf-8-sig')
-        
+    file_name = f"jobkorea_all_listings.{OUTPUT_FORMAT}"
+    stop_metrics_dump = crawl_metrics.registry.start_periodic_dump(METRICS_PREFIX, crawl_metrics.DUMP_INTERVAL)
+
+    # 💡 수집한 공고는 바로 파일에 기록하므로 공고 수와 관계없이 메모리 사용량이 일정하고,
+    # 중간에 멈춰도 그때까지 수집한 공고는 파일에 남습니다.
+    total = 0
+    with open_sink(file_name, COLUMNS, dictionary_columns=DICTIONARY_COLUMNS) as sink:
+        if LIST_MODE == 'http':
+            total = save_listings(iter_job_listings_http(url_to_scrape), sink)
+            if not total:
+                logger.warning("⚠️ HTTP 목록 수집 결과가 없거나 검증에 실패해 브라우저로 다시 수집합니다.")
+        if not total:
+            total = save_listings(iter_job_listings_with_validation(url_to_scrape), sink)
+
+    if total:
         logger.info("\n--- 크롤링 완료 ---")
-        logger.info(f"✅ 총 {len(scraped_data)}건의 채용 공고를 '{file_name}' 파일에 저장했습니다.")
-        print(df.head())
+        logger.info(f"✅ 총 {total}건의 채용 공고를 '{file_name}' 파일에 저장했습니다.")
+        if OUTPUT_FORMAT == 'csv':
+            print(pd.read_csv(file_name, nrows=5))
     else:
-        logger.warning("\n❌ 크롤링된 데이터가 없습니다.")
\ No newline at end of file
+        logger.warning("\n❌ 크롤링된 데이터가 없습니다.")
+
+    stop_metrics_dump.set()
+    logger.info(crawl_metrics.registry.summary())
+    logger.info(f"단계별 지표를 저장했습니다: {', '.join(crawl_metrics.registry.dump(METRICS_PREFIX))}")
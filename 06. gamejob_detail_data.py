@@ -4,17 +4,44 @@ import time
 import logging
 import re
 import random
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+import multiprocessing
+import queue
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
+from bs4.element import NavigableString, PreformattedString
+from html_parser import parse_html
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+import httpx
+import crawl_metrics
+import http_client
+import browser_profile
+import wait_engine
+from rate_limiter import TokenBucket
+from crawl_journal import CrawlJournal
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# --- 변수 설정 ---
+CRAWL_MODE = 'sequential'       # 'sequential': 드라이버 하나로 순서대로 크롤링, 'sharded': 여러 프로세스로 나눠서 크롤링
+NUM_WORKERS = None              # 워커 프로세스 수. None이면 CPU 코어 수와 여유 메모리로 자동 결정 (최대 MAX_AUTO_WORKERS)
+MAX_AUTO_WORKERS = 4            # 워커 수를 자동으로 정할 때의 상한
+MEMORY_PER_WORKER_MB = 700      # 워커 하나(headless Chrome 포함)가 사용하는 대략적인 메모리
+THROUGHPUT_LOG_INTERVAL = 20    # 워커마다 이 개수를 처리할 때마다 처리 속도를 로그로 출력
+EXTRACTION_MODE = 'snapshot'    # 'snapshot': page_source를 한 번 받아 로컬에서 파싱, 'webdriver': 요소마다 WebDriver 호출
+PAGE_RATE = 0.5                 # 초당 여는 최대 페이지 수 (예의상 요청 간격). sharded 모드에서는 워커들이 나눠 씀
+SNAPSHOT_BACKEND = 'lxml'       # snapshot 모드에서 사용할 BeautifulSoup 파서 ('html.parser' 또는 'lxml')
+IFRAME_MODE = 'http'            # 'http': iframe 본문을 HTTP로 직접 요청, 'browser': 드라이버를 iframe으로 전환해서 읽음
+OUTPUT_FORMAT = 'csv'           # 최종 파일 형식: 'csv' 또는 'parquet'
+DICTIONARY_COLUMNS = ('고용형태', '게임분야', '최종학력', '해당분야', '급여조건')
+IFRAME_IDS = {'담당업무': 'GI_Work_Content', '자격조건': 'GI_Comment'}
+METRICS_PREFIX = 'gamejob_metrics'   # 실행이 끝나면 단계별 지표를 .json/.prom 파일로 저장 (워커 지표 포함)
+
+# sharded 모드에서는 워커마다 PAGE_RATE / 워커 수로 다시 만들어 전체 속도가 PAGE_RATE를 넘지 않도록 함 (crawl_shard 참고)
+page_bucket = TokenBucket(PAGE_RATE)
+
 # --- 각 섹션별 데이터 추출 함수들 (이전에 수정한 최종 함수들을 여기에 붙여넣기) ---
 def scrape_all_job_details(url, driver):
     """
@@ -38,31 +65,39 @@ def scrape_all_job_details(url, driver):
         random_user_agent = random.choice(user_agents)
         driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": random_user_agent})
         
-        # 💡 불규칙한 시간으로 페이지 로딩 대기
-        random_wait_time = random.uniform(1, 3) # 2초 ~ 5초 사이의 무작위 값
-        time.sleep(random_wait_time)
-
-        driver.get(url)
-        post_load_wait_time = random.uniform(1, 3) # 1초 ~ 3초 사이의 무작위 값
-        time.sleep(post_load_wait_time)
+        # 💡 요청 간격은 속도 제한기로 조절 (페이지 로딩 대기 시간과 분리)
+        page_bucket.acquire()
 
-        logger.info(f"페이지 접속 완료: {url}")
+        with crawl_metrics.timer('gamejob', 'page_load'):
+            driver.get(url)
+            logger.info(f"페이지 접속 완료: {url}")
 
-
-        # 💡 수정된 부분: 대기 시간을 3~6초 사이의 무작위 값으로 설정
-        try:
-            WebDriverWait(driver, 5).until(
-				        EC.presence_of_element_located((By.ID, 'gibOutline'))
-				    )
-            logger.info("✅ '모집요강' 섹션 로딩 확인.")
-        except TimeoutException:
-            logger.warning("⚠️ 5초 내에 '모집요강' 섹션을 찾지 못했습니다. 페이지가 로딩되지 않았을 수 있습니다.")
+            # '모집요강' 섹션이 나타나는 즉시 진행 (최대 5초)
+            try:
+                wait_engine.wait_for_selector(driver, 'gibOutline', by=By.ID, timeout=5)
+                logger.info("✅ '모집요강' 섹션 로딩 확인.")
+            except TimeoutException:
+                logger.warning("⚠️ 5초 내에 '모집요강' 섹션을 찾지 못했습니다. 페이지가 로딩되지 않았을 수 있습니다.")
 
 				# 모집요강, 담당업무 및 자격요건, 수정일 및 등록일 함수 가져와서 저장
         all_details['URL'] = url
-        all_details.update(scrape_dates(driver))
-        all_details.update(scrape_gib_outline(driver))
-        all_details.update(scrape_job_duties_and_qualifications(driver))
+        soup = None
+        if EXTRACTION_MODE == 'snapshot':
+            # page_source를 한 번만 받아 로컬에서 추출 (요소마다 WebDriver를 왕복하지 않음)
+            page_source = driver.page_source
+            with crawl_metrics.timer('gamejob', 'parse'):
+                soup = parse_html(page_source, SNAPSHOT_BACKEND)
+                all_details.update(scrape_dates_from_soup(soup))
+                all_details.update(scrape_gib_outline_from_soup(soup))
+        else:
+            with crawl_metrics.timer('gamejob', 'parse'):
+                all_details.update(scrape_dates(driver))
+                all_details.update(scrape_gib_outline(driver))
+
+        if IFRAME_MODE == 'http':
+            all_details.update(fetch_job_duties_and_qualifications(driver, url, random_user_agent, soup))
+        else:
+            all_details.update(scrape_job_duties_and_qualifications(driver))
 
 
         columns = [
@@ -241,6 +276,161 @@ def scrape_gib_outline(driver):
     
     return gib_details
 
+# --- page_source 스냅샷에서 추출하는 함수들 ---
+# Selenium의 element.text와 같은 결과를 내기 위해 블록 요소와 <br>은 줄바꿈, 나머지는 이어 붙임
+BLOCK_TAGS = frozenset({
+    'address', 'article', 'aside', 'blockquote', 'caption', 'dd', 'div', 'dl', 'dt', 'fieldset', 'figure',
+    'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p',
+    'pre', 'section', 'table', 'tbody', 'tfoot', 'thead', 'tr', 'ul',
+})
+CELL_TAGS = frozenset({'td', 'th'})
+HIDDEN_TAGS = frozenset({'head', 'iframe', 'noscript', 'script', 'style', 'template', 'title'})
+INLINE_SPACE_PATTERN = re.compile(r'[^\S\n]+')
+DATE_PATTERN = re.compile(r':\s*(.*)')
+
+
+def _is_hidden(tag):
+    if tag.name in HIDDEN_TAGS:
+        return True
+    style = (tag.get('style') or '').replace(' ', '').lower()
+    return 'display:none' in style or 'visibility:hidden' in style
+
+
+def element_text(element):
+    """
+    BeautifulSoup 요소에서 Selenium의 element.text와 같은 형태의 텍스트를 만듭니다.
+    공백은 하나로 합치고, 블록 요소 경계에서 줄을 바꾸며, 숨김 요소는 제외합니다.
+    """
+    chunks = []
+
+    def walk(node):
+        for child in node.children:
+            if isinstance(child, PreformattedString):   # 주석, CDATA 등
+                continue
+            if isinstance(child, NavigableString):
+                chunks.append(str(child).replace('\n', ' '))
+            elif child.name == 'br':
+                chunks.append('\n')
+            elif _is_hidden(child):
+                continue
+            elif child.name in BLOCK_TAGS:
+                chunks.append('\n')
+                walk(child)
+                chunks.append('\n')
+            elif child.name in CELL_TAGS:
+                chunks.append(' ')
+                walk(child)
+                chunks.append(' ')
+            else:
+                walk(child)
+
+    walk(element)
+    lines = (INLINE_SPACE_PATTERN.sub(' ', line).strip() for line in ''.join(chunks).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def scrape_dates_from_soup(soup):
+    """
+    scrape_dates와 같은 결과를 page_source 스냅샷에서 추출합니다.
+    """
+    dates = {'수정일': None, '등록일': None}
+
+    date_elements = soup.select('div#gibReadTop p.date')
+    for key, date_element in zip(('수정일', '등록일'), date_elements):
+        match = DATE_PATTERN.search(element_text(date_element))
+        if match:
+            dates[key] = match.group(1).strip()
+
+    return dates
+
+
+def scrape_gib_outline_from_soup(soup):
+    """
+    scrape_gib_outline과 같은 결과를 page_source 스냅샷에서 추출합니다.
+
+    Args:
+        soup (BeautifulSoup): 상세 페이지 전체를 파싱한 객체.
+
+    Returns:
+        dict: 추출된 모집요강 정보.
+    """
+    gib_details = {
+        '모집분야': None,
+        '해당키워드': None,
+        '게임분야': None,
+        '고용형태': None,
+        '모집인원': None,
+        '채용직급·직책': None,
+        '급여조건': None,
+        '해당분야': None,
+        '연령': None,
+        '최종학력': None,
+        '성별': None,
+        '자격사항': None,
+        '외국어 능력': None,
+        '자격증': None,
+        '사전인터뷰': None
+    }
+
+    gib_outline_section = soup.find(id='gibOutline')
+    if gib_outline_section is None:
+        print("⚠️ '모집요강' 섹션을 찾을 수 없습니다.")
+        return gib_details
+
+    # Selenium의 find_elements와 같이 중첩된 dl/dt까지 모두 순회
+    for dl_tag in gib_outline_section.find_all('dl'):
+        for dt_element in dl_tag.find_all('dt'):
+            key = element_text(dt_element)
+
+            dd_element = dt_element.find_next_sibling('dd')
+            if dd_element is None:
+                continue
+
+            # '지원자격' 테이블 처리
+            if key == '지원자격':
+                table = dd_element.find('table')
+                if table is None:
+                    continue
+                headers = [element_text(th) for th in table.find_all('th')]
+                values = [element_text(td) for td in table.find_all('td')]
+                for header, value in zip(headers, values):
+                    gib_details[header] = value
+
+            # '우대사항' 내의 세부 항목 처리
+            elif key == '우대사항':
+                sub_dl = dd_element.find('dl')
+                if sub_dl is None:
+                    continue
+                for sub_dt in sub_dl.find_all('dt'):
+                    sub_dd = sub_dt.find_next_sibling('dd')
+                    if sub_dd is None:
+                        break
+                    gib_details[element_text(sub_dt)] = element_text(sub_dd)
+
+            # '게임분야' 처리
+            elif key == '게임분야':
+                device_element = dd_element.select_one("font[color='#5e42a6']")
+                genre_element = dd_element.select_one("font[color='#ae489e']")
+                device_text = element_text(device_element) if device_element else ""
+                genre_text = element_text(genre_element) if genre_element else ""
+                gib_details['게임분야'] = f"{device_text} {genre_text}".strip()
+
+            # 기타 일반 항목 처리
+            elif key in gib_details:
+                full_text = element_text(dd_element)
+
+                # '0명 / 현재 지원자수 : **명' 형태에서 '0명'만 가져옴
+                if key == '모집인원' and '/' in full_text:
+                    full_text = full_text.split('/')[0].strip()
+
+                link_elements = dd_element.find_all('a')
+                if (key == '모집분야' or key == '채용직급·직책') and link_elements:
+                    gib_details[key] = ', '.join(element_text(link) for link in link_elements)
+                else:
+                    gib_details[key] = full_text
+
+    return gib_details
+
 # --- 모집요강 추출 함수 ---
 def scrape_iframe_content(driver, iframe_id):
     """
@@ -252,20 +442,19 @@ def scrape_iframe_content(driver, iframe_id):
         str: iframe 내부의 텍스트, 또는 오류 발생 시 None.
     """
     try:
-        # iframe이 로드될 때까지 최대 10초 대기
-        WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located((By.ID, iframe_id))
-        )
-        iframe = driver.find_element(By.ID, iframe_id)
+        with crawl_metrics.timer('gamejob', 'iframe'):
+            # iframe이 로드될 때까지 최대 10초 대기
+            wait_engine.wait_for_selector(driver, iframe_id, by=By.ID, timeout=5)
+            iframe = driver.find_element(By.ID, iframe_id)
         
-        # 드라이버의 포커스를 iframe으로 전환
-        driver.switch_to.frame(iframe)
+            # 드라이버의 포커스를 iframe으로 전환
+            driver.switch_to.frame(iframe)
         
-        # iframe 내부의 모든 텍스트 가져오기
-        content = driver.find_element(By.TAG_NAME, 'body').text
+            # iframe 내부의 모든 텍스트 가져오기
+            content = driver.find_element(By.TAG_NAME, 'body').text
         
-        # 포커스를 다시 메인 페이지로 복귀
-        driver.switch_to.default_content()
+            # 포커스를 다시 메인 페이지로 복귀
+            driver.switch_to.default_content()
         
         return content.strip()
         
@@ -291,6 +480,74 @@ def scrape_job_duties_and_qualifications(driver):
     return duties_and_qualifications
 
 
+# --- iframe 본문을 HTTP로 직접 요청 ---
+def find_iframe_sources(driver, page_url, soup=None):
+    """
+    담당업무/자격조건 iframe의 절대 URL을 찾습니다. soup이 있으면 WebDriver를 호출하지 않습니다.
+
+    Returns:
+        dict: {iframe_id: URL 또는 None}
+    """
+    sources = {}
+    for iframe_id in IFRAME_IDS.values():
+        src = None
+        try:
+            if soup is not None:
+                iframe = soup.find('iframe', id=iframe_id)
+                src = iframe.get('src') if iframe else None
+            else:
+                src = driver.find_element(By.ID, iframe_id).get_attribute('src')
+        except NoSuchElementException:
+            pass
+        sources[iframe_id] = urljoin(page_url, src) if src else None
+    return sources
+
+
+def fetch_iframe_text(client, iframe_url, headers):
+    """
+    iframe 문서를 요청해 body의 텍스트를 반환합니다. 실패하면 예외가 그대로 올라갑니다.
+    """
+    with crawl_metrics.timer('gamejob', 'iframe'):
+        response = client.get(iframe_url, headers=headers)
+        response.raise_for_status()
+    # 바이트로 넘겨 파서가 meta charset으로 인코딩을 판단하게 함
+    with crawl_metrics.timer('gamejob', 'parse'):
+        iframe_soup = parse_html(response.content, SNAPSHOT_BACKEND)
+        return element_text(iframe_soup.body or iframe_soup)
+
+
+def fetch_job_duties_and_qualifications(driver, page_url, user_agent, soup=None):
+    """
+    담당업무와 자격조건 iframe 본문을 브라우저 쿠키로 동시에 요청해 추출합니다.
+    HTTP 요청이 실패한 iframe만 브라우저에서 읽는 방식으로 대체합니다.
+    """
+    sources = find_iframe_sources(driver, page_url, soup)
+    cookie_header = '; '.join(f"{cookie['name']}={cookie['value']}" for cookie in driver.get_cookies())
+    headers = {'User-Agent': user_agent, 'Referer': page_url}
+    if cookie_header:
+        headers['Cookie'] = cookie_header
+
+    client = http_client.get_client()
+    with ThreadPoolExecutor(max_workers=len(IFRAME_IDS)) as executor:
+        futures = {
+            iframe_id: executor.submit(fetch_iframe_text, client, iframe_url, headers)
+            for iframe_id, iframe_url in sources.items() if iframe_url
+        }
+
+    duties_and_qualifications = {}
+    for key, iframe_id in IFRAME_IDS.items():
+        future = futures.get(iframe_id)
+        try:
+            if future is None:
+                raise ValueError("iframe 주소를 찾지 못했습니다.")
+            duties_and_qualifications[key] = future.result().strip()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"⚠️ iframe '{iframe_id}'을 HTTP로 가져오지 못해 브라우저에서 읽습니다: {e}")
+            duties_and_qualifications[key] = scrape_iframe_content(driver, iframe_id)
+
+    return duties_and_qualifications
+
+
 
 def create_dataframe_and_save(data, filename="job_details_test.csv"):
     df = pd.DataFrame(data)
@@ -299,108 +556,237 @@ def create_dataframe_and_save(data, filename="job_details_test.csv"):
     return df
 
 
-# --- 최종 실행 코드 ---
-if __name__ == "__main__":
-    
-    # 파일 경로 설정
-    file_path = 'C:/Users/nezumi/Documents/code/'
-    input_file = 'gamejob.csv'
-    full_path = os.path.join(file_path, input_file)
-    
-   
-    df_existing = pd.read_csv(full_path)
-    valid_urls_df = df_existing[df_existing['URL'].str.startswith('http', na=False)].copy()
-   
-    df_existing.dropna(subset=['URL'], inplace=True)
+# --- 드라이버 생성 ---
+def create_driver():
+    # User-Agent는 페이지마다 CDP로 바꾸므로 기본값을 사용하고, 자동화 표시는 숨김
+    return browser_profile.create_driver(user_agent=None, stealth=True,
+                                         extra_arguments=("--aggressive-cache-discard",))  # 적극적 캐시 정리
+
 
-    # 💡 재개 지점 설정 (여기를 수정하세요!)
-    # 이미 130개를 크롤링했다면, 131번째 URL부터 시작해야 합니다.
-    # 인덱스는 0부터 시작하므로 130번째 인덱스부터 시작합니다.
-    start_index_to_resume = 0
+# --- URL 하나 크롤링 ---
+def crawl_url(url, driver):
+    """
+    URL 하나를 크롤링해 저장할 레코드를 반환합니다.
+
+    Returns:
+        tuple: (레코드 dict, 상태 문자열)
+    """
+    if 'gamejob.co.kr' not in url:
+        return {'URL': url, '오류': '도메인 불일치로 건너뜀'}, 'skipped'
 
-    urls_to_crawl_df = valid_urls_df.iloc[start_index_to_resume:].copy()
-    logger.info("❌ 처음부터 크롤링을 시작합니다.")
+    result = scrape_all_job_details(url, driver)
+    if result['status'] == 'success':
+        return result['content'], result['status']
+    return {'URL': url, '오류': result['content']}, result['status']
 
-    total_urls = len(urls_to_crawl_df)
 
-    if total_urls == 0:
-        logger.info("✅ 모든 URL을 이미 크롤링했습니다.")
-        exit()
+def log_result(position, total_urls, url, status, record):
+    if status == 'success':
+        logger.info(f"[{position+1}/{total_urls}] ✅ 성공적으로 크롤링 완료.")
+    elif status == 'skipped':
+        logger.warning(f"[{url}] ⚠️ 도메인 불일치로 건너뜀.")
+    else:
+        logger.warning(f"[{position+1}/{total_urls}] ⚠️ 크롤링 실패: {record['오류']}")
 
-    chunk_size = 100 # 💡 청크 사이즈를 100으로 늘려 안정성 향상
-    total_chunks = (total_urls + chunk_size - 1) // chunk_size
 
-    all_crawled_data = []
+def is_completed(status):
+    # 도메인 불일치는 다시 시도해도 결과가 같으므로 완료로 기록
+    return status in ('success', 'skipped')
 
 
+# --- 순차 크롤링 (드라이버 하나) ---
+def crawl_sequential(urls, journal):
+    """
+    드라이버 하나로 URL을 순서대로 크롤링하고, 결과를 하나씩 저널에 기록합니다.
+    """
+    total_urls = len(urls)
+    driver = create_driver()
     try:
-        chrome_options = Options()
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        # 불필요한 모든 기능 비활성화
-        chrome_options.add_argument("--disable-images")  # 이미지 차단
-        chrome_options.add_argument("--disable-background-networking")  # 백그라운드 네트워킹 차단
-        chrome_options.add_argument("--aggressive-cache-discard")  # 적극적 캐시 정리
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        # 💡 추가된 코드: 브라우저 지문 위장
-        # 브라우저가 자동화되고 있음을 알리는 내부 플래그를 비활성화합니다.
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        # 웹 드라이버가 활성화될 때 자동으로 추가되는 '자동화(automation)' 스위치를 제거
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        # '자동화 확장 프로그램'을 사용하지 않도록 설정하여 봇 감지를 회피
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        for i in range(total_chunks):
-            start_index = i * chunk_size
-            end_index = start_index + chunk_size
-            df_chunk = urls_to_crawl_df.iloc[start_index:end_index]
-            
-            logger.info(f"\n--- 현재 {i+1}/{total_chunks}번째 묶음 처리 중 (총 {len(df_chunk)}개) ---")
+        for position, url in enumerate(urls):
+            record, status = crawl_url(url, driver)
+            journal.append(url, record, ok=is_completed(status))
+            log_result(position, total_urls, url, status, record)
+
+            if status == 'webdriver_error':
+                # 드라이버가 죽었을 수 있으므로 새로 띄움
+                driver.quit()
+                driver = create_driver()
+            elif not is_completed(status):
+                time.sleep(3) # 오류 발생 시 잠시 대기
+    finally:
+        driver.quit()
 
-            # for idx, row in df_chunk.iterrows():
-            for idx, row in df_chunk.iterrows():
 
-                url = row['URL']
-                
-                if 'gamejob.co.kr' in url:
-                    result = scrape_all_job_details(url, driver) 
-                    
-                    if result['status'] == 'success':
-                        all_crawled_data.append(result['content'])
-                        logger.info(f"[{idx+1}/{total_urls}] ✅ 성공적으로 크롤링 완료.")
-                    else:
-                        all_crawled_data.append({'URL': url, '오류': result['content']})
-                        logger.warning(f"[{idx+1}/{total_urls}] ⚠️ 크롤링 실패: {result['content']}")
-                        time.sleep(3) # 오류 발생 시 잠시 대기
-                else:
-                    all_crawled_data.append({'URL': url, '오류': '도메인 불일치로 건너뜀'})
-                    logger.warning(f"[{url}] ⚠️ 도메인 불일치로 건너뜀.")
-            
-            # 중간 저장
-            intermediate_df = pd.DataFrame(all_crawled_data)
-            intermediate_df.to_csv(os.path.join(file_path, f'intermediate_crawled_data_retry_{i+1}.csv'), index=False, encoding='utf-8-sig')
-
-            logger.info(f"✅ {len(all_crawled_data)}개 데이터 중간 저장 완료.")
-            random_wait_time = random.uniform(1, 2)
-            time.sleep(random_wait_time) # 묶음 처리 후 추가 대기
-
-        # driver.quit()
-        
-        # df_scraped_final = pd.DataFrame(all_crawled_data)
-        # final_df = pd.merge(df_existing, df_scraped_final, left_on='URL', right_on='URL', how='left', suffixes=('', '_crawled'))
-        
-        # output_file = 'merged_job_postings_9218_final_final_(09_17).csv'
-        # output_path = os.path.join(file_path, output_file)
-        # final_df.to_csv(output_path, index=False, encoding='utf-8-sig')
-        
-        logger.info("✅ 최종 데이터 저장 완료!")
+# --- 멀티 프로세스 크롤링 ---
+def available_memory_mb():
+    """
+    현재 사용 가능한 메모리(MB)를 반환합니다. 알 수 없으면 None.
+    """
+    try:
+        import psutil
+        return psutil.virtual_memory().available / (1024 * 1024)
+    except ImportError:
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def default_num_workers(memory_per_worker_mb=MEMORY_PER_WORKER_MB):
+    """
+    CPU 코어 수와 여유 메모리를 기준으로 워커 수를 정합니다. (최대 MAX_AUTO_WORKERS개)
+    """
+    cpu_workers = min(os.cpu_count() or 1, MAX_AUTO_WORKERS)
+    memory_mb = available_memory_mb()
+    if memory_mb is None:
+        return cpu_workers
+    return max(1, min(cpu_workers, int(memory_mb // memory_per_worker_mb)))
 
+
+def crawl_shard(worker_id, shard, total_urls, result_queue, num_workers=1):
+    """
+    워커 프로세스에서 실행됩니다. 자기 드라이버로 shard를 크롤링하고 결과를 (원래 순번, 레코드)로 보냅니다.
+
+    Args:
+        worker_id (int): 워커 번호.
+        shard (list): (원래 순번, URL) 목록.
+        total_urls (int): 전체 URL 수 (로그용).
+        num_workers (int): 전체 워커 수. 페이지 요청 속도 PAGE_RATE를 워커 수로 나눠 씀.
+        result_queue (multiprocessing.Queue): 결과를 보낼 큐. (원래 순번, 레코드, 상태)를 보내고,
+            끝나면 (None, 워커 번호, 이 워커의 지표)를 보냅니다.
+    """
+    global page_bucket
+    logging.basicConfig(level=logging.INFO, format=f'[worker {worker_id}] %(levelname)s %(message)s', force=True)
+    page_bucket = TokenBucket(PAGE_RATE / num_workers)
+    start_time = time.time()
+    processed = 0
+    driver = None
+
+    try:
+        driver = create_driver()
+        for position, url in shard:
+            record, status = crawl_url(url, driver)
+            result_queue.put((position, record, status))
+            log_result(position, total_urls, url, status, record)
+            processed += 1
+
+            if status == 'webdriver_error':
+                # 드라이버가 죽었을 수 있으므로 새로 띄움
+                driver.quit()
+                driver = create_driver()
+            elif not is_completed(status):
+                time.sleep(3) # 오류 발생 시 잠시 대기
+
+            if processed % THROUGHPUT_LOG_INTERVAL == 0:
+                elapsed = time.time() - start_time
+                logger.info(f"📊 {processed}/{len(shard)}건 처리 ({processed / elapsed:.2f}건/초)")
     except Exception as e:
-        logger.error(f"예상치 못한 최종 오류가 발생했습니다: {e}")
+        logger.error(f"❌ 워커 오류 발생: {e}")
     finally:
-        if 'driver' in locals() and driver:
-            driver.quit()
\ No newline at end of file
+        if driver:
+            driver.quit()
+        elapsed = time.time() - start_time
+        logger.info(f"🏁 워커 종료: {processed}/{len(shard)}건, {elapsed:.1f}초 ({processed / max(elapsed, 1e-9):.2f}건/초)")
+        result_queue.put((None, worker_id, crawl_metrics.registry.export()))
+
+
+def crawl_sharded(urls, journal, num_workers=None):
+    """
+    URL을 num_workers개의 프로세스에 나눠 크롤링합니다. 결과는 도착하는 대로 메인 프로세스에서 저널에 기록합니다.
+    URL은 라운드 로빈으로 나누어 워커마다 비슷한 양과 비슷한 구간의 페이지를 받습니다.
+    """
+    total_urls = len(urls)
+    num_workers = max(1, min(num_workers or default_num_workers(), total_urls))
+    logger.info(f"🚀 {num_workers}개 워커 프로세스로 {total_urls}건을 크롤링합니다. "
+                f"(전체 초당 {PAGE_RATE}페이지, 워커마다 {PAGE_RATE / num_workers:.2f}페이지)")
+
+    indexed_urls = list(enumerate(urls))
+    shards = [indexed_urls[worker_id::num_workers] for worker_id in range(num_workers)]
+
+    result_queue = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(target=crawl_shard, args=(worker_id, shard, total_urls, result_queue, num_workers),
+                                daemon=True)
+        for worker_id, shard in enumerate(shards)
+    ]
+    start_time = time.time()
+    for worker in workers:
+        worker.start()
+
+    finished = set()
+    collected = 0
+    while len(finished) < num_workers:
+        try:
+            position, payload, status = result_queue.get(timeout=10)
+        except queue.Empty:
+            # 종료 신호 없이 죽은 워커가 있으면 더 기다리지 않음 (처리하지 못한 URL은 다음 실행에서 이어서 크롤링)
+            dead = {worker_id for worker_id, worker in enumerate(workers) if not worker.is_alive() and worker_id not in finished}
+            if dead and result_queue.empty():
+                logger.error(f"❌ 비정상 종료된 워커: {sorted(dead)}")
+                finished |= dead
+            continue
+
+        if position is None:
+            finished.add(payload)
+            crawl_metrics.registry.merge(status)   # 종료 신호에는 워커의 지표가 담겨 있음
+            continue
+
+        journal.append(urls[position], payload, ok=is_completed(status))
+        collected += 1
+
+    for worker in workers:
+        worker.join()
+
+    elapsed = time.time() - start_time
+    logger.info(f"📊 전체 {collected}/{total_urls}건, {elapsed:.1f}초 ({collected / max(elapsed, 1e-9):.2f}건/초)")
+
+
+# --- 최종 실행 코드 ---
+if __name__ == "__main__":
+    
+    # 파일 경로 설정
+    file_path = 'C:/Users/nezumi/Documents/code/'
+    input_file = 'gamejob.csv'
+    output_file = f'gamejob_detail_data.{OUTPUT_FORMAT}'
+    journal_file = 'gamejob_crawl_journal.jsonl'
+    full_path = os.path.join(file_path, input_file)
+    
+   
+    df_existing = pd.read_csv(full_path, usecols=['URL'])   # URL 컬럼만 읽음
+    valid_urls_df = df_existing[df_existing['URL'].str.startswith('http', na=False)].copy()
+    # 같은 공고 URL이 여러 번 있으면 처음 나온 순서만 남김 (최종 파일에 같은 행이 중복되지 않도록)
+    urls = list(dict.fromkeys(valid_urls_df['URL'].tolist()))
+    if len(urls) < len(valid_urls_df):
+        logger.info(f"🔁 중복된 URL {len(valid_urls_df) - len(urls)}건을 제외했습니다.")
+
+    # 💡 저널에 이미 기록된 URL은 건너뛰고 이어서 크롤링 (실패한 URL은 다시 시도)
+    stop_metrics_dump = crawl_metrics.registry.start_periodic_dump(os.path.join(file_path, METRICS_PREFIX), crawl_metrics.DUMP_INTERVAL)
+    with CrawlJournal(os.path.join(file_path, journal_file)) as journal:
+        completed = journal.completed_keys()
+        urls_to_crawl = [url for url in urls if url not in completed]
+
+        if completed:
+            logger.info(f"🔁 저널에 기록된 {len(completed)}건을 건너뛰고 {len(urls_to_crawl)}건을 이어서 크롤링합니다.")
+        else:
+            logger.info("❌ 처음부터 크롤링을 시작합니다.")
+
+        try:
+            if not urls_to_crawl:
+                logger.info("✅ 모든 URL을 이미 크롤링했습니다.")
+            elif CRAWL_MODE == 'sharded':
+                crawl_sharded(urls_to_crawl, journal, NUM_WORKERS)
+            else:
+                crawl_sequential(urls_to_crawl, journal)
+
+            # 최종 CSV는 입력 순서대로 저널에서 만듦
+            with crawl_metrics.timer('gamejob', 'write'):
+                journal.materialize(urls, os.path.join(file_path, output_file), dictionary_columns=DICTIONARY_COLUMNS)
+            logger.info("✅ 최종 데이터 저장 완료!")
+
+        except Exception as e:
+            logger.error(f"예상치 못한 최종 오류가 발생했습니다: {e}")
+
+    stop_metrics_dump.set()
+    logger.info(crawl_metrics.registry.summary())
+    logger.info(f"단계별 지표를 저장했습니다: {', '.join(crawl_metrics.registry.dump(os.path.join(file_path, METRICS_PREFIX)))}")
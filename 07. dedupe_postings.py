@@ -0,0 +1,302 @@
+import os
+import re
+import time
+import unicodedata
+import zlib
+from collections import defaultdict
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+# --- 변수 설정 ---
+# 💡 네 스크래퍼의 출력 파일을 읽어 같은 공고가 여러 사이트에 올라온 경우를 묶습니다.
+# 출력 파일 이름(확장자 제외)과 컬럼 매핑. 후보 컬럼 중 파일에 있는 첫 번째 컬럼을 사용합니다.
+SOURCES = {
+    'jumpit': {
+        'file': 'jumpit_full_data',
+        'key': ('id',),
+        'company': ('companyName',),
+        'title': ('title',),
+        'text': ('주요업무', '자격요건', '우대사항'),
+    },
+    'wanted': {
+        'file': 'wanted_full_job_data',
+        'key': ('id',),
+        'company': ('company_name',),
+        'title': ('position',),
+        'text': ('main_tasks', 'requirements', 'preferred_points'),
+    },
+    'jobkorea': {
+        'file': 'jobkorea_all_listings',
+        'key': ('상세페이지_URL', 'URL'),
+        'company': ('회사명',),
+        'title': ('제목',),
+        'text': ('모집분야', '스킬', '핵심역량', '우대조건'),
+    },
+    'gamejob': {
+        'file': 'gamejob_detail_data',
+        'key': ('URL',),
+        'company': ('회사명', '기업명'),
+        'title': ('제목', '공고명', '모집분야'),
+        'text': ('담당업무', '자격조건', '해당키워드'),
+    },
+}
+output_file = 'duplicate_clusters.csv'
+
+NUM_PERM = 128              # MinHash 서명 길이
+BANDS = 32                  # LSH 밴드 수 (밴드당 행 수 = NUM_PERM / BANDS)
+SIMILARITY_THRESHOLD = 0.5  # 후보 쌍을 중복으로 인정할 추정 자카드 유사도
+SHINGLE_SIZE = 4            # 문자 n-gram 크기 (한글은 띄어쓰기가 사이트마다 달라서 단어 대신 문자 단위)
+MAX_TEXT_CHARS = 2000       # 설명 텍스트는 앞부분만 사용
+PAIRWISE_BUCKET_SIZE = 50   # 버킷 크기가 이 이하이면 버킷 안의 모든 쌍을 비교
+MAX_BUCKET_ANCHORS = 20     # 더 큰 버킷에서 기준 공고를 바꿔 가며 비교하는 최대 횟수
+
+# (a * x + b) mod P 해시에 쓰는 2^32보다 큰 소수. x, a, b가 모두 2^32 미만이라 uint64에서 넘치지 않음
+_PRIME = (1 << 32) + 15
+_rng = np.random.default_rng(1)
+_PERM_A = _rng.integers(1, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.integers(0, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+
+# 회사명에서 지우는 법인 형태 표기
+COMPANY_SUFFIX_PATTERN = re.compile(
+    r'주식회사|유한회사|유한책임회사|\(주\)|\(유\)|㈜|'
+    r'\b(?:co\.?,?\s*ltd|corp(?:oration)?|inc|llc|ltd|co)\b\.?'
+)
+# 제목 앞뒤의 [신입], (경력 3년↑) 같은 말머리
+TITLE_TAG_PATTERN = re.compile(r'\[[^\]]*\]|\([^)]*\)|【[^】]*】|<[^>]*>')
+NON_WORD_PATTERN = re.compile(r'[^0-9a-z가-힣]+')
+
+
+# --- 1단계: 정규화 ---
+def normalize_text(text):
+    if text is None or (isinstance(text, float) and np.isnan(text)):
+        return ''
+    return unicodedata.normalize('NFKC', str(text)).lower()
+
+
+def normalize_company(name):
+    """
+    '(주)카카오', '주식회사 카카오', 'Kakao Corp.'처럼 표기가 다른 회사명을 비교할 수 있는 형태로 만듭니다.
+    """
+    name = COMPANY_SUFFIX_PATTERN.sub(' ', normalize_text(name))
+    return NON_WORD_PATTERN.sub('', name)
+
+
+def normalize_title(title):
+    """
+    말머리와 기호를 지우고 공백을 하나로 합칩니다.
+    """
+    title = TITLE_TAG_PATTERN.sub(' ', normalize_text(title))
+    return NON_WORD_PATTERN.sub(' ', title).strip()
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    """
+    공백을 지운 텍스트의 문자 n-gram 집합을 반환합니다.
+    """
+    text = text.replace(' ', '')
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+# --- 2단계: MinHash 서명 ---
+def minhash_signature(shingle_set):
+    """
+    shingle 집합의 MinHash 서명(NUM_PERM개의 최솟값)을 반환합니다.
+    두 서명에서 값이 같은 위치의 비율이 두 집합의 자카드 유사도 추정치입니다.
+    """
+    if not shingle_set:
+        return np.full(NUM_PERM, _PRIME, dtype=np.uint64)
+    hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingle_set),
+                         dtype=np.uint64, count=len(shingle_set))
+    # (shingle 수, NUM_PERM) 행렬에서 열마다 최솟값
+    return ((np.outer(hashes, _PERM_A) + _PERM_B) % _PRIME).min(axis=0)
+
+
+def posting_signature(posting):
+    text = ' '.join((posting['company'], posting['title'], posting['text'][:MAX_TEXT_CHARS]))
+    return minhash_signature(shingles(text))
+
+
+def estimate_similarity(signature_a, signature_b):
+    return float(np.count_nonzero(signature_a == signature_b)) / NUM_PERM
+
+
+# --- 3단계: LSH 인덱스 ---
+class UnionFind:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, item):
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, a, b):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[root_b] = root_a
+
+
+def find_duplicate_clusters(signatures, bands=BANDS, threshold=SIMILARITY_THRESHOLD):
+    """
+    서명을 밴드로 나눠 버킷에 넣고, 같은 버킷에 들어간 공고만 비교해 중복 클러스터를 만듭니다.
+    모든 쌍을 비교하지 않으므로 공고 수에 거의 비례하는 시간이 걸립니다.
+    PAIRWISE_BUCKET_SIZE개 이하인 버킷은 모든 쌍을 비교합니다. 더 큰 버킷은 비교 횟수가 제곱으로 늘지 않도록
+    기준 공고와만 비교하고, 기준과 묶이지 않은 공고 중 첫 번째를 다음 기준으로 삼아 최대 MAX_BUCKET_ANCHORS번 반복합니다.
+    (이 경우 기준이 되지 못한 공고끼리는 이 밴드에서 비교되지 않으므로 다른 밴드에서 만나야 묶임)
+
+    Args:
+        signatures (numpy.ndarray): (공고 수, NUM_PERM) 서명 행렬.
+
+    Returns:
+        tuple: (클러스터 목록(각각 공고 인덱스 리스트, 크기 2 이상), 비교한 후보 쌍 수)
+    """
+    count, num_perm = signatures.shape
+    rows = num_perm // bands
+    groups = UnionFind(count)
+    compared = 0
+    # 실제 해시는 _PRIME으로 나눈 나머지라 _PRIME이 될 수 없으므로, _PRIME이면 빈 shingle 집합의 서명
+    empty = signatures[:, 0] == _PRIME
+
+    def compare(a, b):
+        # 두 공고가 (이미 또는 이번 비교로) 같은 클러스터이면 True
+        nonlocal compared
+        if groups.find(a) == groups.find(b):
+            return True
+        compared += 1
+        if estimate_similarity(signatures[a], signatures[b]) >= threshold:
+            groups.union(a, b)
+            return True
+        return False
+
+    for band in range(bands):
+        buckets = defaultdict(list)
+        band_values = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+        for index in range(count):
+            # 빈 공고는 서명이 모두 _PRIME으로 같으므로 버킷에 넣지 않음 (빈 공고끼리 묶이지 않도록)
+            if not empty[index]:
+                buckets[band_values[index].tobytes()].append(index)
+
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            if len(members) <= PAIRWISE_BUCKET_SIZE:
+                for a, b in combinations(members, 2):
+                    compare(a, b)
+                continue
+            # 큰 버킷: 기준 공고와 묶이지 않은 공고만 남겨 다음 기준과 비교
+            remaining = members
+            for _ in range(MAX_BUCKET_ANCHORS):
+                if len(remaining) < 2:
+                    break
+                anchor = remaining[0]
+                remaining = [other for other in remaining[1:] if not compare(anchor, other)]
+
+    clusters = defaultdict(list)
+    for index in range(count):
+        clusters[groups.find(index)].append(index)
+    return [members for members in clusters.values() if len(members) > 1], compared
+
+
+# --- 데이터 불러오기 ---
+def first_column(df, candidates):
+    for column in candidates:
+        if column in df.columns:
+            return column
+    return None
+
+
+def load_postings(source, config):
+    """
+    스크래퍼 출력 파일(.parquet 또는 .csv)에서 중복 판별에 필요한 필드만 읽습니다.
+
+    Returns:
+        list: {'source', 'key', 'company', 'title', 'text'} 딕셔너리 목록.
+    """
+    for extension in ('parquet', 'csv'):
+        path = f"{config['file']}.{extension}"
+        if os.path.exists(path):
+            break
+    else:
+        print(f"⚠️ {source}: {config['file']}.parquet/.csv 파일이 없어 건너뜁니다.")
+        return []
+
+    df = pd.read_parquet(path) if path.endswith('.parquet') else pd.read_csv(path)
+    key_column = first_column(df, config['key'])
+    company_column = first_column(df, config['company'])
+    title_column = first_column(df, config['title'])
+    text_columns = [column for column in config['text'] if column in df.columns]
+    if not title_column:
+        print(f"⚠️ {source}: 제목 컬럼이 없어 건너뜁니다. ({path})")
+        return []
+
+    keys = df[key_column] if key_column else range(len(df))
+    companies = df[company_column] if company_column else [''] * len(df)
+    texts = zip(*(df[column] for column in text_columns)) if text_columns else [()] * len(df)
+
+    postings = []
+    skipped = 0
+    for key, company, title, text in zip(keys, companies, df[title_column], texts):
+        title = normalize_title(title)
+        text = ' '.join(normalize_text(value) for value in text).strip()
+        # 제목과 본문이 모두 비어 있는 행(수집 실패 등)은 비교할 내용이 없으므로 제외
+        if not title and not text:
+            skipped += 1
+            continue
+        postings.append({
+            'source': source,
+            'key': key,
+            'company': normalize_company(company),
+            'title': title,
+            'text': text,
+        })
+
+    print(f"✔️ {source}: {len(postings)}개 공고를 '{path}'에서 불러왔습니다."
+          + (f" (제목/본문이 비어 있는 {skipped}개 제외)" if skipped else ""))
+    return postings
+
+
+# --- 결과 저장 ---
+def save_clusters(postings, clusters, output_file):
+    rows = []
+    for cluster_id, members in enumerate(clusters, start=1):
+        for index in members:
+            posting = postings[index]
+            rows.append({
+                'cluster_id': cluster_id,
+                'source': posting['source'],
+                'key': posting['key'],
+                'company': posting['company'],
+                'title': posting['title'],
+            })
+    df = pd.DataFrame(rows, columns=['cluster_id', 'source', 'key', 'company', 'title'])
+    df.to_csv(output_file, index=False, encoding='utf-8-sig')
+    return df
+
+
+if __name__ == '__main__':
+    start_time = time.perf_counter()
+
+    postings = []
+    for source, config in SOURCES.items():
+        postings.extend(load_postings(source, config))
+
+    if not postings:
+        print("❌ 불러온 공고가 없습니다. 스크래퍼를 먼저 실행해 주세요.")
+    else:
+        signatures = np.vstack([posting_signature(posting) for posting in postings])
+        clusters, compared = find_duplicate_clusters(signatures)
+
+        cross_source = [members for members in clusters
+                        if len({postings[index]['source'] for index in members}) > 1]
+        df = save_clusters(postings, clusters, output_file)
+
+        print("====================================")
+        print(f"공고 {len(postings)}개에서 중복 클러스터 {len(clusters)}개를 찾았습니다. "
+              f"(여러 사이트에 걸친 클러스터 {len(cross_source)}개, 비교한 후보 쌍 {compared}개)")
+        print(f"결과를 '{output_file}' 파일에 저장했습니다. ({len(df)}행)")
+        print(f"소요 시간: {time.perf_counter() - start_time:.1f}초")
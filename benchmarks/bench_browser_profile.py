@@ -0,0 +1,68 @@
+"""
+브라우저 프로필(리소스 차단 + eager 로딩) 효과 측정.
+
+같은 상세 페이지들을 프로필을 끈 상태(기존 옵션: normal 로딩, 차단 없음)와 켠 상태로 열어
+페이지당 전송 바이트와 로딩 시간을 비교합니다. Chrome과 네트워크가 필요합니다.
+
+사용법:
+    python benchmarks/bench_browser_profile.py URL [URL ...] [--repeat 3] [--block-stylesheets]
+"""
+import argparse
+import os
+import statistics
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import browser_profile
+
+PROFILES = {
+    'off': {'page_load_strategy': 'normal', 'block_resources': False},
+    'on': {'page_load_strategy': 'eager', 'block_resources': True},
+}
+
+
+def run_profile(urls, repeat, settings):
+    browser_profile.configure(**settings)
+    driver = browser_profile.create_driver()
+    samples = []
+    try:
+        for url in urls:
+            for _ in range(repeat):
+                # 캐시 효과를 빼기 위해 매번 브라우저 캐시를 비움
+                driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+                samples.append(browser_profile.measure_page_load(driver, url))
+    finally:
+        driver.quit()
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="브라우저 프로필 on/off 전송량 및 로딩 시간 비교")
+    parser.add_argument('urls', nargs='+')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--block-stylesheets', action='store_true')
+    args = parser.parse_args()
+
+    browser_profile.configure(block_stylesheets=args.block_stylesheets)
+
+    results = {name: run_profile(args.urls, args.repeat, settings) for name, settings in PROFILES.items()}
+
+    print(f"{'프로필':<8}{'KB/page':>12}{'요청 수':>10}{'get ms':>10}{'DCL ms':>10}")
+    for name, samples in results.items():
+        kilobytes = statistics.mean(sample['bytes_transferred'] for sample in samples) / 1024
+        resources = statistics.mean(sample['resource_count'] for sample in samples)
+        get_ms = statistics.median(sample['get_ms'] for sample in samples)
+        dcl_ms = statistics.median(sample['dom_content_loaded_ms'] or 0 for sample in samples)
+        print(f"{name:<8}{kilobytes:>12.1f}{resources:>10.1f}{get_ms:>10.0f}{dcl_ms:>10.0f}")
+
+    off_bytes = statistics.mean(sample['bytes_transferred'] for sample in results['off'])
+    on_bytes = statistics.mean(sample['bytes_transferred'] for sample in results['on'])
+    if off_bytes:
+        print(f"\n전송량 {1 - on_bytes / off_bytes:.1%} 감소")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
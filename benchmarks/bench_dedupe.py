@@ -0,0 +1,130 @@
+"""
+MinHash/LSH 중복 판별 확장성 벤치마크.
+
+여러 사이트에 같은 공고를 제목/회사명 표기만 조금 바꿔 올린 합성 데이터를 크기별로 만들어
+서명 생성과 LSH 클러스터링 시간, 비교한 후보 쌍 수, 심어 둔 중복의 재현율을 측정합니다.
+작은 크기에서는 모든 쌍을 비교하는 방식의 시간도 함께 재서 차이를 보여줍니다. 네트워크는 사용하지 않습니다.
+
+사용법:
+    python benchmarks/bench_dedupe.py [--sizes 1000,5000,20000] [--duplicate-rate 0.2] [--pairwise-limit 3000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import numpy as np
+
+from script_loader import load_script
+
+dedupe = load_script('07. dedupe_postings.py')
+
+SOURCES = ['jumpit', 'wanted', 'jobkorea', 'gamejob']
+ROLES = ['백엔드 개발자', '프론트엔드 개발자', '데이터 엔지니어', '머신러닝 엔지니어', 'DevOps 엔지니어',
+         '안드로이드 개발자', 'iOS 개발자', '게임 클라이언트 프로그래머', 'QA 엔지니어', '보안 엔지니어']
+TAGS = ['[신입]', '[경력]', '(3년 이상)', '(정규직)', '[채용연계]', '']
+SUFFIXES = ['(주){}', '주식회사 {}', '{} 주식회사', '㈜{}', '{}']
+WORDS = ('서비스 플랫폼 트래픽 설계 운영 개발 배포 자동화 파이프라인 모니터링 성능 개선 데이터 분석 모델 '
+         '학습 추론 결제 검색 추천 광고 로그 수집 클라우드 인프라 보안 인증 테스트 코드 리뷰 협업 문서화').split()
+
+
+def make_posting(rng, posting_id):
+    company = f"회사{rng.randrange(3000)}"
+    return {
+        'source': rng.choice(SOURCES),
+        'key': posting_id,
+        'company': company,
+        'title': f"{rng.choice(ROLES)} {rng.choice(WORDS)}",
+        'text': ' '.join(rng.choice(WORDS) for _ in range(rng.randint(60, 150))),
+    }
+
+
+def make_variant(rng, posting, posting_id):
+    # 다른 사이트에 올라온 같은 공고: 회사명 표기/말머리가 다르고 설명 일부가 바뀜
+    words = posting['text'].split()
+    for _ in range(len(words) // 20):
+        words[rng.randrange(len(words))] = rng.choice(WORDS)
+    return {
+        'source': rng.choice([source for source in SOURCES if source != posting['source']]),
+        'key': posting_id,
+        'company': rng.choice(SUFFIXES).format(posting['company']),
+        'title': f"{rng.choice(TAGS)} {posting['title']}",
+        'text': ' '.join(words),
+    }
+
+
+def make_dataset(size, duplicate_rate, seed=1):
+    rng = random.Random(seed)
+    postings, pairs = [], []
+    while len(postings) < size:
+        posting = make_posting(rng, len(postings))
+        postings.append(posting)
+        if rng.random() < duplicate_rate and len(postings) < size:
+            pairs.append((len(postings) - 1, len(postings)))
+            postings.append(make_variant(rng, posting, len(postings)))
+
+    # 로더가 하는 정규화를 똑같이 적용
+    for posting in postings:
+        posting['company'] = dedupe.normalize_company(posting['company'])
+        posting['title'] = dedupe.normalize_title(posting['title'])
+        posting['text'] = dedupe.normalize_text(posting['text'])
+    return postings, pairs
+
+
+def pairwise_time(signatures):
+    start = time.perf_counter()
+    for i in range(len(signatures)):
+        # 한 공고와 나머지 모든 공고를 비교 (벡터화해도 O(n^2))
+        np.count_nonzero(signatures[i + 1:] == signatures[i], axis=1)
+    return time.perf_counter() - start
+
+
+def run(size, duplicate_rate, pairwise_limit):
+    postings, pairs = make_dataset(size, duplicate_rate)
+
+    start = time.perf_counter()
+    signatures = np.vstack([dedupe.posting_signature(posting) for posting in postings])
+    signature_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    clusters, compared = dedupe.find_duplicate_clusters(signatures)
+    lsh_time = time.perf_counter() - start
+
+    cluster_of = {index: cluster_id for cluster_id, members in enumerate(clusters) for index in members}
+    found = sum(1 for a, b in pairs if a in cluster_of and cluster_of.get(a) == cluster_of.get(b))
+    false_members = sum(len(members) for members in clusters) - 2 * found
+
+    return {
+        'size': len(postings),
+        'signature_s': signature_time,
+        'lsh_s': lsh_time,
+        'compared': compared,
+        'all_pairs': len(postings) * (len(postings) - 1) // 2,
+        'recall': found / len(pairs) if pairs else 1.0,
+        'false_members': false_members,
+        'pairwise_s': pairwise_time(signatures) if len(postings) <= pairwise_limit else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MinHash/LSH 중복 판별 확장성 측정")
+    parser.add_argument('--sizes', default='1000,2000,5000,10000,20000')
+    parser.add_argument('--duplicate-rate', type=float, default=0.2)
+    parser.add_argument('--pairwise-limit', type=int, default=5000, help="이 크기 이하에서만 전체 쌍 비교 시간 측정")
+    args = parser.parse_args()
+
+    print(f"{'공고 수':>8}{'서명 s':>9}{'LSH s':>8}{'후보 쌍':>10}{'전체 쌍':>14}{'재현율':>8}{'오탐':>6}{'전체 비교 s':>12}")
+    for size in (int(value) for value in args.sizes.split(',')):
+        result = run(size, args.duplicate_rate, args.pairwise_limit)
+        pairwise = f"{result['pairwise_s']:.2f}" if result['pairwise_s'] is not None else '-'
+        print(f"{result['size']:>8}{result['signature_s']:>9.2f}{result['lsh_s']:>8.2f}{result['compared']:>10}"
+              f"{result['all_pairs']:>14}{result['recall']:>8.1%}{result['false_members']:>6}{pairwise:>12}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
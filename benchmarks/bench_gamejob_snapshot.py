@@ -0,0 +1,101 @@
+"""
+게임잡 상세 페이지 추출 방식 비교 벤치마크.
+
+    - snapshot: page_source를 한 번 받아 로컬 파서로 추출 (scrape_*_from_soup)
+    - webdriver: 요소마다 WebDriver를 호출해 추출 (scrape_dates, scrape_gib_outline)
+
+기본으로는 snapshot 방식의 페이지당 파싱+추출 시간만 잽니다.
+--browser를 주면 저장해 둔 페이지를 headless Chrome으로 열어 두 방식의 결과가 같은지 확인하고 시간을 비교합니다.
+
+사용법:
+    python benchmarks/bench_gamejob_snapshot.py [--pages benchmarks/fixtures/gamejob] [--repeat 20] [--browser]
+"""
+import argparse
+import glob
+import os
+import pathlib
+import statistics
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from html_parser import parse_html
+from script_loader import load_script
+
+
+def extract_snapshot(gamejob, html):
+    soup = parse_html(html, gamejob.SNAPSHOT_BACKEND)
+    details = gamejob.scrape_dates_from_soup(soup)
+    details.update(gamejob.scrape_gib_outline_from_soup(soup))
+    return details
+
+
+def extract_webdriver(gamejob, driver):
+    details = gamejob.scrape_dates(driver)
+    details.update(gamejob.scrape_gib_outline(driver))
+    return details
+
+
+def median_time(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게임잡 상세 페이지 snapshot/webdriver 추출 비교")
+    parser.add_argument('--pages', default=os.path.join(ROOT_DIR, 'benchmarks', 'fixtures', 'gamejob'))
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--browser', action='store_true', help="Chrome으로 webdriver 방식과 비교")
+    args = parser.parse_args()
+
+    gamejob = load_script('06. gamejob_detail_data.py')
+    # iframe 본문 파일은 제외하고 상세 페이지만 사용
+    pages = sorted(page for page in glob.glob(os.path.join(args.pages, '*.html'))
+                   if not os.path.basename(page).startswith(('gi_work_content', 'gi_comment')))
+    if not pages:
+        print(f"⚠️ 저장된 페이지가 없습니다: {args.pages}")
+        return 1
+
+    driver = gamejob.create_driver() if args.browser else None
+    mismatches = 0
+    try:
+        print(f"{'페이지':<28}{'방식':<12}{'ms/page':>10}")
+        for page in pages:
+            with open(page, encoding='utf-8') as f:
+                html = f.read()
+            name = os.path.basename(page)
+
+            snapshot_time = median_time(lambda: extract_snapshot(gamejob, html), args.repeat)
+            print(f"{name:<28}{'snapshot':<12}{snapshot_time * 1000:>10.3f}")
+            if driver is None:
+                continue
+
+            driver.get(pathlib.Path(page).resolve().as_uri())
+            expected = extract_webdriver(gamejob, driver)
+            # 실제 크롤링과 같이 page_source를 받는 시간까지 포함
+            snapshot_result = extract_snapshot(gamejob, driver.page_source)
+            if snapshot_result != expected:
+                diff_keys = sorted(key for key in expected if expected.get(key) != snapshot_result.get(key))
+                print(f"❌ {name} snapshot 결과가 webdriver 결과와 다릅니다: {', '.join(diff_keys)}")
+                mismatches += 1
+
+            webdriver_time = median_time(lambda: extract_webdriver(gamejob, driver), args.repeat)
+            live_snapshot_time = median_time(lambda: extract_snapshot(gamejob, driver.page_source), args.repeat)
+            print(f"{'':<28}{'webdriver':<12}{webdriver_time * 1000:>10.3f}")
+            print(f"{'':<28}{'snapshot*':<12}{live_snapshot_time * 1000:>10.3f}"
+                  f"  ({webdriver_time / live_snapshot_time:.1f}x, *page_source 포함)")
+    finally:
+        if driver:
+            driver.quit()
+
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+점핏 상세 페이지 부분 파싱(partial) vs 전체 파싱(full) 비교 벤치마크.
+
+저장해 둔 상세 페이지마다 두 방식의 추출 결과가 같은지 확인하고,
+페이지당 파싱+추출 시간(중앙값)과 최대 메모리 사용량(tracemalloc peak)을 비교합니다.
+
+사용법:
+    python benchmarks/bench_jumpit_partial_parse.py [--pages benchmarks/fixtures/jumpit] [--repeat 20]
+"""
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import html_parser
+from script_loader import load_script
+
+PARSE_MODES = ('full', 'partial')
+
+
+def measure(parse_detail_page, html, backend, parse_mode, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_detail_page(html, backend, parse_mode)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    parse_detail_page(html, backend, parse_mode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return statistics.median(timings), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="점핏 상세 페이지 부분 파싱 벤치마크")
+    parser.add_argument('--pages', default=os.path.join(ROOT_DIR, 'benchmarks', 'fixtures', 'jumpit'))
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    parse_detail_page = load_script('02. jumpit_detail_data.py').parse_detail_page
+    # 부분 파싱은 BeautifulSoup 백엔드에만 적용됩니다.
+    backends = [backend for backend in html_parser.available_backends() if backend != 'selectolax']
+
+    pages = sorted(glob.glob(os.path.join(args.pages, '*.html')))
+    if not pages:
+        print(f"⚠️ 저장된 페이지가 없습니다: {args.pages}")
+        return 1
+
+    mismatches = 0
+    print(f"{'페이지':<28}{'백엔드':<14}{'방식':<10}{'ms/page':>10}{'peak KB':>10}")
+    for page in pages:
+        with open(page, encoding='utf-8') as f:
+            html = f.read()
+
+        for backend in backends:
+            if parse_detail_page(html, backend, 'partial') != parse_detail_page(html, backend, 'full'):
+                print(f"❌ {os.path.basename(page)} [{backend}] 부분 파싱 결과가 전체 파싱과 다릅니다.")
+                mismatches += 1
+
+            results = {mode: measure(parse_detail_page, html, backend, mode, args.repeat) for mode in PARSE_MODES}
+            for mode, (elapsed, peak) in results.items():
+                print(f"{os.path.basename(page):<28}{backend:<14}{mode:<10}{elapsed * 1000:>10.3f}{peak / 1024:>10.1f}")
+
+            (full_time, full_peak), (partial_time, partial_peak) = results['full'], results['partial']
+            print(f"{'':<28}{'':<14}{'→':<10}{full_time / partial_time:>9.1f}x{full_peak / partial_peak:>9.1f}x")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
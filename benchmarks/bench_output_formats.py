@@ -0,0 +1,110 @@
+"""
+CSV와 Parquet 출력 비교 벤치마크.
+
+점핏 상세 데이터와 같은 모양의 레코드를 만들어 두 형식으로 저장한 뒤,
+분석 작업처럼 일부 컬럼만 읽을 때의 시간과 최대 메모리 사용량(tracemalloc peak), 파일 크기를 비교합니다.
+네트워크는 사용하지 않습니다.
+
+사용법:
+    python benchmarks/bench_output_formats.py [--rows 50000] [--columns companyName,techStacks]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import pandas as pd
+import pyarrow as pa
+
+from record_sinks import ParquetSink
+
+LIST_COLUMNS = ('techStacks', 'locations')
+DICTIONARY_COLUMNS = ('companyName', 'jobCategory', '경력', '학력', '근무지역')
+
+COMPANIES = [f"주식회사 회사{i}" for i in range(800)]
+CATEGORIES = ['서버/백엔드 개발자', '프론트엔드 개발자', '웹 풀스택 개발자', '데이터 엔지니어', 'DevOps/시스템 엔지니어', '안드로이드 개발자']
+STACKS = ['Python', 'Java', 'Spring Boot', 'Django', 'React', 'TypeScript', 'Kotlin', 'AWS', 'Docker', 'Kubernetes', 'MySQL', 'Redis']
+REGIONS = ['서울 강남구', '서울 서초구', '서울 마포구', '경기 성남시', '부산 해운대구']
+TEXT = "대규모 트래픽을 처리하는 백엔드 서비스를 설계하고 운영합니다. " * 6
+
+
+def make_record(position_id, rng):
+    return {
+        'id': position_id,
+        'companyName': rng.choice(COMPANIES),
+        'title': f"백엔드 개발자 채용 {position_id}",
+        'jobCategory': rng.choice(CATEGORIES),
+        'techStacks': rng.sample(STACKS, rng.randint(1, 6)),
+        'minCareer': rng.randint(0, 5),
+        'maxCareer': rng.randint(5, 15),
+        'locations': [rng.choice(REGIONS)],
+        'closedAt': '2025-12-31T23:59:59',
+        '주요업무': TEXT,
+        '자격요건': TEXT,
+        '우대사항': TEXT,
+        '복지 및 혜택': TEXT,
+        '기업/서비스 소개': TEXT,
+        '경력': rng.choice(['신입', '경력 3년 이상', '경력 무관']),
+        '학력': rng.choice(['학력무관', '대졸 이상']),
+        '근무지역': rng.choice(REGIONS),
+    }
+
+
+def measure(read):
+    # Arrow 버퍼는 tracemalloc에 잡히지 않으므로 Arrow 메모리 풀의 사용량을 더함
+    arrow_before = pa.total_allocated_bytes()
+    tracemalloc.start()
+    start = time.perf_counter()
+    df = read()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return df, elapsed, peak + max(pa.total_allocated_bytes() - arrow_before, 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CSV / Parquet 부분 컬럼 읽기 비교")
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--columns', default='companyName,techStacks,근무지역')
+    args = parser.parse_args()
+    columns = args.columns.split(',')
+
+    rng = random.Random(0)
+    records = [make_record(position_id, rng) for position_id in range(args.rows)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, 'records.csv')
+        parquet_path = os.path.join(tmp_dir, 'records.parquet')
+
+        csv_records = [dict(record, **{column: ', '.join(record[column]) for column in LIST_COLUMNS}) for record in records]
+        pd.DataFrame(csv_records).to_csv(csv_path, index=False, encoding='utf-8-sig')
+        with ParquetSink(parquet_path, LIST_COLUMNS, DICTIONARY_COLUMNS) as sink:
+            sink.write_many(records)
+
+        csv_df, csv_time, csv_peak = measure(lambda: pd.read_csv(csv_path, usecols=columns))
+        # CSV는 리스트 필드를 다시 나눠야 같은 결과가 됨
+        for column in LIST_COLUMNS:
+            if column in csv_df.columns:
+                csv_df[column] = csv_df[column].str.split(', ')
+        parquet_df, parquet_time, parquet_peak = measure(lambda: pd.read_parquet(parquet_path, columns=columns))
+
+        print(f"{args.rows}건, 읽은 컬럼: {', '.join(columns)}")
+        print(f"{'형식':<10}{'파일 KB':>12}{'읽기 ms':>10}{'peak KB':>12}")
+        print(f"{'csv':<10}{os.path.getsize(csv_path) / 1024:>12.0f}{csv_time * 1000:>10.1f}{csv_peak / 1024:>12.0f}")
+        print(f"{'parquet':<10}{os.path.getsize(parquet_path) / 1024:>12.0f}{parquet_time * 1000:>10.1f}{parquet_peak / 1024:>12.0f}")
+        print(f"→ 읽기 {csv_time / parquet_time:.1f}x 빠름, 메모리 {csv_peak / max(parquet_peak, 1):.1f}x 적음")
+
+        sample = parquet_df[LIST_COLUMNS[0]].iloc[0] if LIST_COLUMNS[0] in parquet_df.columns else None
+        if sample is not None:
+            print(f"리스트 컬럼 예시 ({LIST_COLUMNS[0]}): {list(sample)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
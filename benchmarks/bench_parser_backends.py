@@ -0,0 +1,99 @@
+"""
+HTML 파서 백엔드 비교 벤치마크.
+
+저장해 둔 상세 페이지로 각 백엔드의 추출 결과가 html.parser 결과와 같은지 확인(parity)하고,
+페이지당 파싱+추출 시간을 비교합니다. 네트워크는 사용하지 않습니다.
+
+사용법:
+    python benchmarks/bench_parser_backends.py [--pages benchmarks/fixtures] [--repeat 20]
+
+페이지 폴더 구조:
+    <pages>/jumpit/*.html     점핏 상세 페이지 (02. jumpit_detail_data.parse_detail_page)
+    <pages>/jobkorea/*.html   잡코리아 상세 페이지 (jobkorea_detail.parse_job_details)
+
+결과가 하나라도 다르면 종료 코드 1을 반환합니다.
+"""
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import html_parser
+from script_loader import load_script
+
+
+def load_extractors():
+    import jobkorea_detail
+
+    jumpit_detail = load_script('02. jumpit_detail_data.py')
+    return {
+        'jumpit': jumpit_detail.parse_detail_page,
+        'jobkorea': jobkorea_detail.parse_job_details,
+    }
+
+
+def time_extractor(extract, html, backend, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract(html, backend)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 파서 백엔드 parity 확인 및 파싱 시간 비교")
+    parser.add_argument('--pages', default=os.path.join(ROOT_DIR, 'benchmarks', 'fixtures'))
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    backends = html_parser.available_backends()
+    print(f"사용 가능한 백엔드: {', '.join(backends)}")
+
+    mismatches = []
+    rows = []
+
+    for source, extract in load_extractors().items():
+        pages = sorted(glob.glob(os.path.join(args.pages, source, '*.html')))
+        if not pages:
+            print(f"⚠️ {source}: 저장된 페이지가 없습니다. ({os.path.join(args.pages, source)})")
+            continue
+
+        for page in pages:
+            with open(page, encoding='utf-8') as f:
+                html = f.read()
+
+            baseline = extract(html, 'html.parser')
+            baseline_time = time_extractor(extract, html, 'html.parser', args.repeat)
+
+            for backend in backends:
+                result = extract(html, backend)
+                if result != baseline:
+                    diff_keys = sorted(key for key in set(result) | set(baseline) if result.get(key) != baseline.get(key))
+                    mismatches.append((source, os.path.basename(page), backend, diff_keys))
+
+                elapsed = baseline_time if backend == 'html.parser' else time_extractor(extract, html, backend, args.repeat)
+                rows.append((source, os.path.basename(page), backend, elapsed, baseline_time / elapsed))
+
+    print("\n--- 페이지당 파싱+추출 시간 (중앙값) ---")
+    print(f"{'소스':<10}{'페이지':<28}{'백엔드':<14}{'ms/page':>10}{'배속':>8}")
+    for source, page, backend, elapsed, speedup in rows:
+        print(f"{source:<10}{page:<28}{backend:<14}{elapsed * 1000:>10.3f}{speedup:>7.1f}x")
+
+    print("\n--- parity ---")
+    if mismatches:
+        for source, page, backend, diff_keys in mismatches:
+            print(f"❌ {source}/{page} [{backend}] 결과가 다릅니다: {', '.join(diff_keys)}")
+        return 1
+
+    print(f"✅ 모든 백엔드의 추출 결과가 html.parser와 같습니다. ({len(rows)}건)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+추출기(parser) 마이크로벤치마크 모음.
+
+저장해 둔 페이지(benchmarks/fixtures)로 각 사이트의 추출 함수를 실행해 페이지당 시간과 메모리 할당량을 잽니다.
+네트워크와 브라우저는 사용하지 않습니다.
+
+    jumpit/parse_detail_page         02. parse_detail_page (position_info 등 상세 영역)
+    wanted/parse_job_detail          03. parse_job_detail (상세 API JSON 디코딩 + 필드 매핑)
+    jobkorea/parse_job_details       jobkorea_detail.parse_job_details (파싱 + 전체 추출)
+    jobkorea/<scrape_*>              jobkorea_detail의 섹션별 추출 함수 (파싱된 soup 기준)
+    jobkorea_list/parse_job_rows     04. parse_job_rows (목록 페이지의 tr.devloopArea 행)
+    gamejob/gib_outline              06. 스냅샷 파싱 + scrape_dates_from_soup + scrape_gib_outline_from_soup
+
+결과는 커밋별로 benchmarks/results/parsers-<커밋>.json에 저장되고,
+--compare로 이전 결과 파일을 주면 항목별 변화율을 함께 출력합니다.
+
+사용법:
+    python benchmarks/bench_parsers.py [--repeat 50] [--filter jobkorea] [--compare benchmarks/results/parsers-abc1234.json]
+"""
+import argparse
+import datetime
+import glob
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from bs4 import BeautifulSoup
+
+from html_parser import parse_html
+from script_loader import load_script
+
+FIXTURES_DIR = os.path.join(ROOT_DIR, 'benchmarks', 'fixtures')
+RESULTS_DIR = os.path.join(ROOT_DIR, 'benchmarks', 'results')
+
+JOBKOREA_SECTIONS = (
+    'scrape_job_title', 'scrape_company_name', 'scrape_recruitment_guidelines_section',
+    'scrape_qualification_section', 'scrape_application_section', 'scrape_company_section',
+)
+
+
+def read_text(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def build_cases():
+    """
+    (이름, fixture 패턴, 준비 함수, 추출 함수) 목록을 만듭니다.
+    준비 함수의 결과가 추출 함수의 입력이며, 준비 시간은 재지 않습니다.
+    """
+    import jobkorea_detail
+
+    jumpit = load_script('02. jumpit_detail_data.py')
+    wanted = load_script('03. wanted_integrated_data.py')
+    jobkorea_list = load_script('04. jobkorea_basic_data.py')
+    gamejob = load_script('06. gamejob_detail_data.py')
+
+    def gamejob_outline(html):
+        soup = parse_html(html, gamejob.SNAPSHOT_BACKEND)
+        details = gamejob.scrape_dates_from_soup(soup)
+        details.update(gamejob.scrape_gib_outline_from_soup(soup))
+        return details
+
+    cases = [
+        ('jumpit/parse_detail_page', 'jumpit/*.html', read_text, jumpit.parse_detail_page),
+        ('wanted/parse_job_detail', 'wanted/*.json', read_text,
+         lambda text: wanted.parse_job_detail(json.loads(text).get('data', {}).get('job', {}))),
+        ('jobkorea/parse_job_details', 'jobkorea/*.html', read_text, jobkorea_detail.parse_job_details),
+    ]
+    for name in JOBKOREA_SECTIONS:
+        cases.append((f'jobkorea/{name}', 'jobkorea/*.html',
+                      lambda path: parse_html(read_text(path)), getattr(jobkorea_detail, name)))
+    cases += [
+        ('jobkorea_list/parse_job_rows', 'jobkorea_list/*.html', read_text,
+         lambda html: jobkorea_list.parse_job_rows(BeautifulSoup(html, 'html.parser'))),
+        ('gamejob/gib_outline', 'gamejob/gi_read*.html', read_text, gamejob_outline),
+    ]
+    return cases
+
+
+def measure(extract, page_input, repeat):
+    """
+    Returns:
+        tuple: (시간 목록(초), 한 번 실행할 때의 tracemalloc 최대 할당량(바이트))
+    """
+    extract(page_input)   # 워밍업 (정규식 캐시, 지연 import 등)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract(page_input)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        extract(page_input)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return timings, peak - baseline
+
+
+def git_revision():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT_DIR,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown', False
+    return commit, dirty
+
+
+def run(cases, repeat, name_filter=None):
+    results = {}
+    for name, pattern, prepare, extract in cases:
+        if name_filter and name_filter not in name:
+            continue
+        pages = sorted(glob.glob(os.path.join(FIXTURES_DIR, pattern)))
+        if not pages:
+            print(f"⚠️ {name}: 저장된 페이지가 없습니다. ({pattern})")
+            continue
+
+        timings, peaks = [], []
+        for page in pages:
+            page_timings, peak = measure(extract, prepare(page), repeat)
+            timings.extend(page_timings)
+            peaks.append(peak)
+
+        results[name] = {
+            'pages': len(pages),
+            'median_ms': statistics.median(timings) * 1000,
+            'min_ms': min(timings) * 1000,
+            'peak_alloc_kb': max(peaks) / 1024,
+        }
+    return results
+
+
+def print_results(results, previous=None):
+    header = f"{'추출기':<48}{'페이지':>6}{'median ms':>11}{'min ms':>9}{'alloc KB':>10}"
+    if previous:
+        header += f"{'시간 변화':>10}{'할당 변화':>10}"
+    print(header)
+
+    for name, result in results.items():
+        line = (f"{name:<48}{result['pages']:>6}{result['median_ms']:>11.3f}"
+                f"{result['min_ms']:>9.3f}{result['peak_alloc_kb']:>10.1f}")
+        before = (previous or {}).get(name)
+        if before:
+            line += f"{result['median_ms'] / before['median_ms'] - 1:>+10.1%}"
+            line += f"{result['peak_alloc_kb'] / before['peak_alloc_kb'] - 1:>+10.1%}" if before['peak_alloc_kb'] else f"{'-':>10}"
+        elif previous:
+            line += f"{'new':>10}{'':>10}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추출기 마이크로벤치마크 (저장된 페이지 기준)")
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--filter', help="이름에 이 문자열이 들어간 추출기만 실행")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON 파일")
+    parser.add_argument('--no-save', action='store_true', help="결과 파일을 저장하지 않음")
+    args = parser.parse_args()
+
+    commit, dirty = git_revision()
+    results = run(build_cases(), args.repeat, args.filter)
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        previous = baseline['results']
+        print(f"비교 기준: {baseline['commit']} ({baseline['timestamp']})")
+    print(f"커밋: {commit}{' (수정 사항 있음)' if dirty else ''}, 반복 {args.repeat}회\n")
+    print_results(results, previous)
+
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"parsers-{commit}{'-dirty' if dirty else ''}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'commit': commit,
+                'dirty': dirty,
+                'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'repeat': args.repeat,
+                'results': results,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n결과를 저장했습니다: {os.path.relpath(path, ROOT_DIR)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
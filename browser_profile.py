@@ -0,0 +1,171 @@
+"""
+Selenium 스크래퍼들이 함께 사용하는 Chrome 프로필.
+
+    - page load strategy 'eager': DOMContentLoaded까지만 기다리고 이미지/광고 로딩은 기다리지 않음
+    - 이미지는 Chrome 설정(prefs, blink-settings)으로 끄고,
+      폰트/동영상/광고/분석 스크립트(+선택적으로 스타일시트)는 CDP Network.setBlockedURLs로 차단
+    - measure_page_load()로 페이지당 전송 바이트와 로딩 시간을 측정해 차단 효과를 확인할 수 있음
+
+설정은 스크립트 시작 시 configure()로 한 번만 바꾸면 모든 드라이버에 적용됩니다.
+"""
+import logging
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+logger = logging.getLogger(__name__)
+
+# --- 변수 설정 ---
+HEADLESS = True
+WINDOW_SIZE = '1920,1080'
+PAGE_LOAD_STRATEGY = 'eager'      # 'normal'이면 모든 리소스가 로딩될 때까지 기다림
+BLOCK_RESOURCES = True            # False면 리소스 차단 없이 기존과 같은 브라우저
+BLOCK_STYLESHEETS = False         # 스타일시트까지 차단 (클릭/표시 여부 판단이 필요한 페이지에서는 끄기)
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.7339.81 Safari/537.36'
+
+# 이미지 (prefs로도 끄지만 CSS background 등으로 요청되는 경우까지 차단)
+IMAGE_URL_PATTERNS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.bmp']
+FONT_URL_PATTERNS = ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot']
+MEDIA_URL_PATTERNS = ['*.mp4', '*.webm', '*.mp3']
+# 광고/분석
+TRACKER_URL_PATTERNS = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*googlesyndication.com*',
+    '*googleadservices.com*', '*adservice.google.*', '*facebook.net*', '*connect.facebook.*',
+    '*criteo.*', '*wcs.naver.net*', '*analytics.kakao.com*', '*t1.daumcdn.net/kas*', '*hotjar.com*',
+    '*clarity.ms*', '*sentry-cdn.com*', '*amplitude.com*', '*mixpanel.com*',
+]
+STYLESHEET_URL_PATTERNS = ['*.css']
+
+
+def configure(headless=None, page_load_strategy=None, block_resources=None, block_stylesheets=None):
+    """
+    모든 드라이버에 적용할 프로필 설정을 바꿉니다. 드라이버를 만들기 전에 호출해야 합니다.
+    """
+    global HEADLESS, PAGE_LOAD_STRATEGY, BLOCK_RESOURCES, BLOCK_STYLESHEETS
+    if headless is not None:
+        HEADLESS = headless
+    if page_load_strategy is not None:
+        PAGE_LOAD_STRATEGY = page_load_strategy
+    if block_resources is not None:
+        BLOCK_RESOURCES = block_resources
+    if block_stylesheets is not None:
+        BLOCK_STYLESHEETS = block_stylesheets
+
+
+def blocked_url_patterns(block_stylesheets=None):
+    """
+    CDP로 차단할 URL 패턴 목록을 반환합니다.
+    """
+    if block_stylesheets is None:
+        block_stylesheets = BLOCK_STYLESHEETS
+    patterns = IMAGE_URL_PATTERNS + FONT_URL_PATTERNS + MEDIA_URL_PATTERNS + TRACKER_URL_PATTERNS
+    if block_stylesheets:
+        patterns = patterns + STYLESHEET_URL_PATTERNS
+    return patterns
+
+
+def build_options(user_agent=DEFAULT_USER_AGENT, stealth=False, extra_arguments=(), block_resources=None):
+    """
+    공통 Chrome 옵션을 만듭니다.
+
+    Args:
+        user_agent (str): User-Agent. None이면 Chrome 기본값 사용.
+        stealth (bool): 자동화 표시(AutomationControlled, enable-automation 스위치 등)를 숨길지 여부.
+        extra_arguments (tuple): 스크립트별로 추가할 Chrome 인자.
+        block_resources (bool): 리소스 차단 여부. None이면 BLOCK_RESOURCES.
+
+    Returns:
+        Options: Chrome 옵션.
+    """
+    if block_resources is None:
+        block_resources = BLOCK_RESOURCES
+
+    chrome_options = Options()
+    if HEADLESS:
+        chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument(f"--window-size={WINDOW_SIZE}")
+    chrome_options.add_argument("--disable-background-networking")  # 백그라운드 네트워킹 차단
+    chrome_options.page_load_strategy = PAGE_LOAD_STRATEGY
+
+    if block_resources:
+        # '--disable-images'는 실제 Chrome 스위치가 아니므로 blink 설정과 콘텐츠 설정으로 이미지를 끔
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
+
+    if user_agent:
+        chrome_options.add_argument(f'user-agent={user_agent}')
+
+    if stealth:
+        # 브라우저가 자동화되고 있음을 알리는 내부 플래그를 비활성화합니다.
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        # 웹 드라이버가 활성화될 때 자동으로 추가되는 '자동화(automation)' 스위치를 제거
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        # '자동화 확장 프로그램'을 사용하지 않도록 설정하여 봇 감지를 회피
+        chrome_options.add_experimental_option("useAutomationExtension", False)
+
+    for argument in extra_arguments:
+        chrome_options.add_argument(argument)
+
+    return chrome_options
+
+
+def apply_resource_blocking(driver, block_stylesheets=None):
+    """
+    CDP로 차단할 URL 패턴을 드라이버에 등록합니다.
+    """
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_url_patterns(block_stylesheets)})
+
+
+def create_driver(user_agent=DEFAULT_USER_AGENT, stealth=False, extra_arguments=(), block_resources=None):
+    """
+    공통 프로필로 Chrome 드라이버를 생성합니다. 인자는 build_options와 같습니다.
+    """
+    if block_resources is None:
+        block_resources = BLOCK_RESOURCES
+
+    driver = webdriver.Chrome(options=build_options(user_agent, stealth, extra_arguments, block_resources))
+    if block_resources:
+        try:
+            apply_resource_blocking(driver)
+        except Exception as e:
+            logger.warning(f"⚠️ 리소스 차단 설정에 실패했습니다. 차단 없이 진행합니다: {e}")
+    return driver
+
+
+# --- 측정 ---
+_PAGE_LOAD_SCRIPT = """
+const navigation = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+let transferred = navigation ? navigation.transferSize : 0;
+for (const entry of resources) { transferred += entry.transferSize || 0; }
+return {
+    dom_content_loaded_ms: navigation ? navigation.domContentLoadedEventEnd - navigation.startTime : null,
+    load_ms: navigation && navigation.loadEventEnd ? navigation.loadEventEnd - navigation.startTime : null,
+    bytes_transferred: transferred,
+    resource_count: resources.length,
+};
+"""
+
+
+def measure_page_load(driver, url):
+    """
+    url을 열고 페이지 로딩 시간과 전송 바이트를 측정합니다.
+    차단된 요청은 Resource Timing에 나타나지 않으므로 바이트 합계에서 빠집니다.
+
+    Returns:
+        dict: dom_content_loaded_ms, load_ms, bytes_transferred, resource_count, get_ms(driver.get이 반환되기까지 걸린 시간)
+    """
+    start = time.perf_counter()
+    driver.get(url)
+    get_ms = (time.perf_counter() - start) * 1000
+
+    metrics = driver.execute_script(_PAGE_LOAD_SCRIPT)
+    metrics['get_ms'] = get_ms
+    return metrics
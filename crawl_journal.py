@@ -0,0 +1,128 @@
+"""
+추가 전용(append-only) 크롤링 저널.
+
+결과가 나올 때마다 JSONL 파일에 한 줄씩 한 번만 기록합니다.
+다시 실행하면 저널을 읽어 이미 처리한 URL은 건너뛰고, 마지막에 저널에서 최종 CSV를 만듭니다.
+중간에 프로세스가 죽어 마지막 줄이 잘려도 그 줄만 무시하고 이어서 진행합니다.
+
+메모리에는 key별 성공 여부와 마지막 기록의 파일 위치만 두고, 레코드는 필요할 때 파일에서 다시 읽습니다.
+(수집 건수와 관계없이 레코드 본문이 메모리에 쌓이지 않음)
+"""
+import json
+import logging
+import os
+import threading
+
+from record_sinks import CsvSink, ParquetSink, infer_schema
+
+logger = logging.getLogger(__name__)
+
+# --- 변수 설정 ---
+FSYNC_EVERY = 0     # 이 개수마다 os.fsync 호출 (0이면 flush만 함)
+
+
+class CrawlJournal:
+    """
+    JSONL 크롤링 저널. 각 줄은 {"key": ..., "ok": ..., "record": {...}} 형태입니다.
+
+    Args:
+        path (str): 저널 파일 경로.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._records = {}     # key -> (ok, 줄의 파일 위치), 같은 key가 여러 번 있으면 마지막 기록 사용
+        self._appended = 0
+        self._load()
+        self._file = open(path, 'ab')
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+
+        skipped = 0
+        offset = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    skipped += 1   # 기록 중에 중단된 줄
+                else:
+                    self._records[entry['key']] = (entry['ok'], offset)
+                offset += len(line)
+
+        # 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄바꿈을 맞춰 둠
+        if offset and not line.endswith(b'\n'):
+            with open(self.path, 'ab') as f:
+                f.write(b'\n')
+
+        if skipped:
+            logger.warning(f"⚠️ 저널에서 읽을 수 없는 줄 {skipped}개를 건너뛰었습니다.")
+        logger.info(f"📒 저널에서 {len(self._records)}건을 불러왔습니다: {self.path}")
+
+    def __len__(self):
+        return len(self._records)
+
+    def completed_keys(self, include_failed=False):
+        """
+        이미 처리한 key 집합을 반환합니다. include_failed가 False면 실패한 key는 다시 시도하도록 제외합니다.
+        """
+        return {key for key, (ok, _) in self._records.items() if ok or include_failed}
+
+    def append(self, key, record, ok=True):
+        """
+        결과 하나를 저널 끝에 기록합니다.
+        """
+        line = json.dumps({'key': key, 'ok': ok, 'record': record}, ensure_ascii=False)
+        with self._lock:
+            offset = self._file.tell()
+            self._file.write((line + '\n').encode('utf-8'))
+            self._file.flush()
+            self._appended += 1
+            if FSYNC_EVERY and self._appended % FSYNC_EVERY == 0:
+                os.fsync(self._file.fileno())
+            self._records[key] = (ok, offset)
+
+    def records(self, keys):
+        """
+        keys 순서대로 저널에 있는 레코드를 파일에서 하나씩 읽어 반환합니다. 저널에 없는 key는 건너뜁니다.
+        """
+        with open(self.path, 'rb') as f:
+            for key in keys:
+                if key not in self._records:
+                    continue
+                f.seek(self._records[key][1])
+                yield json.loads(f.readline())['record']
+
+    def materialize(self, keys, output_path, dictionary_columns=()):
+        """
+        keys 순서대로 저널의 레코드를 CSV 파일로 저장합니다.
+        output_path가 .parquet으로 끝나면 row group 단위로 스트리밍하며 Parquet으로 저장합니다.
+
+        Returns:
+            int: 저장한 행 수.
+        """
+        if output_path.endswith('.parquet'):
+            # 성공/실패 레코드의 필드가 다르므로 CSV와 같이 전체를 한 번 훑어 스키마를 만든 뒤 기록
+            schema = infer_schema(self.records(keys))
+            with ParquetSink(output_path, dictionary_columns=dictionary_columns, schema=schema) as sink:
+                sink.write_many(self.records(keys))
+            return sink.rows_written
+
+        # 성공/실패 레코드의 필드가 다르므로 한 번 훑어 전체 헤더를 만든 뒤 다시 읽으며 기록
+        fieldnames = list(dict.fromkeys(field for record in self.records(keys) for field in record))
+        with CsvSink(output_path, fieldnames) as sink:
+            sink.write_many(self.records(keys))
+        return sink.rows_written
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
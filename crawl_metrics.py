@@ -0,0 +1,319 @@
+"""
+크롤링 단계별 지표(metrics).
+
+모든 스크래퍼가 (source, stage) 단위로 요청 수, 오류 수, 응답 코드, 전송 바이트, 재시도 수, 지연 시간 분포를 기록합니다.
+    - stage 예: list_page, detail_fetch, page_load, iframe, parse, write
+    - with crawl_metrics.timer('jumpit', 'detail_fetch'): ... 로 구간을 재면, 그 안에서 http_client로 보낸 요청의
+      응답 코드/바이트/재시도 수가 자동으로 같은 구간에 기록됩니다. (contextvars로 현재 구간을 전달)
+    - 실행이 끝나면 dump()로 JSON과 Prometheus 텍스트 형식 파일을 만들고, start_periodic_dump()로 N초마다 만들 수도 있습니다.
+"""
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import random
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# --- 변수 설정 ---
+# Prometheus 히스토그램 버킷 상한(초)
+HISTOGRAM_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+MAX_SAMPLES = 10000         # 백분위수 계산용으로 구간마다 보관하는 지연 시간 샘플 수 (넘으면 무작위로 교체)
+QUANTILES = (0.5, 0.95, 0.99)
+DUMP_INTERVAL = 0           # 0보다 크면 그 간격(초)마다 중간 결과를 파일로 저장
+
+_current = contextvars.ContextVar('crawl_metrics_observation', default=None)
+
+
+class Observation:
+    """
+    timer() 구간 하나에서 모은 값. http_client가 응답 코드, 바이트, 재시도 수를 채웁니다.
+    """
+    __slots__ = ('status', 'bytes', 'retries', 'error')
+
+    def __init__(self):
+        self.status = None
+        self.bytes = 0
+        self.retries = 0
+        self.error = False
+
+
+class StageMetrics:
+    """
+    (source, stage) 하나의 누적 지표.
+    """
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.statuses = {}
+        self.bytes = 0
+        self.retries = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.bucket_counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)   # 마지막 칸은 +Inf
+        self.samples = []
+        self._seen = 0
+
+    def add(self, seconds, observation):
+        self.count += 1
+        self.errors += observation.error
+        if observation.status is not None:
+            self.statuses[observation.status] = self.statuses.get(observation.status, 0) + 1
+        self.bytes += observation.bytes
+        self.retries += observation.retries
+        self._add_latency(seconds)
+
+    def _add_latency(self, seconds):
+        self.latency_sum += seconds
+        self.latency_max = max(self.latency_max, seconds)
+        for index, upper in enumerate(HISTOGRAM_BUCKETS):
+            if seconds <= upper:
+                self.bucket_counts[index] += 1
+                break
+        else:
+            self.bucket_counts[-1] += 1
+
+        # 저장소 샘플링(reservoir sampling)으로 메모리를 MAX_SAMPLES개로 고정
+        self._seen += 1
+        if len(self.samples) < MAX_SAMPLES:
+            self.samples.append(seconds)
+        else:
+            slot = random.randrange(self._seen)
+            if slot < MAX_SAMPLES:
+                self.samples[slot] = seconds
+
+    def quantile(self, q):
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def merge(self, state):
+        """
+        다른 프로세스에서 export한 상태를 더합니다.
+        """
+        self.count += state['count']
+        self.errors += state['errors']
+        for status, count in state['statuses'].items():
+            status = int(status)
+            self.statuses[status] = self.statuses.get(status, 0) + count
+        self.bytes += state['bytes']
+        self.retries += state['retries']
+        self.latency_sum += state['latency_sum']
+        self.latency_max = max(self.latency_max, state['latency_max'])
+        self.bucket_counts = [a + b for a, b in zip(self.bucket_counts, state['bucket_counts'])]
+        self.samples = (self.samples + state['samples'])[-MAX_SAMPLES:]
+        self._seen += state['count']
+
+    def export(self):
+        return {
+            'count': self.count, 'errors': self.errors, 'statuses': dict(self.statuses),
+            'bytes': self.bytes, 'retries': self.retries,
+            'latency_sum': self.latency_sum, 'latency_max': self.latency_max,
+            'bucket_counts': list(self.bucket_counts), 'samples': list(self.samples),
+        }
+
+    def snapshot(self):
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'statuses': {str(status): count for status, count in sorted(self.statuses.items())},
+            'bytes': self.bytes,
+            'retries': self.retries,
+            'latency_seconds': {
+                'mean': self.latency_sum / self.count if self.count else None,
+                'max': self.latency_max,
+                **{f'p{int(q * 100)}': self.quantile(q) for q in QUANTILES},
+            },
+        }
+
+
+class MetricsRegistry:
+    """
+    프로세스 하나의 모든 (source, stage) 지표. 스레드와 asyncio 양쪽에서 호출되므로 lock으로 보호합니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages = {}
+        self.started_at = time.time()
+
+    def _stage(self, source, stage):
+        key = (source, stage)
+        if key not in self._stages:
+            self._stages[key] = StageMetrics()
+        return self._stages[key]
+
+    def observe(self, source, stage, seconds, observation=None):
+        with self._lock:
+            self._stage(source, stage).add(seconds, observation or Observation())
+
+    @contextlib.contextmanager
+    def timer(self, source, stage):
+        """
+        with 블록의 실행 시간을 (source, stage)에 기록합니다. 블록에서 예외가 나면 오류로 셉니다.
+
+        Yields:
+            Observation: 필요하면 status/bytes를 직접 채울 수 있습니다.
+        """
+        observation = Observation()
+        token = _current.set(observation)
+        start = time.perf_counter()
+        try:
+            yield observation
+        except BaseException:
+            observation.error = True
+            raise
+        finally:
+            _current.reset(token)
+            self.observe(source, stage, time.perf_counter() - start, observation)
+
+    def export(self):
+        with self._lock:
+            return [(source, stage, metrics.export()) for (source, stage), metrics in self._stages.items()]
+
+    def merge(self, exported):
+        """
+        export()로 받은 다른 프로세스(예: 샤드 작업자)의 지표를 더합니다.
+        """
+        with self._lock:
+            for source, stage, state in exported:
+                self._stage(source, stage).merge(state)
+
+    def snapshot(self):
+        with self._lock:
+            stages = sorted(self._stages.items())
+            result = {'started_at': self.started_at, 'elapsed_seconds': time.time() - self.started_at, 'sources': {}}
+            for (source, stage), metrics in stages:
+                result['sources'].setdefault(source, {})[stage] = metrics.snapshot()
+            return result
+
+    def to_prometheus(self):
+        """
+        Prometheus 텍스트 노출 형식으로 변환합니다. 같은 이름의 지표는 한곳에 모아 씁니다.
+        """
+        families = {
+            'crawl_requests_total': ('counter', []),
+            'crawl_errors_total': ('counter', []),
+            'crawl_responses_total': ('counter', []),
+            'crawl_bytes_total': ('counter', []),
+            'crawl_retries_total': ('counter', []),
+            'crawl_stage_seconds': ('histogram', []),
+            'crawl_stage_seconds_quantile': ('gauge', []),
+        }
+
+        def add(family, labels, value, name=None):
+            families[family][1].append(f'{name or family}{{{labels}}} {value}')
+
+        with self._lock:
+            for (source, stage), metrics in sorted(self._stages.items()):
+                labels = f'source="{source}",stage="{stage}"'
+                add('crawl_requests_total', labels, metrics.count)
+                add('crawl_errors_total', labels, metrics.errors)
+                for status, count in sorted(metrics.statuses.items()):
+                    add('crawl_responses_total', f'{labels},status="{status}"', count)
+                add('crawl_bytes_total', labels, metrics.bytes)
+                add('crawl_retries_total', labels, metrics.retries)
+
+                cumulative = 0
+                for upper, count in zip(HISTOGRAM_BUCKETS, metrics.bucket_counts):
+                    cumulative += count
+                    add('crawl_stage_seconds', f'{labels},le="{upper}"', cumulative, 'crawl_stage_seconds_bucket')
+                add('crawl_stage_seconds', f'{labels},le="+Inf"', metrics.count, 'crawl_stage_seconds_bucket')
+                add('crawl_stage_seconds', labels, f'{metrics.latency_sum:.6f}', 'crawl_stage_seconds_sum')
+                add('crawl_stage_seconds', labels, metrics.count, 'crawl_stage_seconds_count')
+
+                for q in QUANTILES:
+                    value = metrics.quantile(q)
+                    if value is not None:
+                        add('crawl_stage_seconds_quantile', f'{labels},quantile="{q}"', f'{value:.6f}')
+
+        lines = []
+        for family, (metric_type, samples) in families.items():
+            lines.append(f'# TYPE {family} {metric_type}')
+            lines.extend(samples)
+        return '\n'.join(lines) + '\n'
+
+    def summary(self):
+        """
+        구간별 한 줄 요약. 실행이 끝날 때 로그로 출력합니다.
+        """
+        lines = []
+        for source, stages in self.snapshot()['sources'].items():
+            for stage, data in stages.items():
+                latency = data['latency_seconds']
+                percentiles = ' / '.join(
+                    f"{latency[name] * 1000:.0f}" if latency[name] is not None else '-' for name in ('p50', 'p95', 'p99')
+                )
+                lines.append(
+                    f"{source}/{stage}: {data['count']}건 (오류 {data['errors']}, 재시도 {data['retries']}), "
+                    f"{data['bytes'] / 1024:.1f} KB, p50/p95/p99 {percentiles} ms"
+                )
+        return '\n'.join(lines) or '기록된 지표가 없습니다.'
+
+    def dump(self, prefix):
+        """
+        {prefix}.json과 {prefix}.prom 파일을 만듭니다. (임시 파일에 쓴 뒤 교체)
+
+        Returns:
+            tuple: (JSON 파일 경로, Prometheus 파일 경로)
+        """
+        json_path, prom_path = f'{prefix}.json', f'{prefix}.prom'
+        _atomic_write(json_path, json.dumps(self.snapshot(), ensure_ascii=False, indent=2))
+        _atomic_write(prom_path, self.to_prometheus())
+        return json_path, prom_path
+
+    def start_periodic_dump(self, prefix, interval=DUMP_INTERVAL):
+        """
+        interval초마다 dump(prefix)를 호출하는 데몬 스레드를 시작합니다.
+
+        Returns:
+            threading.Event: set()하면 멈춥니다. interval이 0 이하면 아무것도 하지 않습니다.
+        """
+        stop = threading.Event()
+        if interval <= 0:
+            return stop
+
+        def run():
+            while not stop.wait(interval):
+                try:
+                    self.dump(prefix)
+                except OSError as e:
+                    logger.warning(f"⚠️ 지표 파일 저장 중 오류: {e}")
+
+        threading.Thread(target=run, name='crawl-metrics-dump', daemon=True).start()
+        return stop
+
+
+def _atomic_write(path, text):
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+registry = MetricsRegistry()
+timer = registry.timer
+observe = registry.observe
+
+
+def current():
+    """
+    지금 실행 중인 timer() 구간의 Observation. 구간 밖이면 None.
+    """
+    return _current.get()
+
+
+def record_response(status, num_bytes):
+    observation = _current.get()
+    if observation is not None:
+        observation.status = status
+        observation.bytes += num_bytes
+
+
+def record_retry():
+    observation = _current.get()
+    if observation is not None:
+        observation.retries += 1
@@ -0,0 +1,153 @@
+"""
+증분 크롤링을 위한 로컬 상태 저장소 (SQLite).
+
+소스 + 공고 ID별로 마지막으로 본 시각, 목록 레코드의 지문(fingerprint), 마감일(closedAt),
+그리고 마지막으로 수집한 상세 데이터를 저장합니다. 목록 레코드가 바뀌지 않은 공고는
+상세 페이지를 다시 요청하지 않고 저장된 상세 데이터를 그대로 이어 붙입니다.
+"""
+import hashlib
+import json
+import math
+import sqlite3
+import time
+
+from record_sinks import LIST_SEPARATOR
+
+# --- 변수 설정 ---
+STATE_DB_PATH = 'crawl_state.db'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS postings (
+    source       TEXT NOT NULL,
+    posting_id   TEXT NOT NULL,
+    fingerprint  TEXT NOT NULL,
+    closed_at    TEXT,
+    first_seen   REAL NOT NULL,
+    last_seen    REAL NOT NULL,
+    detail_json  TEXT,
+    PRIMARY KEY (source, posting_id)
+)
+"""
+
+
+def _canonical_value(value):
+    """
+    값을 CSV에 저장했다가 다시 읽은 것과 같은 문자열로 맞춥니다.
+    (API 레코드의 None/리스트/정수와 CSV 레코드의 NaN/쉼표 문자열/실수가 같은 값이 되도록)
+    """
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ''
+    if isinstance(value, (list, tuple)):
+        # CsvSink와 같은 방식으로 합침
+        return LIST_SEPARATOR.join(str(item) for item in value if item is not None)
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))   # 빈 칸이 있는 정수 컬럼은 pandas에서 실수로 읽힘
+    return str(value)
+
+
+def fingerprint(record):
+    """
+    목록 레코드의 내용 지문. 키 순서와 관계없이 같은 내용이면 같은 값을 반환합니다.
+    API에서 바로 받은 레코드와 CSV에서 읽은 레코드는 값을 _canonical_value()로 맞춘 뒤 비교하므로
+    파이프라인 모드와 일괄 처리 모드를 오가도 같은 공고는 같은 지문을 갖습니다.
+    """
+    canonical = json.dumps({key: _canonical_value(value) for key, value in record.items()},
+                           sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class CrawlStateStore:
+    """
+    공고별 크롤링 상태 저장소.
+
+    사용 순서:
+        1. plan()으로 새로 받아야 할 공고와 저장된 상세 데이터를 이어 붙일 공고를 나눕니다.
+        2. 새로 받은 상세 데이터는 save_detail()로 저장합니다.
+
+    Args:
+        path (str): SQLite 파일 경로.
+    """
+    def __init__(self, path=STATE_DB_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(_SCHEMA)
+        self.conn.commit()
+        # plan()에서 계산한 지문을 save_detail()까지 보관 (상세 데이터가 합쳐지기 전의 목록 레코드 기준)
+        self._pending = {}
+
+    def plan(self, source, records, id_key='id', closed_key=None):
+        """
+        목록 레코드를 새로 받아야 할 것과 저장된 상세 데이터로 대체할 것으로 나눕니다.
+        대체되는 레코드에는 저장된 상세 데이터가 바로 합쳐집니다.
+
+        Args:
+            source (str): 데이터 출처 이름 (예: 'jumpit', 'wanted').
+            records (list[dict]): 이번 실행에서 수집한 목록 레코드.
+            id_key (str): 공고 ID 필드 이름.
+            closed_key (str): 마감일 필드 이름 (없으면 None).
+
+        Returns:
+            tuple[list, list]: (상세 데이터를 새로 받아야 할 레코드, 저장된 데이터로 대체한 레코드)
+        """
+        to_fetch, carried = [], []
+        now = time.time()
+
+        with self.conn:
+            for record in records:
+                posting_id = str(record.get(id_key))
+                record_fingerprint = fingerprint(record)
+                closed_at = record.get(closed_key) if closed_key else None
+
+                row = self.conn.execute(
+                    "SELECT fingerprint, detail_json FROM postings WHERE source = ? AND posting_id = ?",
+                    (source, posting_id),
+                ).fetchone()
+
+                if row and row[0] == record_fingerprint and row[1] is not None:
+                    record.update(json.loads(row[1]))
+                    carried.append(record)
+                    self.conn.execute(
+                        "UPDATE postings SET last_seen = ? WHERE source = ? AND posting_id = ?",
+                        (now, source, posting_id),
+                    )
+                else:
+                    to_fetch.append(record)
+                    self._pending[(source, posting_id)] = (record_fingerprint, closed_at)
+
+        return to_fetch, carried
+
+    def save_detail(self, source, posting_id, detail):
+        """
+        새로 받은 상세 데이터를 저장합니다. plan()에서 새로 받아야 한다고 판단한 공고만 저장됩니다.
+        """
+        posting_id = str(posting_id)
+        pending = self._pending.pop((source, posting_id), None)
+        if pending is None:
+            return
+        record_fingerprint, closed_at = pending
+        now = time.time()
+
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO postings (source, posting_id, fingerprint, closed_at, first_seen, last_seen, detail_json)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (source, posting_id) DO UPDATE SET
+                    fingerprint = excluded.fingerprint,
+                    closed_at = excluded.closed_at,
+                    last_seen = excluded.last_seen,
+                    detail_json = excluded.detail_json
+                """,
+                (source, posting_id, record_fingerprint,
+                 None if closed_at is None else str(closed_at), now, now,
+                 json.dumps(detail, ensure_ascii=False, default=str)),
+            )
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
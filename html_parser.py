@@ -0,0 +1,228 @@
+"""
+HTML 파서 백엔드 선택.
+
+추출 함수들은 BeautifulSoup의 find / find_all / select_one / get_text 등만 사용하므로,
+같은 코드를 다음 백엔드 위에서 그대로 실행할 수 있습니다.
+    - 'html.parser': 파이썬 내장 파서 (기본값, 기존 동작)
+    - 'lxml': BeautifulSoup + lxml 파서
+    - 'selectolax': lexbor 기반 파서를 BeautifulSoup과 같은 인터페이스로 감싼 어댑터
+"""
+import importlib.util
+import logging
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+# --- 변수 설정 ---
+DEFAULT_BACKEND = 'html.parser'
+BACKENDS = ('html.parser', 'lxml', 'selectolax')
+
+_BACKEND_MODULES = {'html.parser': None, 'lxml': 'lxml', 'selectolax': 'selectolax'}
+
+
+def available_backends():
+    """
+    현재 환경에서 사용할 수 있는 백엔드 목록을 반환합니다.
+    """
+    return [name for name in BACKENDS
+            if _BACKEND_MODULES[name] is None or importlib.util.find_spec(_BACKEND_MODULES[name]) is not None]
+
+
+def set_default_backend(backend):
+    global DEFAULT_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"지원하지 않는 파서 백엔드입니다: {backend} (가능한 값: {', '.join(BACKENDS)})")
+    DEFAULT_BACKEND = backend
+
+
+def _resolve_backend(backend):
+    backend = backend or DEFAULT_BACKEND
+    if backend not in available_backends():
+        logger.warning(f"⚠️ '{backend}' 파서를 사용할 수 없어 'html.parser'로 대체합니다.")
+        return 'html.parser'
+    return backend
+
+
+def parse_html(html, backend=None, parse_only=None):
+    """
+    HTML을 지정한 백엔드로 파싱합니다.
+
+    Args:
+        html (str): 파싱할 HTML.
+        backend (str): 'html.parser', 'lxml', 'selectolax' 중 하나. 없으면 DEFAULT_BACKEND.
+        parse_only (SoupStrainer): 지정하면 일치하는 영역만 트리로 만듭니다. (BeautifulSoup 백엔드 전용,
+            selectolax는 문서 전체를 C로 파싱하므로 무시)
+
+    Returns:
+        BeautifulSoup 또는 SelectolaxDocument: find / find_all / select_one 등을 지원하는 문서 객체.
+    """
+    backend = _resolve_backend(backend)
+    if backend == 'selectolax':
+        return SelectolaxDocument(html)
+    return BeautifulSoup(html, backend, parse_only=parse_only)
+
+
+# --- selectolax 어댑터 ---
+# BeautifulSoup의 get_text처럼 script/style/template 안의 문자열과 주석은 텍스트에서 제외
+_NON_TEXT_PARENTS = {'script', 'style', 'template'}
+
+
+def _match_value(pattern, value):
+    if value is None:
+        return False
+    if hasattr(pattern, 'search'):
+        return pattern.search(value) is not None
+    if isinstance(pattern, (list, tuple, set)):
+        return any(_match_value(item, value) for item in pattern)
+    return value == pattern
+
+
+def _match_attribute(name, pattern, attributes):
+    if pattern is True:
+        return name in attributes
+    value = attributes.get(name)
+    if name == 'class' and value is not None:
+        # BeautifulSoup처럼 개별 클래스 하나 또는 class 속성 전체 문자열이 일치하면 매칭
+        classes = value.split()
+        return any(_match_value(pattern, cls) for cls in classes) or _match_value(pattern, ' '.join(classes))
+    return _match_value(pattern, value)
+
+
+def _build_filters(attrs, class_, kwargs):
+    if isinstance(attrs, str):
+        # BeautifulSoup에서 attrs 자리에 문자열을 넘기면 클래스로 취급
+        attrs = {'class': attrs}
+    filters = dict(attrs or {})
+    if class_ is not None:
+        filters['class'] = class_
+    filters.update(kwargs)
+    return filters
+
+
+def _matches(node, filters):
+    if not filters:
+        return True
+    attributes = node.attributes
+    return all(_match_attribute(name, pattern, attributes) for name, pattern in filters.items())
+
+
+class SelectolaxNode:
+    """
+    lexbor 노드를 BeautifulSoup Tag와 같은 방식으로 사용할 수 있게 감싼 객체.
+    추출 함수에서 사용하는 메서드만 구현합니다.
+    """
+    _include_self = False
+
+    def __init__(self, node):
+        self._node = node
+
+    def __repr__(self):
+        return f"<SelectolaxNode {self.name}>"
+
+    @property
+    def name(self):
+        return self._node.tag
+
+    @property
+    def attrs(self):
+        attributes = dict(self._node.attributes)
+        if attributes.get('class') is not None:
+            attributes['class'] = attributes['class'].split()
+        return attributes
+
+    def get(self, key, default=None):
+        return self.attrs.get(key, default)
+
+    def __getitem__(self, key):
+        return self.attrs[key]
+
+    def __getattr__(self, name):
+        # tag.a 처럼 자식 태그 이름으로 첫 번째 하위 태그를 찾는 BeautifulSoup 문법 지원
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return self.find(name)
+
+    # --- 탐색 ---
+    def _descendants(self, name):
+        nodes = self._node.css(name) if name else self._node.traverse()
+        for node in nodes:
+            if not self._include_self and node.mem_id == self._node.mem_id:
+                continue
+            yield node
+
+    def find(self, name=None, attrs=None, class_=None, **kwargs):
+        filters = _build_filters(attrs, class_, kwargs)
+        for node in self._descendants(name):
+            if _matches(node, filters):
+                return SelectolaxNode(node)
+        return None
+
+    def find_all(self, name=None, attrs=None, class_=None, **kwargs):
+        filters = _build_filters(attrs, class_, kwargs)
+        return [SelectolaxNode(node) for node in self._descendants(name) if _matches(node, filters)]
+
+    def find_next_sibling(self, name=None, attrs=None, class_=None, **kwargs):
+        filters = _build_filters(attrs, class_, kwargs)
+        node = self._node.next
+        while node is not None:
+            if not node.tag.startswith('-') and (name is None or node.tag == name) and _matches(node, filters):
+                return SelectolaxNode(node)
+            node = node.next
+        return None
+
+    def select_one(self, selector):
+        node = self._node.css_first(selector)
+        return SelectolaxNode(node) if node is not None else None
+
+    def select(self, selector):
+        return [SelectolaxNode(node) for node in self._node.css(selector)]
+
+    # --- 텍스트 ---
+    def _strings(self):
+        for node in self._node.traverse(include_text=True):
+            if node.tag != '-text':
+                continue
+            parent = node.parent
+            if parent is not None and parent.tag in _NON_TEXT_PARENTS:
+                continue
+            yield node.text_content
+
+    @property
+    def stripped_strings(self):
+        for text in self._strings():
+            text = text.strip()
+            if text:
+                yield text
+
+    def get_text(self, separator='', strip=False):
+        if strip:
+            return separator.join(self.stripped_strings)
+        return separator.join(self._strings())
+
+    @property
+    def text(self):
+        return self.get_text()
+
+
+class SelectolaxDocument(SelectolaxNode):
+    """
+    selectolax(lexbor)로 파싱한 문서. BeautifulSoup 객체 대신 사용할 수 있습니다.
+    """
+    _include_self = True
+
+    def __init__(self, html):
+        from selectolax.lexbor import LexborHTMLParser
+
+        self._parser = LexborHTMLParser(html)
+        super().__init__(self._parser.root)
+
+    def __repr__(self):
+        return "<SelectolaxDocument>"
+
+    def select_one(self, selector):
+        node = self._parser.css_first(selector)
+        return SelectolaxNode(node) if node is not None else None
+
+    def select(self, selector):
+        return [SelectolaxNode(node) for node in self._parser.css(selector)]
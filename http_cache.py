@@ -0,0 +1,231 @@
+"""
+상세 페이지용 디스크 HTTP 캐시.
+
+정규화한 URL을 키로 응답 본문을 gzip으로 압축해 저장하고, 다음 실행에서는
+If-None-Match / If-Modified-Since 조건부 요청을 보내 304 응답이면 디스크에 있는 본문을 사용합니다.
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+
+import http_cassette
+
+# --- 변수 설정 ---
+CACHE_ENABLED = True
+CACHE_DIR = '.http_cache'
+
+# 캐시에 함께 저장하는 응답 헤더 (Content-Encoding 등 전송 관련 헤더는 저장하지 않음)
+STORED_HEADERS = ['content-type', 'etag', 'last-modified', 'cache-control', 'date', 'expires']
+
+# 값이 비어 있는 숫자 키(예: '1726551234567=')는 캐시 무효화용 타임스탬프로 보고 키에서 제외
+_CACHE_BUSTER_KEY = re.compile(r'^\d{10,}$')
+_MAX_AGE = re.compile(r'max-age=(\d+)')
+
+
+def normalize_url(url, params=None):
+    """
+    같은 리소스가 같은 키를 갖도록 URL을 정규화합니다.
+    스킴/호스트 소문자화, 기본 포트와 fragment 제거, 쿼리 파라미터 정렬, 캐시 무효화 키 제거.
+    """
+    url = str(httpx.URL(url, params=params)) if params else str(url)
+    parts = urlsplit(url)
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    port = parts.port
+    if port and not ((scheme == 'http' and port == 80) or (scheme == 'https' and port == 443)):
+        host = f"{host}:{port}"
+
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not (_CACHE_BUSTER_KEY.match(key) and value == '')
+    ]
+    return urlunsplit((scheme, host, parts.path or '/', urlencode(sorted(query)), ''))
+
+
+def _max_age(headers):
+    cache_control = headers.get('cache-control', '').lower()
+    if 'no-cache' in cache_control or 'no-store' in cache_control:
+        return 0
+    match = _MAX_AGE.search(cache_control)
+    return int(match.group(1)) if match else 0
+
+
+class HttpCache:
+    """
+    디스크에 응답을 저장하는 HTTP 캐시.
+
+    카운터 의미:
+        hits: 저장된 응답이 아직 유효(max-age)해서 요청 없이 디스크에서 제공
+        revalidated: 조건부 요청에 304를 받아 디스크에서 제공
+        misses: 본문 전체를 새로 받음 (새 공고이거나 내용이 바뀐 경우)
+    """
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    # --- 저장소 ---
+    def _paths(self, key):
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        subdir = os.path.join(self.directory, digest[:2])
+        return os.path.join(subdir, f"{digest}.json"), os.path.join(subdir, f"{digest}.gz")
+
+    def load(self, key):
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = gzip.decompress(f.read())
+        except (OSError, ValueError, EOFError):
+            return None, None
+        return meta, body
+
+    def store(self, key, response):
+        if 'no-store' in response.headers.get('cache-control', '').lower():
+            return
+
+        meta_path, body_path = self._paths(key)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        meta = {
+            'url': key,
+            'status_code': response.status_code,
+            'headers': {name: response.headers[name] for name in STORED_HEADERS if name in response.headers},
+            'stored_at': time.time(),
+        }
+        # 임시 파일에 쓴 뒤 교체하여, 중간에 중단되어도 깨진 캐시 항목이 남지 않도록 함
+        self._atomic_write(body_path, gzip.compress(response.content), 'wb')
+        self._atomic_write(meta_path, json.dumps(meta, ensure_ascii=False), 'w')
+
+    def _atomic_write(self, path, data, mode):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, mode, **({'encoding': 'utf-8'} if 'b' not in mode else {})) as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _touch(self, key, meta):
+        meta_path, _ = self._paths(key)
+        meta['stored_at'] = time.time()
+        self._atomic_write(meta_path, json.dumps(meta, ensure_ascii=False), 'w')
+
+    # --- 요청 처리 ---
+    def _is_fresh(self, meta):
+        max_age = _max_age(meta['headers'])
+        return max_age > 0 and time.time() - meta['stored_at'] < max_age
+
+    def _conditional_headers(self, meta, headers):
+        headers = dict(headers or {})
+        if 'etag' in meta['headers']:
+            headers['If-None-Match'] = meta['headers']['etag']
+        if 'last-modified' in meta['headers']:
+            headers['If-Modified-Since'] = meta['headers']['last-modified']
+        return headers
+
+    def _cached_response(self, meta, body, request=None):
+        return httpx.Response(meta['status_code'], headers=meta['headers'], content=body,
+                              request=request or httpx.Request('GET', meta['url']))
+
+    def _count(self, name, saved=0):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+            self.bytes_saved += saved
+
+    def _handle_response(self, key, meta, body, response):
+        if response.status_code == 304 and meta is not None:
+            # 내용이 바뀌지 않았으므로 디스크의 본문을 사용하고, 새 캐시 헤더가 있으면 반영
+            for name in STORED_HEADERS:
+                if name in response.headers and name != 'content-type':
+                    meta['headers'][name] = response.headers[name]
+            self._touch(key, meta)
+            self._count('revalidated', saved=len(body))
+            return self._cached_response(meta, body, response.request)
+
+        if response.status_code == 200:
+            self.store(key, response)
+        self._count('misses')
+        return response
+
+    def get(self, client, url, params=None, headers=None):
+        key = normalize_url(url, params)
+        meta, body = self.load(key)
+
+        if meta is not None:
+            if self._is_fresh(meta):
+                self._count('hits', saved=len(body))
+                return self._cached_response(meta, body)
+            headers = self._conditional_headers(meta, headers)
+
+        response = client.get(url, params=params, headers=headers)
+        return self._handle_response(key, meta, body, response)
+
+    async def aget(self, client, url, params=None, headers=None):
+        key = normalize_url(url, params)
+        meta, body = self.load(key)
+
+        if meta is not None:
+            if self._is_fresh(meta):
+                self._count('hits', saved=len(body))
+                return self._cached_response(meta, body)
+            headers = self._conditional_headers(meta, headers)
+
+        response = await client.get(url, params=params, headers=headers)
+        return self._handle_response(key, meta, body, response)
+
+    def summary(self):
+        total = self.hits + self.revalidated + self.misses
+        served = self.hits + self.revalidated
+        ratio = served / total * 100 if total else 0
+        return (
+            f"HTTP 캐시: 적중 {self.hits}건, 재검증(304) {self.revalidated}건, 미적중 {self.misses}건 "
+            f"(디스크 제공 {ratio:.0f}%, 전송 절감 {self.bytes_saved / 1024:.1f} KB)"
+        )
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """
+    프로세스 전체에서 공유하는 캐시를 반환합니다.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = HttpCache(CACHE_DIR)
+        return _cache
+
+
+def cached_get(client, url, params=None, headers=None):
+    """
+    캐시를 거쳐 GET 요청을 보냅니다. CACHE_ENABLED가 False이거나 녹화/재생 중이면 그대로 요청합니다.
+    """
+    if not CACHE_ENABLED or http_cassette.is_active():
+        return client.get(url, params=params, headers=headers)
+    return get_cache().get(client, url, params=params, headers=headers)
+
+
+async def cached_aget(client, url, params=None, headers=None):
+    """
+    cached_get의 asyncio 버전입니다.
+    """
+    if not CACHE_ENABLED or http_cassette.is_active():
+        return await client.get(url, params=params, headers=headers)
+    return await get_cache().aget(client, url, params=params, headers=headers)
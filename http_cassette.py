@@ -0,0 +1,292 @@
+"""
+HTTP 녹화/재생(cassette).
+
+실제 크롤링 중 주고받은 요청/응답을 JSONL 파일에 녹화해 두었다가, 네트워크 없이 같은 순서로 재생합니다.
+http_client의 전송 계층 바로 아래에 들어가므로 01/02/03 등 http_client를 쓰는 모든 요청에 적용됩니다.
+    - record: 실제로 요청을 보내고, 응답(상태 코드, 헤더, 압축된 원본 본문, 걸린 시간)을 파일 끝에 추가
+    - replay: 파일에 있는 응답만 돌려줌. 같은 요청이 여러 번 녹화되어 있으면 녹화된 순서대로 돌려주고,
+              마지막 응답을 넘어서면 마지막 응답을 계속 사용. 녹화되지 않은 요청은 CassetteMissError
+    - 녹화는 속도 제한/재시도 계층 아래에서 하므로 429 같은 중간 응답과 서버의 실제 응답 시간이 그대로 남음.
+      재생할 때는 기본적으로 속도 제한 없이 최종 응답만 돌려주고, REPLAY_RATE_LIMIT이면 제한기와 재시도까지 재현
+    - 재생할 때 REPLAY_LATENCY로 지연을 흉내 낼 수 있음 ('recorded': 녹화된 시간 x LATENCY_SCALE, 숫자: 고정 초)
+
+녹화/재생 중에는 디스크 캐시(http_cache)를 건너뜁니다. (캐시 적중으로 녹화가 빠지거나 재생이 캐시를 읽지 않도록)
+환경 변수 HTTP_CASSETTE_MODE / HTTP_CASSETTE_PATH로도 켤 수 있어 CI에서 스크립트를 그대로 실행할 수 있습니다.
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# --- 변수 설정 ---
+MODE = os.environ.get('HTTP_CASSETTE_MODE') or None          # None 또는 'off'(꺼짐), 'record', 'replay'
+CASSETTE_PATH = os.environ.get('HTTP_CASSETTE_PATH') or 'http_cassette.jsonl'
+REPLAY_LATENCY = None       # None: 지연 없음, 'recorded': 녹화된 응답 시간, 숫자: 요청마다 고정 지연(초)
+LATENCY_SCALE = 1.0         # 'recorded' 지연에 곱하는 값 (0.5면 두 배 빠른 서버를 흉내)
+REPLAY_RATE_LIMIT = False   # 재생할 때도 호스트별 속도 제한기를 적용할지 (동시성 튜닝을 재현할 때 True)
+
+# 값이 비어 있는 숫자 키(예: '1726551234567=')는 캐시 무효화용 타임스탬프이므로 키에서 제외 (http_cache와 같은 규칙)
+_CACHE_BUSTER_KEY = re.compile(r'^\d{10,}$')
+
+
+class CassetteMissError(httpx.TransportError):
+    """
+    재생 중 녹화되지 않은 요청을 보냈을 때 발생합니다. (재시도 대상이 아님)
+    """
+
+
+def request_key(request):
+    """
+    요청을 구분하는 키. 메서드, 쿼리를 정렬한 URL, 본문 해시로 만듭니다. (쿠키/User-Agent 등 헤더와 캐시 무효화 키는 제외)
+    """
+    url = request.url.copy_with(query=None)
+    query = '&'.join(sorted(
+        pair for pair in request.url.query.decode('ascii', 'replace').split('&')
+        if pair and not (_CACHE_BUSTER_KEY.match(pair.partition('=')[0]) and pair.partition('=')[2] == '')
+    ))
+    body = request.read()
+    digest = hashlib.sha1(body).hexdigest()[:16] if body else ''
+    return f"{request.method} {url}{'?' + query if query else ''} {digest}".rstrip()
+
+
+class Cassette:
+    """
+    녹화 파일 하나. 각 줄은 {"key", "status", "headers", "body", "elapsed"} 형태입니다.
+
+    Args:
+        path (str): 녹화 파일 경로.
+        mode (str): 'record' 또는 'replay'.
+    """
+    def __init__(self, path, mode):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"알 수 없는 cassette 모드입니다: {mode}")
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._entries = {}     # key -> 녹화된 응답 목록
+        self._positions = {}   # key -> 다음에 돌려줄 위치
+        self._file = None
+
+        if mode == 'replay':
+            self._load()
+        else:
+            self._file = open(path, 'a', encoding='utf-8')
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"재생할 녹화 파일이 없습니다: {self.path}")
+        count = 0
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue   # 녹화 도중 중단된 줄
+                self._entries.setdefault(entry['key'], []).append(entry)
+                count += 1
+        logger.info(f"📼 녹화된 응답 {count}건(요청 {len(self._entries)}종)을 불러왔습니다: {self.path}")
+
+    def record(self, request, response, body, elapsed):
+        entry = {
+            'key': request_key(request),
+            'status': response.status_code,
+            'headers': [[name, value] for name, value in response.headers.multi_items()],
+            'body': base64.b64encode(body).decode('ascii'),
+            'elapsed': round(elapsed, 4),
+        }
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def next_entry(self, request, skip_statuses=()):
+        """
+        요청에 맞는 다음 녹화 응답을 반환합니다.
+
+        Args:
+            skip_statuses (set): 재시도 없이 재생할 때 건너뛸 응답 코드. 녹화 중 429 뒤에 재시도해 받은 200이 있으면 200을 바로 돌려줌.
+        """
+        key = request_key(request)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise CassetteMissError(f"녹화되지 않은 요청입니다: {key}", request=request)
+            while True:
+                position = self._positions.get(key, 0)
+                self._positions[key] = position + 1
+                entry = entries[min(position, len(entries) - 1)]
+                if entry['status'] not in skip_statuses or position >= len(entries) - 1:
+                    return entry
+
+    def close(self):
+        with self._lock:
+            if self._file and not self._file.closed:
+                self._file.close()
+
+
+def _replay_delay(entry):
+    if REPLAY_LATENCY == 'recorded':
+        return entry['elapsed'] * LATENCY_SCALE
+    return float(REPLAY_LATENCY or 0)
+
+
+def _replayed_response(entry):
+    # 본문은 압축된 원본 그대로이므로 Content-Encoding 헤더에 따라 httpx가 다시 풀어 줌
+    return httpx.Response(
+        entry['status'],
+        headers=entry['headers'],
+        stream=httpx.ByteStream(base64.b64decode(entry['body'])),
+        extensions={'http_version': b'HTTP/1.1'},
+    )
+
+
+def _recorded_response(response, body):
+    return httpx.Response(
+        response.status_code,
+        headers=response.headers,
+        stream=httpx.ByteStream(body),
+        extensions={'http_version': response.extensions.get('http_version', b'HTTP/1.1')},
+    )
+
+
+class RecordingTransport(httpx.BaseTransport):
+    def __init__(self, transport, cassette):
+        self._transport = transport
+        self._cassette = cassette
+
+    def handle_request(self, request):
+        start = time.perf_counter()
+        response = self._transport.handle_request(request)
+        try:
+            body = b''.join(response.iter_raw())
+        finally:
+            response.close()
+        self._cassette.record(request, response, body, time.perf_counter() - start)
+        return _recorded_response(response, body)
+
+    def close(self):
+        self._transport.close()
+
+
+class AsyncRecordingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport, cassette):
+        self._transport = transport
+        self._cassette = cassette
+
+    async def handle_async_request(self, request):
+        start = time.perf_counter()
+        response = await self._transport.handle_async_request(request)
+        try:
+            body = b''.join([chunk async for chunk in response.aiter_raw()])
+        finally:
+            await response.aclose()
+        self._cassette.record(request, response, body, time.perf_counter() - start)
+        return _recorded_response(response, body)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    def __init__(self, cassette, skip_statuses=()):
+        self._cassette = cassette
+        self._skip_statuses = skip_statuses
+
+    def handle_request(self, request):
+        entry = self._cassette.next_entry(request, self._skip_statuses)
+        delay = _replay_delay(entry)
+        if delay > 0:
+            time.sleep(delay)
+        return _replayed_response(entry)
+
+
+class AsyncReplayTransport(httpx.AsyncBaseTransport):
+    def __init__(self, cassette, skip_statuses=()):
+        self._cassette = cassette
+        self._skip_statuses = skip_statuses
+
+    async def handle_async_request(self, request):
+        entry = self._cassette.next_entry(request, self._skip_statuses)
+        delay = _replay_delay(entry)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return _replayed_response(entry)
+
+
+_cassette = None
+_cassette_lock = threading.Lock()
+
+
+def configure(mode=None, path=None, replay_latency=None, latency_scale=None, rate_limit=None):
+    """
+    녹화/재생 모드를 바꿉니다. http_client.close_client()를 호출해 공용 클라이언트를 다시 만들어야 적용됩니다.
+    None인 인자는 현재 설정을 그대로 둡니다. (경로만 바꿔도 환경 변수로 켠 모드가 유지됨)
+
+    Args:
+        mode (str): 'record', 'replay', 또는 끄려면 'off'.
+    """
+    global MODE, CASSETTE_PATH, REPLAY_LATENCY, LATENCY_SCALE, REPLAY_RATE_LIMIT
+    if mode is not None:
+        if mode not in ('off', 'record', 'replay'):
+            raise ValueError(f"알 수 없는 cassette 모드입니다: {mode}")
+        MODE = mode
+    if path is not None:
+        CASSETTE_PATH = path
+    if replay_latency is not None:
+        REPLAY_LATENCY = replay_latency
+    if latency_scale is not None:
+        LATENCY_SCALE = latency_scale
+    if rate_limit is not None:
+        REPLAY_RATE_LIMIT = rate_limit
+    close()
+
+
+def is_active():
+    return MODE in ('record', 'replay')
+
+
+def get_cassette():
+    """
+    프로세스 전체에서 공유하는 녹화 파일을 반환합니다. 모드가 꺼져 있으면 None.
+    """
+    global _cassette
+    if not is_active():
+        return None
+    with _cassette_lock:
+        if _cassette is None or _cassette.mode != MODE or _cassette.path != CASSETTE_PATH:
+            if _cassette is not None:
+                _cassette.close()
+            _cassette = Cassette(CASSETTE_PATH, MODE)
+        return _cassette
+
+
+def wrap_transport(transport, is_async=False, skip_statuses=()):
+    """
+    http_client가 만든 실제 전송 계층을 현재 모드에 맞게 감쌉니다. 재생 모드에서는 실제 전송 계층을 쓰지 않습니다.
+
+    Args:
+        skip_statuses (set): 재생할 때 건너뛸 응답 코드 (ReplayTransport 참고).
+    """
+    cassette = get_cassette()
+    if cassette is None:
+        return transport
+    if cassette.mode == 'record':
+        return (AsyncRecordingTransport if is_async else RecordingTransport)(transport, cassette)
+    return (AsyncReplayTransport if is_async else ReplayTransport)(cassette, skip_statuses)
+
+
+def close():
+    global _cassette
+    with _cassette_lock:
+        if _cassette is not None:
+            _cassette.close()
+            _cassette = None
@@ -0,0 +1,305 @@
+"""
+API 스크래퍼들이 함께 사용하는 HTTP 클라이언트.
+
+httpx 클라이언트 하나로 커넥션 풀(keep-alive), HTTP/2 멀티플렉싱, gzip/br 압축 전송을 처리하고,
+실행 동안 전송된 바이트 수와 재사용으로 아낀 핸드셰이크 수를 집계합니다.
+
+모든 요청은 전송 계층(AdaptiveTransport)에서 호스트별 AIMD 속도 제한기(rate_limiter.get_limiter)를 거치고,
+429/5xx 응답과 타임아웃/연결 오류는 Retry-After와 지터가 들어간 지수 백오프를 지켜 다시 시도합니다.
+http_cassette.MODE를 'record'/'replay'로 두면 그 아래에서 응답을 녹화하거나 녹화 파일로 재생합니다.
+"""
+import asyncio
+import importlib.util
+import threading
+import time
+
+import httpx
+
+import crawl_metrics
+import http_cassette
+import rate_limiter
+
+# --- 변수 설정 ---
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36'
+
+REQUEST_TIMEOUT = 10          # 읽기/쓰기/풀 대기 타임아웃(초)
+CONNECT_TIMEOUT = 5           # 연결 타임아웃(초)
+MAX_CONNECTIONS = 32          # 풀 전체 최대 연결 수
+MAX_KEEPALIVE_CONNECTIONS = 16
+KEEPALIVE_EXPIRY = 30         # 유휴 연결을 유지하는 시간(초)
+
+# h2 패키지가 있으면 HTTP/2, brotli 패키지가 있으면 br 압축을 사용합니다.
+HTTP2_ENABLED = importlib.util.find_spec('h2') is not None
+BROTLI_ENABLED = (importlib.util.find_spec('brotli') is not None
+                  or importlib.util.find_spec('brotlicffi') is not None)
+
+ACCEPT_ENCODING = 'gzip, deflate, br' if BROTLI_ENABLED else 'gzip, deflate'
+
+# 💡 재시도 설정
+MAX_RETRIES = 4                                   # 요청 하나당 최대 재시도 횟수
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+THROTTLE_STATUSES = frozenset({429, 503})         # 속도를 줄여야 한다는 신호로 보는 응답
+RETRY_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'POST'})   # 이 저장소의 POST는 목록 조회뿐이라 재시도해도 안전
+RETRY_EXCEPTIONS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+DEFAULT_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept-Encoding': ACCEPT_ENCODING,
+}
+
+
+# --- 전송 통계 ---
+class TransferStats:
+    """
+    실행 한 번 동안의 요청 수, 전송 바이트, 새로 연 연결 수를 집계합니다.
+    스레드와 asyncio 양쪽에서 호출되므로 lock으로 보호합니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.bytes_on_wire = 0     # 네트워크로 받은 본문 바이트 (압축 상태)
+            self.bytes_decoded = 0     # 압축을 푼 본문 바이트
+            self.connections_opened = 0
+            self.tls_handshakes = 0
+            self.http_versions = {}
+            self.retries = 0
+
+    def record_response(self, response):
+        with self._lock:
+            self.requests += 1
+            self.bytes_on_wire += response.num_bytes_downloaded
+            self.bytes_decoded += len(response.content)
+            self.http_versions[response.http_version] = self.http_versions.get(response.http_version, 0) + 1
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def record_trace_event(self, event_name):
+        if event_name == 'connection.connect_tcp.complete':
+            with self._lock:
+                self.connections_opened += 1
+        elif event_name == 'connection.start_tls.complete':
+            with self._lock:
+                self.tls_handshakes += 1
+
+    @property
+    def handshakes_avoided(self):
+        # 연결을 새로 열지 않고 처리한 요청 수
+        return max(self.requests - self.connections_opened, 0)
+
+    def summary(self):
+        versions = ', '.join(f"{version} {count}건" for version, count in sorted(self.http_versions.items()))
+        ratio = (self.bytes_on_wire / self.bytes_decoded * 100) if self.bytes_decoded else 0
+        return (
+            f"HTTP 요청 {self.requests}건 ({versions or '-'}) | "
+            f"전송 {self.bytes_on_wire / 1024:.1f} KB (압축 해제 {self.bytes_decoded / 1024:.1f} KB, {ratio:.0f}%) | "
+            f"새 연결 {self.connections_opened}회, TLS 핸드셰이크 {self.tls_handshakes}회, "
+            f"재사용으로 아낀 핸드셰이크 {self.handshakes_avoided}회 | 재시도 {self.retries}회\n"
+            f"호스트별 속도: {rate_limiter.limiter_summary()}"
+        )
+
+
+stats = TransferStats()
+
+
+# --- 이벤트 훅: 모든 요청에 trace를 달고, 응답 본문을 읽어 통계에 반영 ---
+def _trace(event_name, info):
+    stats.record_trace_event(event_name)
+
+
+async def _atrace(event_name, info):
+    stats.record_trace_event(event_name)
+
+
+def _on_request(request):
+    request.extensions['trace'] = _trace
+
+
+def _on_response(response):
+    response.read()
+    stats.record_response(response)
+    crawl_metrics.record_response(response.status_code, response.num_bytes_downloaded)
+
+
+async def _aon_request(request):
+    request.extensions['trace'] = _atrace
+
+
+async def _aon_response(response):
+    await response.aread()
+    stats.record_response(response)
+    crawl_metrics.record_response(response.status_code, response.num_bytes_downloaded)
+
+
+# --- 전송 계층: 호스트별 속도 제한 + 재시도 ---
+def _retry_delay(response, attempt):
+    """
+    재시도 전에 기다릴 시간(초)을 반환합니다. 재시도하지 않을 응답이면 None.
+    """
+    if response.status_code not in RETRY_STATUSES or attempt >= MAX_RETRIES:
+        return None
+    retry_after = rate_limiter.parse_retry_after(response.headers.get('Retry-After'))
+    return max(rate_limiter.backoff_delay(attempt), retry_after or 0)
+
+
+def _report(limiter, response):
+    if response.status_code in THROTTLE_STATUSES:
+        limiter.on_throttle(rate_limiter.parse_retry_after(response.headers.get('Retry-After')))
+    elif response.status_code < 500:
+        limiter.on_success()
+
+
+class AdaptiveTransport(httpx.BaseTransport):
+    """
+    요청을 보내기 전에 호스트별 제한기에서 토큰을 받고, 응답 결과를 제한기에 알려주는 전송 계층.
+    """
+    def __init__(self, transport):
+        self._transport = transport
+
+    def handle_request(self, request):
+        limiter = rate_limiter.get_limiter(request.url.host)
+        retryable = request.method in RETRY_METHODS
+        attempt = 0
+        while True:
+            limiter.acquire()
+            try:
+                response = self._transport.handle_request(request)
+            except RETRY_EXCEPTIONS:
+                limiter.on_throttle()
+                if not retryable or attempt >= MAX_RETRIES:
+                    raise
+                time.sleep(rate_limiter.backoff_delay(attempt))
+            else:
+                _report(limiter, response)
+                delay = _retry_delay(response, attempt) if retryable else None
+                if delay is None:
+                    return response
+                response.close()
+                time.sleep(delay)
+            stats.record_retry()
+            crawl_metrics.record_retry()
+            attempt += 1
+
+    def close(self):
+        self._transport.close()
+
+
+class AsyncAdaptiveTransport(httpx.AsyncBaseTransport):
+    """
+    AdaptiveTransport의 비동기 버전. 대기는 이벤트 루프를 막지 않도록 asyncio.sleep으로 합니다.
+    """
+    def __init__(self, transport):
+        self._transport = transport
+
+    async def handle_async_request(self, request):
+        limiter = rate_limiter.get_limiter(request.url.host)
+        retryable = request.method in RETRY_METHODS
+        attempt = 0
+        while True:
+            wait_time = limiter.reserve()
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+            try:
+                response = await self._transport.handle_async_request(request)
+            except RETRY_EXCEPTIONS:
+                limiter.on_throttle()
+                if not retryable or attempt >= MAX_RETRIES:
+                    raise
+                await asyncio.sleep(rate_limiter.backoff_delay(attempt))
+            else:
+                _report(limiter, response)
+                delay = _retry_delay(response, attempt) if retryable else None
+                if delay is None:
+                    return response
+                await response.aclose()
+                await asyncio.sleep(delay)
+            stats.record_retry()
+            crawl_metrics.record_retry()
+            attempt += 1
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+# --- 클라이언트 생성 ---
+def _client_settings(transport_class, adaptive_class, **overrides):
+    # transport를 직접 넘기면 httpx가 limits/http2 인자를 쓰지 않으므로 전송 계층에 넘김
+    limits = overrides.pop('limits', httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    ))
+    http2 = overrides.pop('http2', HTTP2_ENABLED)
+    # 녹화/재생(http_cassette)은 속도 제한/재시도 계층 아래에 끼움
+    is_async = issubclass(transport_class, httpx.AsyncBaseTransport)
+    replay_only = http_cassette.MODE == 'replay' and not http_cassette.REPLAY_RATE_LIMIT
+    transport = http_cassette.wrap_transport(transport_class(limits=limits, http2=http2), is_async,
+                                             skip_statuses=RETRY_STATUSES if replay_only else ())
+    if not replay_only:
+        transport = adaptive_class(transport)
+    settings = {
+        'headers': DEFAULT_HEADERS,
+        'timeout': httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+        'transport': transport,
+        'follow_redirects': True,
+    }
+    settings.update(overrides)
+    return settings
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def configure(timeout=None, connect_timeout=None, http2=None, max_connections=None):
+    """
+    공용 클라이언트 설정을 바꿉니다. 이미 만들어진 클라이언트는 닫고 다음 호출 때 새로 만듭니다.
+    """
+    global REQUEST_TIMEOUT, CONNECT_TIMEOUT, HTTP2_ENABLED, MAX_CONNECTIONS
+    if timeout is not None:
+        REQUEST_TIMEOUT = timeout
+    if connect_timeout is not None:
+        CONNECT_TIMEOUT = connect_timeout
+    if http2 is not None:
+        HTTP2_ENABLED = http2
+    if max_connections is not None:
+        MAX_CONNECTIONS = max_connections
+    close_client()
+
+
+def get_client():
+    """
+    프로세스 전체에서 공유하는 동기 클라이언트를 반환합니다. (스레드 간 공유 가능)
+    """
+    global _client
+    with _client_lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.Client(
+                event_hooks={'request': [_on_request], 'response': [_on_response]},
+                **_client_settings(httpx.HTTPTransport, AdaptiveTransport),
+            )
+        return _client
+
+
+def create_async_client(**overrides):
+    """
+    asyncio 이벤트 루프 안에서 사용할 비동기 클라이언트를 만듭니다.
+    비동기 클라이언트는 루프에 묶이므로 `async with`로 실행마다 새로 만들어 사용합니다.
+    """
+    return httpx.AsyncClient(
+        event_hooks={'request': [_aon_request], 'response': [_aon_response]},
+        **_client_settings(httpx.AsyncHTTPTransport, AsyncAdaptiveTransport, **overrides),
+    )
+
+
+def close_client():
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
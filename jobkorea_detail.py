@@ -1,9 +1,14 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from html_parser import parse_html
+from webdriver_pool import WebDriverPool, POOL_SIZE, MAX_USES_PER_DRIVER
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import httpx
+import crawl_metrics
+import http_cache
+import http_client
+import browser_profile
+import wait_engine
 import pandas as pd
 import time
 import re
@@ -14,68 +19,233 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def scrape_all_job_details(url):
+# 추출 함수에서 반복해서 사용하는 정규식 (페이지마다 다시 만들지 않도록 미리 컴파일)
+MIN_WIDTH_STYLE = re.compile(r'min-width')
+TYPOGRAPHY_CLASS = re.compile(r'Typography_.*')
+TYPOGRAPHY_SIZE20_CLASS = re.compile(r'Typography_variant_size20__.*')
+TYPOGRAPHY_SIZE13_CLASS = re.compile(r'Typography_variant_size13__')
+TYPOGRAPHY_SIZE14_CLASS = re.compile(r'Typography_variant_size14__')
+GRAY900_CLASS = re.compile(r'Typography_color_gray900__.*')
+FLEX_GAP12_CLASS = re.compile(r'Flex_display_flex__.* Flex_gap_space12__.*')
+
+# --- 변수 설정 ---
+FETCH_MODE = 'http'     # 'http': 먼저 브라우저 없이 HTML을 받아 추출하고 필요한 섹션이 없을 때만 Selenium 사용, 'browser': 항상 Selenium 사용
+METRICS_PREFIX = 'jobkorea_detail_metrics'   # 실행이 끝나면 단계별 지표를 .json/.prom 파일로 저장
+
+# Selenium 경로에서 로딩을 기다리는 섹션들. HTTP 응답에 모두 있어야 브라우저 없이 추출한 결과를 사용
+REQUIRED_SECTIONS = {
+    'RecruitmentGuidelines': lambda soup: soup.find('div', attrs={'data-sentry-component': 'RecruitmentGuidelines'}),
+    'application-section': lambda soup: soup.find(id='application-section'),
+    'company-section': lambda soup: soup.find(id='company-section'),
+}
+
+COLUMNS = [
+    '제목', '회사명', '모집분야', '모집인원', '고용형태', '직급/직책', '급여', '근무시간', 
+    '근무지주소', '인근지하철', '경력', '학력', '스킬', '핵심역량', 
+    '우대조건', '기본우대', '시작일', '마감일', '사원수', 
+    '기업구분', '산업(업종)', '위치'
+]
+
+def create_driver():
     """
-    모든 컬럼의 데이터를 크롤링하고 DataFrame으로 반환합니다.
+    상세 페이지 크롤링에 사용할 Chrome 드라이버를 생성합니다.
     """
-    driver = None
-    all_details = {}
+    return browser_profile.create_driver()
+
+def scrape_job_details_with_driver(driver, url):
+    """
+    이미 실행 중인 드라이버로 상세 페이지 하나를 크롤링합니다. 드라이버는 종료하지 않습니다.
 
+    Returns:
+        dict: {'status': 'success' | 'error', 'content': 추출 결과 또는 오류 메시지}
+    """
     try:
-        chrome_options = Options()
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        
-        user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.7339.81 Safari/537.36'
-        chrome_options.add_argument(f'user-agent={user_agent}')
-
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.get(url)
-        logger.info(f"페이지 접속 완료: {url}")
-
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, 'div[data-sentry-component="RecruitmentGuidelines"]'))
-        )
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.ID, 'application-section'))
-        )
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.ID, 'company-section'))
-        )
-        time.sleep(3)
+        with crawl_metrics.timer('jobkorea', 'page_load'):
+            driver.get(url)
+            logger.info(f"페이지 접속 완료: {url}")
+
+            wait_engine.wait_for_all(driver, [
+                (By.CSS_SELECTOR, 'div[data-sentry-component="RecruitmentGuidelines"]'),
+                (By.ID, 'application-section'),
+                (By.ID, 'company-section'),
+            ], timeout=15)
+            # 섹션이 나타난 뒤 남은 렌더링이 끝날 때까지만 대기 (최대 3초)
+            wait_engine.wait_for_dom_stable(driver, timeout=3)
         
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-
-        # 새로운 제목 및 회사명 크롤링 함수 호출
-        all_details['제목'] = scrape_job_title(soup)
-        all_details['회사명'] = scrape_company_name(soup)
-
-        all_details.update(scrape_recruitment_guidelines_section(soup))
-        all_details.update(scrape_qualification_section(soup))
-        all_details.update(scrape_application_section(soup))
-        all_details.update(scrape_company_section(soup))
-
-        columns = [
-            '제목', '회사명', '모집분야', '모집인원', '고용형태', '직급/직책', '급여', '근무시간', 
-            '근무지주소', '인근지하철', '경력', '학력', '스킬', '핵심역량', 
-            '우대조건', '기본우대', '시작일', '마감일', '사원수', 
-            '기업구분', '산업(업종)', '위치'
-        ]
-        for col in columns:
-            if col not in all_details:
-                all_details[col] = None
+        html = driver.page_source
+        with crawl_metrics.timer('jobkorea', 'parse'):
+            all_details = parse_job_details(html)
 
         return {'status': 'success', 'content': all_details}
 
     except Exception as e:
         logger.error(f"❌ 오류 발생: {e}")
         return {'status': 'error', 'content': f"❌ 오류 발생: {e}"}
+
+class FastPathStats:
+    """
+    브라우저 없이(HTTP로) 추출에 성공한 비율을 집계합니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.attempts = 0
+        self.hits = 0
+        self.fallbacks = {}    # 대체 이유별 건수
+
+    def record(self, hit, reason=None):
+        with self._lock:
+            self.attempts += 1
+            if hit:
+                self.hits += 1
+            else:
+                self.fallbacks[reason] = self.fallbacks.get(reason, 0) + 1
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.attempts if self.attempts else 0.0
+
+    def summary(self):
+        reasons = ', '.join(f"{reason} {count}건" for reason, count in sorted(self.fallbacks.items()))
+        return (f"HTTP 추출 {self.hits}/{self.attempts}건 성공 (적중률 {self.hit_rate:.1%})"
+                + (f", Selenium 대체 사유: {reasons}" if reasons else ""))
+
+
+fast_path_stats = FastPathStats()
+
+def find_missing_sections(soup):
+    """
+    REQUIRED_SECTIONS 중 soup에 없는 섹션 이름 목록을 반환합니다.
+    """
+    return [name for name, find_section in REQUIRED_SECTIONS.items() if not find_section(soup)]
+
+def fetch_job_details_http(url, backend=None):
+    """
+    브라우저 없이 상세 페이지 HTML을 받아 추출합니다.
+
+    Returns:
+        dict: 성공하면 {'status': 'success', 'content': 추출 결과},
+              필요한 섹션이 없거나 요청이 실패하면 {'status': 'fallback', 'content': 사유}
+    """
+    try:
+        with crawl_metrics.timer('jobkorea', 'detail_fetch'):
+            response = http_cache.cached_get(http_client.get_client(), url)
+            response.raise_for_status()
+    except httpx.HTTPError as e:
+        fast_path_stats.record(False, 'HTTP 오류')
+        logger.info(f"HTTP 요청 실패로 Selenium을 사용합니다: {url} ({e})")
+        return {'status': 'fallback', 'content': f"HTTP 오류: {e}"}
+
+    with crawl_metrics.timer('jobkorea', 'parse'):
+        soup = parse_html(response.text, backend)
+        missing = find_missing_sections(soup)
+        details = None if missing else extract_job_details(soup)
+
+    if missing:
+        fast_path_stats.record(False, '섹션 누락')
+        logger.info(f"HTML에 {', '.join(missing)} 섹션이 없어 Selenium을 사용합니다: {url}")
+        return {'status': 'fallback', 'content': f"섹션 누락: {', '.join(missing)}"}
+
+    fast_path_stats.record(True)
+    logger.info(f"HTTP 추출 완료: {url}")
+    return {'status': 'success', 'content': details}
+
+def scrape_all_job_details(url):
+    """
+    모든 컬럼의 데이터를 크롤링하고 DataFrame으로 반환합니다.
+    FETCH_MODE가 'http'이면 브라우저 없이 먼저 시도하고, 실패할 때만 Chrome을 띄웁니다.
+    """
+    if FETCH_MODE == 'http':
+        result = fetch_job_details_http(url)
+        if result['status'] == 'success':
+            return result
+
+    driver = None
+
+    try:
+        driver = create_driver()
+        return scrape_job_details_with_driver(driver, url)
+
+    except Exception as e:
+        logger.error(f"❌ 오류 발생: {e}")
+        return {'status': 'error', 'content': f"❌ 오류 발생: {e}"}
     finally:
         if driver:
             driver.quit()
 
+def scrape_job_details_batch(urls, pool_size=POOL_SIZE, max_uses=MAX_USES_PER_DRIVER):
+    """
+    여러 상세 페이지를 드라이버 풀로 크롤링합니다.
+    URL마다 Chrome을 새로 띄우지 않고 pool_size개의 드라이버를 재사용합니다.
+    FETCH_MODE가 'http'이면 HTTP로 추출하지 못한 페이지만 드라이버를 사용합니다.
+    (드라이버는 처음 필요할 때 생성되므로 모두 HTTP로 처리되면 Chrome을 띄우지 않습니다.)
+
+    Args:
+        urls (list): 상세 페이지 URL 목록.
+        pool_size (int): 동시에 사용할 드라이버 수.
+        max_uses (int): 드라이버 하나를 재사용할 최대 횟수. 넘으면 새 드라이버로 교체.
+
+    Returns:
+        list: urls와 같은 순서의 {'status', 'content'} 결과 목록.
+    """
+    def scrape(url):
+        if FETCH_MODE == 'http':
+            result = fetch_job_details_http(url)
+            if result['status'] == 'success':
+                return result
+        try:
+            with pool.checkout() as driver:
+                return scrape_job_details_with_driver(driver, url)
+        except Exception as e:
+            logger.error(f"❌ 드라이버를 사용할 수 없습니다: {e}")
+            return {'status': 'error', 'content': f"❌ 오류 발생: {e}"}
+
+    start_time = time.time()
+    with WebDriverPool(create_driver, size=pool_size, max_uses=max_uses) as pool:
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            results = list(executor.map(scrape, urls))
+
+    elapsed = time.time() - start_time
+    success_count = sum(1 for result in results if result['status'] == 'success')
+    logger.info(f"✅ {len(urls)}건 중 {success_count}건 성공 ({elapsed:.1f}초, {len(urls) / max(elapsed, 1e-9):.2f}건/초)")
+    if FETCH_MODE == 'http':
+        logger.info(f"📊 {fast_path_stats.summary()}")
+    return results
+
+# --- 페이지 HTML 전체 추출 ---
+def parse_job_details(html, backend=None):
+    """
+    상세 페이지 HTML에서 모든 컬럼의 데이터를 추출합니다.
+
+    Args:
+        html (str): 상세 페이지 HTML.
+        backend (str): HTML 파서 백엔드 (없으면 html_parser.DEFAULT_BACKEND).
+
+    Returns:
+        dict: 컬럼별 추출 결과 (없는 컬럼은 None).
+    """
+    return extract_job_details(parse_html(html, backend))
+
+def extract_job_details(soup):
+    """
+    파싱된 상세 페이지에서 모든 컬럼의 데이터를 추출합니다.
+    """
+    all_details = {}
+
+    # 새로운 제목 및 회사명 크롤링 함수 호출
+    all_details['제목'] = scrape_job_title(soup)
+    all_details['회사명'] = scrape_company_name(soup)
+
+    all_details.update(scrape_recruitment_guidelines_section(soup))
+    all_details.update(scrape_qualification_section(soup))
+    all_details.update(scrape_application_section(soup))
+    all_details.update(scrape_company_section(soup))
+
+    for col in COLUMNS:
+        if col not in all_details:
+            all_details[col] = None
+
+    return all_details
+
 # --- 제목 추출 함수 ---
 def scrape_job_title(soup):
     h1_tag = soup.find('h1')
@@ -83,7 +253,7 @@ def scrape_job_title(soup):
 
 # --- 회사명 추출 함수 ---
 def scrape_company_name(soup):
-    h2_tag = soup.find('h2', class_=re.compile(r'Typography_variant_size20__.*'))
+    h2_tag = soup.find('h2', class_=TYPOGRAPHY_SIZE20_CLASS)
     return h2_tag.get_text(strip=True) if h2_tag else None
 
 # --- 각 섹션별 데이터 추출 함수들 (기존 함수들) ---
@@ -95,19 +265,19 @@ def scrape_recruitment_guidelines_section(soup):
 
     for item in recruitment_section.find_all('div', attrs={'data-sentry-component': 'RecruitmentItem'}):
         try:
-            key_tag = item.find('span', style=re.compile(r'min-width'))
+            key_tag = item.find('span', style=MIN_WIDTH_STYLE)
             if not key_tag: continue
             key = key_tag.get_text(strip=True)
             value = None
             if key == '고용형태':
-                value_tags = item.find_all('span', class_=re.compile(r'Typography_.*'))
+                value_tags = item.find_all('span', class_=TYPOGRAPHY_CLASS)
                 value = ' '.join([tag.get_text(strip=True) for tag in value_tags if tag.get_text(strip=True)])
             elif key == '인근지하철':
                 subway_info_container = key_tag.find_next_sibling('div')
                 if subway_info_container:
                     value = "".join(subway_info_container.stripped_strings)
             else:
-                value_tag = item.find('span', class_=re.compile(r'Typography_color_gray900__.*'))
+                value_tag = item.find('span', class_=GRAY900_CLASS)
                 value = value_tag.get_text(strip=True) if value_tag else None
             if value: details[key] = value
         except AttributeError:
@@ -121,7 +291,7 @@ def scrape_qualification_section(soup):
     
     for item in qualification_section.find_all('div', attrs={'data-sentry-component': 'QualificationItem'}):
         try:
-            key_tag = item.find('span', style=re.compile(r'min-width'))
+            key_tag = item.find('span', style=MIN_WIDTH_STYLE)
             if not key_tag: continue
             key = key_tag.get_text(strip=True)
             value = None
@@ -162,7 +332,7 @@ def scrape_application_section(soup):
     
     simple_table = application_section.find('div', attrs={'data-sentry-component': 'SimpleTable'})
     if simple_table:
-        for item in simple_table.find_all('div', class_=re.compile(r'Flex_display_flex__.* Flex_gap_space12__.*')):
+        for item in simple_table.find_all('div', class_=FLEX_GAP12_CLASS):
             key_tag = item.find('span', attrs={'data-accent-color': 'gray700'})
             value_tag = item.find('span', attrs={'data-accent-color': 'gray900'})
             if key_tag and value_tag:
@@ -179,9 +349,9 @@ def scrape_company_section(soup):
     info_boxes = company_section.find_all('div', attrs={'data-sentry-component': 'CorpInformationBox'})
     for box in info_boxes:
         try:
-            key_element = box.find('span', class_=re.compile(r'Typography_variant_size13__'))
+            key_element = box.find('span', class_=TYPOGRAPHY_SIZE13_CLASS)
             key = key_element.get_text(strip=True)
-            value_element = box.find('div', class_=re.compile(r'Typography_variant_size14__'))
+            value_element = box.find('div', class_=TYPOGRAPHY_SIZE14_CLASS)
             value = value_element.get_text(strip=True)
             details[key] = value
         except Exception:
@@ -200,7 +370,14 @@ if __name__ == "__main__":
     
     if result['status'] == 'success':
         print("\n--- 통합 크롤링 성공 ---")
-        df = create_dataframe_and_save(result['content'])
+        with crawl_metrics.timer('jobkorea', 'write'):
+            df = create_dataframe_and_save(result['content'])
         print(df)
     else:
-        print(f"❌ 크롤링 실패: {result['content']}")
\ No newline at end of file
+        print(f"❌ 크롤링 실패: {result['content']}")
+
+    if FETCH_MODE == 'http':
+        print(fast_path_stats.summary())
+
+    print(crawl_metrics.registry.summary())
+    print(f"단계별 지표를 저장했습니다: {', '.join(crawl_metrics.registry.dump(METRICS_PREFIX))}")
@@ -0,0 +1,182 @@
+"""
+요청 속도 제한기.
+
+고정/무작위 sleep 대신 토큰 버킷으로 초당 요청 수와 순간 허용량(burst)을 제한합니다.
+여러 스레드가 하나의 버킷을 공유해도 전체 속도가 지켜집니다.
+
+AdaptiveRateLimiter는 호스트별 속도를 AIMD로 조절합니다.
+    - 요청이 성공하면 속도를 조금씩 올림 (additive increase)
+    - 429/503 응답이나 타임아웃이 나면 속도를 절반으로 줄임 (multiplicative decrease)
+    - Retry-After가 있으면 그 시각까지 해당 호스트로 요청을 보내지 않음
+http_client의 전송 계층이 get_limiter(host)로 호스트별 제한기를 가져와 모든 요청에 적용합니다.
+"""
+import email.utils
+import random
+import threading
+import time
+
+# --- 변수 설정 ---
+INITIAL_RATE = 4.0          # 처음 시작하는 초당 요청 수
+MIN_RATE = 0.2              # 줄일 수 있는 최저 속도
+MAX_RATE = 50.0             # 올릴 수 있는 최고 속도
+ADDITIVE_INCREASE = 1.0     # 성공이 이어질 때 1초 분량의 요청마다 올리는 속도 (req/s)
+DECREASE_FACTOR = 0.5       # 429/503/타임아웃 때 곱하는 값
+DECREASE_COOLDOWN = 1.0     # 동시에 실패한 요청들 때문에 여러 번 줄이지 않도록, 줄인 뒤 이 시간(초) 동안은 다시 줄이지 않음
+
+BACKOFF_BASE = 0.5          # 재시도 대기 시간의 기준(초)
+BACKOFF_CAP = 30.0          # 재시도 대기 시간의 상한(초)
+
+
+class TokenBucket:
+    """
+    초당 rate개씩 토큰이 채워지고 최대 burst개까지 쌓이는 토큰 버킷.
+
+    Args:
+        rate (float): 초당 허용 요청 수.
+        burst (int): 한꺼번에 보낼 수 있는 최대 요청 수.
+    """
+    def __init__(self, rate, burst=1):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """
+        토큰을 예약하고, 그 토큰을 쓸 수 있을 때까지 기다려야 하는 시간(초)을 반환합니다.
+        토큰이 모자라면 빚으로 예약하므로 먼저 요청한 쪽이 먼저 차례를 받습니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens=1):
+        """
+        토큰을 사용할 수 있을 때까지 현재 스레드를 대기시킵니다.
+
+        Returns:
+            float: 실제로 기다린 시간(초).
+        """
+        wait_time = self.reserve(tokens)
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """
+    성공/실패 결과에 따라 속도를 AIMD로 조절하는 토큰 버킷.
+
+    Args:
+        rate (float): 처음 속도 (초당 요청 수).
+        burst (int): 한꺼번에 보낼 수 있는 최대 요청 수.
+        min_rate (float): 최저 속도.
+        max_rate (float): 최고 속도.
+    """
+    def __init__(self, rate=INITIAL_RATE, burst=1, min_rate=MIN_RATE, max_rate=MAX_RATE):
+        super().__init__(rate, burst)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self._paused_until = 0.0
+        self._last_decrease = float('-inf')
+        self.successes = 0
+        self.throttles = 0
+
+    def reserve(self, tokens=1):
+        wait_time = super().reserve(tokens)
+        with self._lock:
+            # Retry-After로 멈춘 동안에는 그 시각까지 기다림
+            return max(wait_time, self._paused_until - time.monotonic())
+
+    def _set_rate(self, rate):
+        # 바뀌기 전까지 쌓인 토큰은 이전 속도로 계산
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self.rate = min(max(rate, self.min_rate), self.max_rate)
+
+    def on_success(self):
+        with self._lock:
+            self.successes += 1
+            # 요청마다 ADDITIVE_INCREASE / rate씩 올리면 1초에 약 ADDITIVE_INCREASE만큼 오름
+            self._set_rate(self.rate + ADDITIVE_INCREASE / self.rate)
+
+    def on_throttle(self, retry_after=None):
+        """
+        429/503 응답이나 타임아웃을 반영합니다.
+
+        Args:
+            retry_after (float): 서버가 알려준 대기 시간(초). 있으면 그동안 요청을 멈춥니다.
+        """
+        with self._lock:
+            self.throttles += 1
+            now = time.monotonic()
+            if now - self._last_decrease >= DECREASE_COOLDOWN:
+                self._last_decrease = now
+                self._set_rate(self.rate * DECREASE_FACTOR)
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+
+_limiters = {}
+_host_settings = {}
+_limiters_lock = threading.Lock()
+
+
+def configure_host(host, rate=INITIAL_RATE, burst=1, min_rate=MIN_RATE, max_rate=MAX_RATE):
+    """
+    호스트의 처음 속도와 상한을 정합니다. 이미 만들어진 제한기는 새 설정으로 바꿉니다.
+    """
+    with _limiters_lock:
+        _host_settings[host] = {'rate': rate, 'burst': burst, 'min_rate': min_rate, 'max_rate': max_rate}
+        _limiters.pop(host, None)
+
+
+def get_limiter(host):
+    """
+    호스트별 AdaptiveRateLimiter를 반환합니다. (프로세스 전체에서 공유)
+    """
+    with _limiters_lock:
+        if host not in _limiters:
+            _limiters[host] = AdaptiveRateLimiter(**_host_settings.get(host, {}))
+        return _limiters[host]
+
+
+def limiter_summary():
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return ' | '.join(
+        f"{host}: {limiter.rate:.1f} req/s (성공 {limiter.successes}회, 감속 {limiter.throttles}회)"
+        for host, limiter in sorted(limiters.items())
+    ) or '-'
+
+
+def backoff_delay(attempt):
+    """
+    attempt번째 재시도(0부터) 전에 기다릴 시간. 지수적으로 늘어나는 상한 안에서 무작위로 고릅니다. (full jitter)
+    """
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+
+def parse_retry_after(value):
+    """
+    Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 바꿉니다. 읽을 수 없으면 None.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
@@ -0,0 +1,279 @@
+"""
+수집한 레코드를 파일로 내보내는 싱크(sink).
+
+CsvSink는 레코드를 buffer_size개까지만 메모리에 두었다가 CSV에 쓰고 flush합니다. 리스트 필드는 기존 CSV와 같이 쉼표 문자열로 합칩니다.
+    - 수집 건수와 관계없이 메모리 사용량이 일정하고, 중간에 프로세스가 죽어도 마지막 buffer_size개 이하만 잃음
+
+ParquetSink는 레코드를 row_group_size개씩 모아 row group 단위로 바로 파일에 씁니다.
+    - 리스트 필드(techStacks, skill_tags 등)는 쉼표 문자열이 아닌 list<string> 타입으로 저장
+    - 회사명/지역처럼 값의 종류가 적은 컬럼은 dictionary 인코딩
+    - 분석 쪽에서는 pandas.read_parquet(path, columns=[...])로 필요한 컬럼만 읽을 수 있음
+
+    - 예외나 Ctrl+C로 멈춰도 with 블록을 빠져나가며 이미 받은 레코드까지 닫힌 파일로 저장 (강제 종료되면 파일 끝이 없어 읽을 수 없음)
+
+open_sink()는 파일 확장자(.csv/.parquet)에 맞는 싱크를 엽니다. ParquetSink를 쓰려면 pyarrow가 설치되어 있어야 합니다.
+"""
+import csv
+import json
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+# --- 변수 설정 ---
+ROW_GROUP_SIZE = 5000       # row group 하나에 담을 레코드 수
+CSV_BUFFER_SIZE = 100       # CSV에 쓰기 전에 메모리에 모아 두는 최대 레코드 수
+COMPRESSION = 'zstd'
+LIST_SEPARATOR = ', '       # CSV를 거쳐 문자열이 된 리스트 필드를 다시 나눌 때 사용하는 구분자
+
+
+def _is_missing(value):
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _as_list(value):
+    """
+    리스트 컬럼 값을 문자열 리스트로 만듭니다. 딕셔너리 항목은 JSON 문자열로 저장합니다.
+    """
+    if _is_missing(value):
+        return None
+    if isinstance(value, str):
+        return [item for item in value.split(LIST_SEPARATOR) if item] if value else []
+    if not isinstance(value, (list, tuple, set)):
+        value = [value]
+    return [json.dumps(item, ensure_ascii=False) if isinstance(item, dict) else str(item)
+            for item in value if item is not None]
+
+
+class CsvSink:
+    """
+    레코드를 스트리밍으로 CSV 파일에 기록합니다.
+
+    Args:
+        path (str): 저장할 파일 경로.
+        fieldnames (list): CSV 헤더. 여기에 없는 필드는 저장하지 않습니다.
+        list_columns (tuple): 쉼표 문자열로 합칠 리스트 컬럼.
+        buffer_size (int): 파일에 쓰기 전에 모아 두는 최대 레코드 수.
+    """
+    def __init__(self, path, fieldnames, list_columns=(), buffer_size=CSV_BUFFER_SIZE):
+        self.path = path
+        self.list_columns = set(list_columns)
+        self.buffer_size = max(buffer_size, 1)
+        self.rows_written = 0
+        self._buffer = []
+        self._file = open(path, 'w', encoding='utf-8-sig', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=fieldnames, extrasaction='ignore')
+        self._writer.writeheader()
+
+    def _flush(self):
+        if self._buffer:
+            self._writer.writerows(self._buffer)
+            self.rows_written += len(self._buffer)
+            self._buffer = []
+        self._file.flush()
+
+    def write(self, record):
+        row = dict(record)   # 원본 레코드는 바꾸지 않음
+        for column in self.list_columns:
+            if isinstance(row.get(column), (list, tuple)):
+                row[column] = LIST_SEPARATOR.join(str(item) for item in row[column] if item is not None)
+        self._buffer.append(row)
+        if len(self._buffer) >= self.buffer_size:
+            self._flush()
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def close(self):
+        if not self._file.closed:
+            self._flush()
+            self._file.close()
+            logger.info(f"✅ {self.rows_written}건을 '{self.path}' 파일에 저장했습니다.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _value_type(value, is_list_column):
+    import pyarrow as pa
+
+    if is_list_column:
+        return pa.list_(pa.string())
+    if _is_missing(value):
+        return None
+    if isinstance(value, bool):
+        return pa.bool_()
+    if isinstance(value, int):
+        return pa.int64()
+    if isinstance(value, float):
+        return pa.float64()
+    if isinstance(value, (list, tuple, set)):
+        return pa.list_(pa.string())
+    return pa.string()
+
+
+def _merge_types(current, new):
+    import pyarrow as pa
+
+    if current is None or current == new:
+        return new
+    if new is None:
+        return current
+    if {current, new} == {pa.int64(), pa.float64()}:
+        return pa.float64()
+    return pa.string()   # 숫자와 문자열처럼 섞인 컬럼은 문자열로 넓힘
+
+
+def infer_schema(records, list_columns=()):
+    """
+    레코드 전체를 한 번 훑어 Parquet 스키마를 만듭니다.
+    모든 레코드의 필드를 합치고(처음 나온 순서), 레코드마다 타입이 다르면 문자열로 넓힙니다.
+
+    Args:
+        records (iterable): 레코드. 제너레이터를 넘겨도 됩니다.
+        list_columns (tuple): list<string>으로 저장할 컬럼.
+
+    Returns:
+        pyarrow.Schema: 레코드가 없으면 None.
+    """
+    import pyarrow as pa
+
+    list_columns = set(list_columns)
+    types = {}
+    for record in records:
+        for column, value in record.items():
+            types[column] = _merge_types(types.get(column), _value_type(value, column in list_columns))
+    if not types:
+        return None
+    # 값이 모두 비어 있는 컬럼은 문자열로 저장
+    return pa.schema([pa.field(column, data_type or pa.string()) for column, data_type in types.items()])
+
+
+class ParquetSink:
+    """
+    레코드를 스트리밍으로 Parquet 파일에 기록합니다.
+
+    Args:
+        path (str): 저장할 파일 경로.
+        list_columns (tuple): list<string>으로 저장할 컬럼.
+        dictionary_columns (tuple): dictionary 인코딩할 컬럼.
+        schema (pyarrow.Schema): 지정하지 않으면 첫 row group으로 추론합니다. 레코드마다 필드가 다르거나
+            row group마다 값의 타입이 달라질 수 있으면 infer_schema()로 전체 레코드에서 만든 스키마를 넘기세요.
+        row_group_size (int): row group 하나에 담을 레코드 수.
+    """
+    def __init__(self, path, list_columns=(), dictionary_columns=(), schema=None, row_group_size=ROW_GROUP_SIZE):
+        import pyarrow  # noqa: F401  (설치되어 있지 않으면 여기서 바로 알 수 있도록)
+
+        self.path = path
+        self.list_columns = set(list_columns)
+        self.dictionary_columns = list(dictionary_columns)
+        self.schema = schema
+        self.row_group_size = row_group_size
+        self.rows_written = 0
+        self._buffer = []
+        self._writer = None
+
+    # --- 스키마 ---
+    def _infer_schema(self, rows):
+        return infer_schema(rows, self.list_columns)
+
+    def _column_array(self, field, rows):
+        import pyarrow as pa
+
+        if field.name in self.list_columns:
+            return pa.array([_as_list(row.get(field.name)) for row in rows], type=field.type)
+
+        values = [row.get(field.name) for row in rows]
+        if pa.types.is_string(field.type):
+            values = [None if _is_missing(value) else str(value) for value in values]
+            return pa.array(values, type=field.type)
+        try:
+            return pa.array(values, type=field.type, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # 숫자 컬럼의 빈 문자열은 결측값으로 처리
+            values = [None if value == '' else value for value in values]
+            return pa.array(values, type=field.type, from_pandas=True)
+
+    # --- 기록 ---
+    def _flush(self):
+        if not self._buffer:
+            return
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self.schema is None:
+            self.schema = self._infer_schema(self._buffer)
+
+        known = set(self.schema.names)
+        unknown = {key for row in self._buffer for key in row} - known
+        if unknown:
+            logger.warning(f"⚠️ 스키마에 없는 컬럼은 저장하지 않습니다: {', '.join(sorted(unknown))}")
+
+        table = pa.Table.from_arrays([self._column_array(field, self._buffer) for field in self.schema],
+                                     schema=self.schema)
+        if self._writer is None:
+            dictionary_columns = [column for column in self.dictionary_columns if column in known]
+            self._writer = pq.ParquetWriter(self.path, self.schema, compression=COMPRESSION,
+                                            use_dictionary=dictionary_columns or False)
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        self.rows_written += len(self._buffer)
+        self._buffer = []
+
+    def write(self, record):
+        self._buffer.append(record)
+        if len(self._buffer) >= self.row_group_size:
+            self._flush()
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def close(self):
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            logger.info(f"✅ {self.rows_written}건을 '{self.path}' 파일에 Parquet으로 저장했습니다.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def write_parquet(records, path, list_columns=(), dictionary_columns=(), row_group_size=ROW_GROUP_SIZE):
+    """
+    레코드를 Parquet 파일로 저장합니다.
+
+    Returns:
+        int: 저장한 레코드 수.
+    """
+    with ParquetSink(path, list_columns, dictionary_columns, row_group_size=row_group_size) as sink:
+        sink.write_many(records)
+    return sink.rows_written
+
+
+def open_sink(path, fieldnames=None, list_columns=(), dictionary_columns=()):
+    """
+    파일 확장자에 맞는 싱크를 엽니다. .parquet이면 ParquetSink, 그 외에는 CsvSink를 사용합니다.
+
+    Args:
+        path (str): 저장할 파일 경로.
+        fieldnames (list): CSV 헤더. CSV로 저장할 때는 반드시 지정해야 합니다.
+        list_columns (tuple): 리스트 컬럼.
+        dictionary_columns (tuple): dictionary 인코딩할 컬럼 (Parquet만 해당).
+
+    Returns:
+        CsvSink | ParquetSink: with 문으로 사용할 수 있는 싱크.
+    """
+    if path.endswith('.parquet'):
+        return ParquetSink(path, list_columns, dictionary_columns)
+    if fieldnames is None:
+        raise ValueError("CSV로 저장하려면 fieldnames를 지정해야 합니다.")
+    return CsvSink(path, fieldnames, list_columns)
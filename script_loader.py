@@ -0,0 +1,38 @@
+"""
+번호가 붙은 스크립트('01. jumpit_basic_data.py' 등)를 모듈로 불러옵니다.
+
+파일 이름에 공백과 점이 있어 import 문으로는 불러올 수 없으므로 importlib로 직접 로드합니다.
+각 스크립트의 실행 코드는 `if __name__ == '__main__':` 아래에 있으므로 불러와도 크롤링이 시작되지 않습니다.
+"""
+import importlib.util
+import os
+import re
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_script(filename):
+    """
+    스크립트 파일을 모듈로 불러옵니다. 같은 파일은 한 번만 로드합니다.
+
+    Args:
+        filename (str): 저장소 루트 기준 파일 이름 (예: '02. jumpit_detail_data.py').
+
+    Returns:
+        module: 로드된 모듈.
+    """
+    # '02. jumpit_detail_data.py' -> 'jumpit_detail_data'
+    module_name = re.sub(r'^\d+\.\s*', '', os.path.splitext(os.path.basename(filename))[0])
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(ROOT_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
@@ -0,0 +1,56 @@
+"""
+crawl_state의 지문(fingerprint)이 레코드를 어떤 경로로 읽었는지와 관계없이 같은지 확인합니다.
+"""
+import os
+import sys
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from crawl_state import CrawlStateStore, fingerprint
+from record_sinks import CsvSink
+
+COLUMNS = ['id', 'companyName', 'title', 'jobCategory', 'techStacks', 'minCareer', 'maxCareer', 'locations', 'closedAt']
+LIST_COLUMNS = ('techStacks', 'locations')
+
+# 01의 parse_position이 만드는 API 레코드 (빈 값은 None, 리스트는 리스트)
+API_RECORDS = [
+    {'id': 101, 'companyName': '점핏', 'title': '백엔드 개발자', 'jobCategory': '서버/백엔드 개발자',
+     'techStacks': ['Python', 'Django'], 'minCareer': 3, 'maxCareer': 7, 'locations': ['서울 강남구'],
+     'closedAt': '2025-12-31T23:59:59'},
+    {'id': 102, 'companyName': '점핏', 'title': '데이터 엔지니어', 'jobCategory': None,
+     'techStacks': [], 'minCareer': None, 'maxCareer': 10, 'locations': ['서울 마포구', '경기 성남시'],
+     'closedAt': None},
+]
+
+
+def read_back_csv(records, tmp_path):
+    # 일괄 처리 모드처럼 CSV에 저장했다가 pandas로 다시 읽음 (빈 칸은 NaN, 리스트는 쉼표 문자열)
+    path = str(tmp_path / 'basic.csv')
+    with CsvSink(path, COLUMNS, LIST_COLUMNS) as sink:
+        sink.write_many(records)
+    return pd.read_csv(path).to_dict('records')
+
+
+def test_csv_row_and_api_record_have_same_fingerprint(tmp_path):
+    csv_rows = read_back_csv(API_RECORDS, tmp_path)
+    assert [fingerprint(row) for row in csv_rows] == [fingerprint(record) for record in API_RECORDS]
+
+
+def test_changed_record_has_different_fingerprint():
+    changed = dict(API_RECORDS[0], closedAt='2026-01-31T23:59:59')
+    assert fingerprint(changed) != fingerprint(API_RECORDS[0])
+
+
+def test_detail_carried_over_between_modes(tmp_path):
+    # 파이프라인 모드(API 레코드)에서 저장한 상세 데이터를 일괄 처리 모드(CSV 레코드)에서 그대로 이어 붙임
+    with CrawlStateStore(str(tmp_path / 'state.db')) as store:
+        to_fetch, _ = store.plan('jumpit', [dict(record) for record in API_RECORDS], closed_key='closedAt')
+        for record in to_fetch:
+            store.save_detail('jumpit', record['id'], {'주요업무': f"업무 {record['id']}"})
+
+        to_fetch, carried = store.plan('jumpit', read_back_csv(API_RECORDS, tmp_path), closed_key='closedAt')
+    assert to_fetch == []
+    assert [record['주요업무'] for record in carried] == ['업무 101', '업무 102']
@@ -0,0 +1,58 @@
+"""
+07의 LSH 중복 판별(find_duplicate_clusters) 테스트.
+"""
+import os
+import sys
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from script_loader import load_script
+
+dedupe = load_script('07. dedupe_postings.py')
+
+ROWS = dedupe.NUM_PERM // dedupe.BANDS
+
+
+def anchor_layout():
+    """
+    세 공고가 첫 번째 밴드에서만 같은 버킷에 들어가는 서명을 만듭니다.
+    기준(0번)은 1, 2번과 유사도가 낮고, 1번과 2번은 밴드마다 절반씩 값이 같아 유사도가 임계값을 넘지만
+    다른 밴드에서는 같은 버킷에 들어가지 않습니다.
+    """
+    rng = np.random.default_rng(0)
+    signatures = rng.integers(0, 1 << 32, size=(3, dedupe.NUM_PERM), dtype=np.uint64)
+    signatures[:, :ROWS] = signatures[0, :ROWS]
+    for band in range(1, dedupe.BANDS):
+        start = band * ROWS
+        signatures[2, start:start + ROWS // 2] = signatures[1, start:start + ROWS // 2]
+    return signatures
+
+
+def test_layout_is_anchor_b_c():
+    signatures = anchor_layout()
+    threshold = dedupe.SIMILARITY_THRESHOLD
+    assert dedupe.estimate_similarity(signatures[0], signatures[1]) < threshold
+    assert dedupe.estimate_similarity(signatures[0], signatures[2]) < threshold
+    assert dedupe.estimate_similarity(signatures[1], signatures[2]) >= threshold
+
+
+def test_members_similar_to_each_other_but_not_anchor_are_clustered():
+    clusters, _ = dedupe.find_duplicate_clusters(anchor_layout())
+    assert clusters == [[1, 2]]
+
+
+def test_large_bucket_reanchors(monkeypatch):
+    # 모든 쌍을 비교하지 않는 큰 버킷에서도 기준을 바꿔 가며 1, 2번을 묶음
+    monkeypatch.setattr(dedupe, 'PAIRWISE_BUCKET_SIZE', 2)
+    clusters, _ = dedupe.find_duplicate_clusters(anchor_layout())
+    assert clusters == [[1, 2]]
+
+
+def test_empty_postings_are_not_clustered():
+    empty = dedupe.minhash_signature(set())
+    posting = dedupe.minhash_signature(dedupe.shingles('백엔드 개발자 채용'))
+    clusters, _ = dedupe.find_duplicate_clusters(np.vstack([empty, empty, empty, posting, posting]))
+    assert clusters == [[3, 4]]
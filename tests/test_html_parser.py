@@ -0,0 +1,74 @@
+"""
+html_parser의 selectolax 어댑터가 추출 함수에서 쓰는 BeautifulSoup 문법을 같은 결과로 처리하는지 확인합니다.
+"""
+import os
+import re
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import html_parser
+from html_parser import parse_html
+
+pytestmark = pytest.mark.skipif('selectolax' not in html_parser.available_backends(),
+                                reason="selectolax 백엔드가 설치되어 있지 않습니다.")
+
+HTML = """
+<html><body>
+  <div class="job position_info" id="main">
+    <h1>백엔드 <b>개발자</b></h1>
+    <dl><dt>경력</dt><dd>3년 이상</dd><dt>학력</dt><dd>무관</dd></dl>
+    <ul><li class="tag">Python</li><li class="tag hot">Go</li></ul>
+    <a href="/position/1" data-id="1">상세</a>
+    <script>var x = "숨김";</script>
+    <!-- 주석 -->
+  </div>
+  <p class="etc"><span class="cell">서울</span> <span class="cell">정규직</span></p>
+</body></html>
+"""
+
+
+def both(html=HTML):
+    return parse_html(html, 'html.parser'), parse_html(html, 'selectolax')
+
+
+def test_find_by_class_and_id():
+    for soup in both():
+        assert soup.find('div', class_='position_info')['id'] == 'main'
+        assert soup.find('div', id='main').get('class') == ['job', 'position_info']
+        assert soup.find('div', 'job').name == 'div'   # attrs 자리의 문자열은 클래스
+        assert soup.find('div', class_='missing') is None
+
+
+def test_find_all_with_multi_class_and_regex():
+    expected, actual = both()
+    assert [li.text for li in actual.find_all('li', class_='tag')] == [li.text for li in expected.find_all('li', class_='tag')]
+    assert [li.text for li in actual.find_all('li', class_='tag hot')] == ['Go']
+    pattern = re.compile(r'^/position/')
+    assert actual.find('a', href=pattern)['data-id'] == expected.find('a', href=pattern)['data-id']
+    assert len(actual.find_all('a', attrs={'data-id': True})) == 1
+
+
+def test_sibling_and_child_attribute_access():
+    expected, actual = both()
+    for soup in (expected, actual):
+        assert soup.find('dt').find_next_sibling('dd').get_text(strip=True) == '3년 이상'
+        assert soup.find('p', class_='etc').span.text == '서울'
+
+
+def test_select_and_text_excludes_script():
+    expected, actual = both()
+    assert actual.select_one('div.position_info h1').get_text(strip=True) == '백엔드개발자'
+    assert actual.select_one('h1').get_text(' ', strip=True) == expected.select_one('h1').get_text(' ', strip=True)
+    assert [span.text for span in actual.select('span.cell')] == ['서울', '정규직']
+    assert actual.select_one('div.nothing') is None
+    assert list(actual.find('div').stripped_strings) == list(expected.find('div').stripped_strings)
+    assert '숨김' not in actual.find('div').get_text()
+
+
+def test_set_default_backend_rejects_unknown():
+    with pytest.raises(ValueError):
+        html_parser.set_default_backend('html5lib')
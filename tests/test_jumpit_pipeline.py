@@ -0,0 +1,74 @@
+"""
+02의 파이프라인 모드(run_pipeline) 테스트.
+
+목록 수집과 상세 수집은 가짜 함수로 바꿔 네트워크 없이 실행합니다.
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from script_loader import load_script
+
+jumpit = load_script('02. jumpit_detail_data.py')
+basic = load_script('01. jumpit_basic_data.py')
+
+POSTING_COUNT = 200
+PAGE_SIZE = 20
+
+
+def patch_pipeline(monkeypatch, failing_from=None):
+    def iter_positions(client):
+        for job_id in range(1, POSTING_COUNT + 1):
+            if job_id % PAGE_SIZE == 0:
+                time.sleep(0.1)   # 다음 목록 페이지 요청
+            yield {'id': job_id, 'title': f'공고 {job_id}'}
+
+    async def fetch_detail_async(client, job_id, global_limit, host_budgets):
+        await asyncio.sleep(0.001)
+        # 헤더에 없는 필드를 돌려주면 merge_detail이 ValueError를 냄
+        if failing_from and job_id >= failing_from:
+            return {'알 수 없는 필드': job_id}
+        return {'주요업무': f'업무 {job_id}'}
+
+    monkeypatch.setattr(basic, 'iter_positions', iter_positions)
+    monkeypatch.setattr(jumpit, 'fetch_detail_async', fetch_detail_async)
+    monkeypatch.setattr(jumpit, 'INCREMENTAL', False)
+    monkeypatch.setattr(jumpit, 'PIPELINE_QUEUE_SIZE', 4)
+    monkeypatch.setattr(jumpit, 'PIPELINE_PUT_TIMEOUT', 0.05)
+
+
+def run_with_timeout(coroutine_factory, timeout=15):
+    # 파이프라인이 멈추면 테스트 전체가 걸리지 않도록 별도 스레드에서 실행
+    result = {}
+
+    def target():
+        try:
+            result['value'] = asyncio.run(coroutine_factory())
+        except BaseException as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "run_pipeline이 끝나지 않았습니다."
+    return result
+
+
+def test_pipeline_writes_every_posting(monkeypatch, tmp_path):
+    patch_pipeline(monkeypatch)
+    result = run_with_timeout(lambda: jumpit.run_pipeline(str(tmp_path / 'out.csv')))
+    assert 'error' not in result
+    assert result['value']['saved'] == POSTING_COUNT
+
+
+def test_worker_failure_stops_pipeline(monkeypatch, tmp_path):
+    # 작업자가 모두 실패해도 목록 스레드가 가득 찬 큐 앞에서 멈춰 있지 않고 예외가 그대로 올라와야 함
+    patch_pipeline(monkeypatch, failing_from=10)
+    result = run_with_timeout(lambda: jumpit.run_pipeline(str(tmp_path / 'out.csv')))
+    assert isinstance(result.get('error'), ValueError)
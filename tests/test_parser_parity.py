@@ -0,0 +1,98 @@
+"""
+HTML 파서 백엔드 parity 테스트.
+
+benchmarks/fixtures에 저장해 둔 페이지로 각 추출 함수를 html.parser, lxml, selectolax에서 실행해
+결과가 html.parser와 같은지 확인합니다. 설치되지 않은 백엔드는 건너뜁니다.
+06의 snapshot 추출(element_text 등)은 BeautifulSoup 노드 타입을 직접 다루므로 lxml만 비교합니다. (SNAPSHOT_BACKEND 참고)
+"""
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import html_parser
+from html_parser import parse_html
+from script_loader import load_script
+
+FIXTURES_DIR = os.path.join(ROOT_DIR, 'benchmarks', 'fixtures')
+OTHER_BACKENDS = ('lxml', 'selectolax')
+SOUP_BACKENDS = ('lxml',)
+
+JOBKOREA_SECTIONS = (
+    'scrape_job_title', 'scrape_company_name', 'scrape_recruitment_guidelines_section',
+    'scrape_qualification_section', 'scrape_application_section', 'scrape_company_section',
+)
+
+
+def read_fixture(*parts):
+    with open(os.path.join(FIXTURES_DIR, *parts), encoding='utf-8') as f:
+        return f.read()
+
+
+def build_extractors():
+    """
+    (이름, fixture 경로, 추출 함수(html, backend), 비교할 백엔드) 목록을 만듭니다.
+    """
+    import jobkorea_detail
+
+    jumpit = load_script('02. jumpit_detail_data.py')
+    jobkorea_list = load_script('04. jobkorea_basic_data.py')
+    gamejob = load_script('06. gamejob_detail_data.py')
+
+    def gamejob_iframe_text(html, backend):
+        soup = parse_html(html, backend)
+        return gamejob.element_text(soup.body or soup)
+
+    def gamejob_outline(html, backend):
+        soup = parse_html(html, backend)
+        details = gamejob.scrape_dates_from_soup(soup)
+        details.update(gamejob.scrape_gib_outline_from_soup(soup))
+        return details
+
+    extractors = [
+        ('jumpit/parse_detail_page', ('jumpit', 'position_detail.html'),
+         lambda html, backend: jumpit.parse_detail_page(html, backend), OTHER_BACKENDS),
+        ('jobkorea/parse_job_details', ('jobkorea', 'gi_read.html'), jobkorea_detail.parse_job_details,
+         OTHER_BACKENDS),
+    ]
+    for name in JOBKOREA_SECTIONS:
+        extract = getattr(jobkorea_detail, name)
+        extractors.append((f'jobkorea/{name}', ('jobkorea', 'gi_read.html'),
+                           lambda html, backend, extract=extract: extract(parse_html(html, backend)), OTHER_BACKENDS))
+    extractors += [
+        ('jobkorea_list/parse_job_rows', ('jobkorea_list', 'list_page.html'),
+         lambda html, backend: jobkorea_list.parse_job_rows(parse_html(html, backend)), OTHER_BACKENDS),
+        ('gamejob/gib_outline', ('gamejob', 'gi_read.html'), gamejob_outline, SOUP_BACKENDS),
+        ('gamejob/iframe_text[GI_Work_Content]', ('gamejob', 'gi_work_content.html'), gamejob_iframe_text,
+         SOUP_BACKENDS),
+        ('gamejob/iframe_text[GI_Comment]', ('gamejob', 'gi_comment.html'), gamejob_iframe_text, SOUP_BACKENDS),
+    ]
+    return extractors
+
+
+EXTRACTORS = build_extractors()
+PARITY_CASES = [(name, fixture, extract, backend)
+                for name, fixture, extract, backends in EXTRACTORS for backend in backends]
+
+
+@pytest.mark.parametrize('name, fixture, extract, backend', PARITY_CASES,
+                         ids=[f'{name}-{backend}' for name, _, _, backend in PARITY_CASES])
+def test_backend_matches_html_parser(name, fixture, extract, backend):
+    if backend not in html_parser.available_backends():
+        pytest.skip(f"{backend} 백엔드가 설치되어 있지 않습니다.")
+
+    html = read_fixture(*fixture)
+    expected = extract(html, 'html.parser')
+    assert expected, f"{name}: html.parser 결과가 비어 있습니다. fixture를 확인하세요."
+    assert extract(html, backend) == expected
+
+
+def test_jumpit_detail_fields_fit_output_header():
+    # 출력 CsvSink는 헤더에 없는 키를 버리므로, parse_detail_page의 필드가 모두 헤더에 있어야 함
+    jumpit = load_script('02. jumpit_detail_data.py')
+    detailed_info = jumpit.parse_detail_page(read_fixture('jumpit', 'position_detail.html'))
+    assert set(detailed_info) <= set(jumpit.DETAIL_COLUMNS)
+    assert set(jumpit.DETAIL_FIELDS) <= set(detailed_info)
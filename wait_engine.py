@@ -0,0 +1,110 @@
+"""
+Selenium 대기 함수 모음.
+
+고정된 time.sleep 대신 필요한 DOM 상태가 되는 즉시 반환합니다. 모든 대기에는 최대 시간(ceiling)이 있습니다.
+    - wait_for_selector / wait_for_all: 요소가 나타날 때까지 (시간 초과 시 TimeoutException)
+    - wait_for_network_idle: 새 리소스 요청이 idle_ms 동안 없을 때까지 (시간 초과 시 False 반환)
+    - wait_for_dom_stable: DOM 변경(MutationObserver)이 quiet_ms 동안 없을 때까지 (시간 초과 시 False 반환)
+
+요청 간격(예의상 지연)은 여기서 다루지 않고 rate_limiter.TokenBucket으로 따로 제한합니다.
+"""
+import logging
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+# --- 변수 설정 ---
+DEFAULT_TIMEOUT = 10       # 요소 대기 최대 시간(초)
+POLL_INTERVAL = 0.1        # 상태 확인 간격(초)
+NETWORK_IDLE_MS = 500      # 이 시간 동안 새 요청이 없으면 네트워크가 멈춘 것으로 판단
+DOM_QUIET_MS = 300         # 이 시간 동안 DOM 변경이 없으면 렌더링이 끝난 것으로 판단
+
+_RESOURCE_COUNT_SCRIPT = """
+return [document.readyState, performance.getEntriesByType('resource').length];
+"""
+
+# 문서마다 한 번만 MutationObserver를 설치하고, 마지막 변경 후 지난 시간(ms)을 반환
+_DOM_QUIET_SCRIPT = """
+if (!window.__waitEngineObserver) {
+    window.__waitEngineLastMutation = performance.now();
+    window.__waitEngineObserver = new MutationObserver(() => { window.__waitEngineLastMutation = performance.now(); });
+    window.__waitEngineObserver.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+return [document.readyState, performance.now() - window.__waitEngineLastMutation];
+"""
+
+
+def wait_for_selector(driver, selector, by=By.CSS_SELECTOR, timeout=DEFAULT_TIMEOUT, clickable=False):
+    """
+    요소가 나타날 때까지(clickable이면 클릭할 수 있을 때까지) 기다렸다가 반환합니다.
+
+    Raises:
+        TimeoutException: timeout 안에 요소가 나타나지 않은 경우.
+    """
+    condition = EC.element_to_be_clickable if clickable else EC.presence_of_element_located
+    return WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(condition((by, selector)))
+
+
+def wait_for_all(driver, locators, timeout=DEFAULT_TIMEOUT):
+    """
+    여러 요소가 모두 나타날 때까지 하나의 timeout 안에서 기다립니다.
+
+    Args:
+        locators (list): (By, selector) 목록.
+
+    Raises:
+        TimeoutException: timeout 안에 모든 요소가 나타나지 않은 경우.
+    """
+    def all_present(driver):
+        return all(driver.find_elements(by, selector) for by, selector in locators)
+
+    return WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(all_present)
+
+
+def _poll(condition, timeout, name):
+    deadline = time.monotonic() + timeout
+    while True:
+        if condition():
+            return True
+        if time.monotonic() >= deadline:
+            logger.debug(f"{name} 대기가 {timeout}초 제한에 도달했습니다.")
+            return False
+        time.sleep(POLL_INTERVAL)
+
+
+def wait_for_network_idle(driver, idle_ms=NETWORK_IDLE_MS, timeout=DEFAULT_TIMEOUT):
+    """
+    idle_ms 동안 새 리소스 요청이 없을 때까지 기다립니다.
+
+    Returns:
+        bool: 제한 시간 안에 조용해졌으면 True, 제한 시간에 도달했으면 False.
+    """
+    last = {'count': None, 'since': time.monotonic()}
+
+    def is_idle():
+        ready_state, count = driver.execute_script(_RESOURCE_COUNT_SCRIPT)
+        now = time.monotonic()
+        if count != last['count']:
+            # 리소스 수가 바뀌면 다시 시간을 잰다
+            last['count'], last['since'] = count, now
+        return ready_state != 'loading' and (now - last['since']) * 1000 >= idle_ms
+
+    return _poll(is_idle, timeout, '네트워크 idle')
+
+
+def wait_for_dom_stable(driver, quiet_ms=DOM_QUIET_MS, timeout=DEFAULT_TIMEOUT):
+    """
+    quiet_ms 동안 DOM 변경이 없을 때까지 기다립니다.
+
+    Returns:
+        bool: 제한 시간 안에 안정됐으면 True, 제한 시간에 도달했으면 False.
+    """
+    def is_stable():
+        ready_state, quiet_for_ms = driver.execute_script(_DOM_QUIET_SCRIPT)
+        return ready_state != 'loading' and quiet_for_ms >= quiet_ms
+
+    return _poll(is_stable, timeout, 'DOM 안정화')
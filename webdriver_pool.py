@@ -0,0 +1,147 @@
+"""
+재사용 가능한 WebDriver 풀.
+
+URL마다 Chrome을 새로 띄우지 않고, 오래 살아 있는 드라이버 몇 개를 빌려 쓰고 돌려받습니다.
+빌려줄 때 상태 확인(health check)을 하고, 일정 횟수 이상 사용한 드라이버는 새로 교체합니다.
+"""
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+# --- 변수 설정 ---
+POOL_SIZE = 3                 # 동시에 띄워 둘 드라이버 수
+MAX_USES_PER_DRIVER = 200     # 이 횟수만큼 사용한 드라이버는 종료하고 새로 만듦 (메모리 누수 방지)
+HEALTH_CHECK = True           # 빌려주기 전에 드라이버가 응답하는지 확인
+CHECKOUT_TIMEOUT = 300        # 드라이버를 빌리기 위해 기다리는 최대 시간(초)
+
+
+class WebDriverPool:
+    """
+    WebDriver 풀.
+
+    Args:
+        factory (callable): 새 드라이버를 만드는 함수.
+        size (int): 최대 드라이버 수.
+        max_uses (int): 드라이버 하나를 재사용할 최대 횟수.
+        health_check (bool): 빌려주기 전에 상태를 확인할지 여부.
+        checkout_timeout (float): 드라이버를 기다리는 최대 시간(초).
+    """
+    def __init__(self, factory, size=POOL_SIZE, max_uses=MAX_USES_PER_DRIVER,
+                 health_check=HEALTH_CHECK, checkout_timeout=CHECKOUT_TIMEOUT):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.health_check = health_check
+        self.checkout_timeout = checkout_timeout
+
+        self._idle = queue.LifoQueue()   # 최근에 쓴 드라이버부터 다시 사용 (캐시가 따뜻함)
+        self._uses = {}                  # 드라이버별 사용 횟수
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+
+    # --- 드라이버 생성/폐기 ---
+    def _create(self):
+        driver = self.factory()
+        with self._lock:
+            self._uses[id(driver)] = 0
+        logger.info(f"✅ 새 WebDriver 생성 (현재 {self._created}/{self.size}개)")
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            self._created -= 1
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"⚠️ WebDriver 종료 중 오류 발생: {e}")
+
+    def _is_healthy(self, driver):
+        try:
+            driver.execute_script('return 1')
+            return True
+        except WebDriverException as e:
+            logger.warning(f"⚠️ 응답하지 않는 WebDriver를 교체합니다: {e}")
+            return False
+
+    def _acquire(self):
+        if self._closed:
+            raise RuntimeError("이미 닫힌 WebDriver 풀입니다.")
+
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                try:
+                    return self._create()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            driver = self._idle.get(timeout=self.checkout_timeout)
+
+        if self.health_check and not self._is_healthy(driver):
+            self._discard(driver)
+            with self._lock:
+                self._created += 1
+            try:
+                return self._create()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        return driver
+
+    def _release(self, driver, broken=False):
+        with self._lock:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+
+        if broken or self._closed or uses >= self.max_uses:
+            self._discard(driver)
+        else:
+            self._idle.put(driver)
+
+    @contextmanager
+    def checkout(self):
+        """
+        드라이버를 하나 빌려줍니다. with 블록이 끝나면 자동으로 풀에 돌려줍니다.
+        블록 안에서 WebDriverException이 발생하면 그 드라이버는 폐기합니다.
+        """
+        driver = self._acquire()
+        broken = False
+        try:
+            yield driver
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self._release(driver, broken)
+
+    def close(self):
+        """
+        풀에 있는 모든 드라이버를 종료합니다.
+        """
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()